@@ -7,6 +7,7 @@ from dotenv import load_dotenv
 # Import task and email-related tools
 from task_manager.task_manager_functions import (
     create_task,
+    create_tasks,
     update_task_status,
     get_tasks_by_status,
     send_reminders,
@@ -15,11 +16,17 @@ from task_manager.task_manager_functions import (
     generate_daily_report,
     update_task_priority,
     update_task_due_date,
+    update_task,
     get_task_details,
-    get_overdue_tasks
+    get_overdue_tasks,
+    get_upcoming_tasks
 )
 
 from email_manager.emailTools import extract_meeting_info
+from email_manager.batch_pipeline import run_pipeline
+from email_manager.dedup import DEDUP_CONFIG, get_index
+from email_manager.preprocess import split_headers
+from metrics import registry, start_exporters
 
 class UnifiedTaskAgent:
     def __init__(self, token: str, model_name: str = "Qwen/Qwen2.5-Coder-32B-Instruct"):
@@ -37,6 +44,7 @@ class UnifiedTaskAgent:
 
         self.tools = [
             create_task,
+            create_tasks,
             update_task_status,
             get_tasks_by_status,
             send_reminders,
@@ -45,8 +53,10 @@ class UnifiedTaskAgent:
             generate_daily_report,
             update_task_priority,
             update_task_due_date,
+            update_task,
             get_task_details,
             get_overdue_tasks,
+            get_upcoming_tasks,
             extract_meeting_info,
         ]
 
@@ -74,22 +84,55 @@ class UnifiedTaskAgent:
     def process_email(self, email_content: str) -> Dict[str, Any]:
         """
         Extracts meeting information from emails and creates tasks automatically using SmolAgents.
+        Copies of an email already processed (same Message-ID, a forward, a
+        reply-all with nothing new) return the earlier result without an
+        LLM call or a new task.
         """
         category = "Meeting Schedule"
-        extracted_info = extract_meeting_info(email_content)
-
-        if extracted_info  and extracted_info.get("status") == "success":
-            meeting_info = extracted_info.get("meeting_info", {})
-            task_description = f"Meeting: {meeting_info.get('title', 'No Title')}"
-            due_date = meeting_info.get('date', self.current_time)
-            assignee = self.current_user
-            priority = meeting_info.get('sentiment_score', 'Normal')
+        dedup_key = None
+        if DEDUP_CONFIG["enabled"]:
+            headers, body = split_headers(email_content)
+            dedup_key, duplicate = get_index().claim(
+                body, headers.get("message-id"), headers.get("in-reply-to"), headers.get("references"), headers.get("subject")
+            )
+            if duplicate is not None and duplicate["duplicate_of"] == dedup_key and duplicate["result"] is None:
+                # Claimed by a call that failed before storing its result
+                duplicate = None
+            if duplicate is not None:
+                return {
+                    "category": category,
+                    "duplicate_of": duplicate["duplicate_of"],
+                    "reason": duplicate["reason"],
+                    "extracted_info": duplicate["result"]
+                }
+
+        try:
+            extracted_info = extract_meeting_info(email_content)
+
+            if extracted_info  and extracted_info.get("status") == "success":
+                meeting_info = extracted_info.get("meeting_info", {})
+                task_description = f"Meeting: {meeting_info.get('title', 'No Title')}"
+                due_date = meeting_info.get('date', self.current_time)
+                assignee = self.current_user
+                priority = meeting_info.get('sentiment_score', 'Normal')
             
-            # Use the agent to create a task
-            task_query = f"Create a task called '{task_description}' assigned to '{assignee}' due '{due_date}' with priority '{priority}'."
-            response = self.agent.run(task_query)
+                # Use the agent to create a task
+                task_query = f"Create a task called '{task_description}' assigned to '{assignee}' due '{due_date}' with priority '{priority}'."
+                response = self.agent.run(task_query)
             
-            extracted_info["task_created"] = response
+                extracted_info["task_created"] = response
+        except Exception:
+            if dedup_key is not None:
+                # Let a later copy try again
+                get_index().release(dedup_key)
+            raise
+
+        if dedup_key is not None:
+            if extracted_info and extracted_info.get("status") == "success":
+                get_index().set_result(dedup_key, extracted_info)
+            else:
+                # Let a later copy try again
+                get_index().release(dedup_key)
 
         return {"category": category, "extracted_info": extracted_info}
 
@@ -106,8 +149,10 @@ def display_help():
     print("6. Overdue Tasks: 'show overdue tasks'")
     print("7. Send Reminders: 'send task reminders'")
     print("8. Process Email: 'process email [email content]'")
-    print("9. Help: 'help'")
-    print("10. Exit: 'exit'")
+    print("9. Process Mailbox: 'process mailbox [mbox file or Maildir]'")
+    print("10. Call Metrics: 'metrics'")
+    print("11. Help: 'help'")
+    print("12. Exit: 'exit'")
     print("-" * 50)
 
 
@@ -119,6 +164,7 @@ def main():
         return
 
     agent = UnifiedTaskAgent(token=hf_token)
+    start_exporters()
 
     print("\n=== Unified Task & Email Processing Assistant ===")
     print("Current User:", agent.current_user)
@@ -130,6 +176,7 @@ def main():
             user_input = input("\nHow can I assist? ").strip()
 
             if user_input.lower() in ['exit', 'quit', 'bye']:
+                print(registry.summary())
                 print("Goodbye!")
                 break
             
@@ -137,7 +184,14 @@ def main():
                 display_help()
                 continue
 
-            if user_input.lower().startswith("process email"):
+            if user_input.lower() == 'metrics':
+                print(registry.summary())
+                continue
+
+            if user_input.lower().startswith("process mailbox"):
+                source = user_input[len("process mailbox"):].strip()
+                response = run_pipeline(source, "email_results.jsonl")
+            elif user_input.lower().startswith("process email"):
                 email_content = user_input.replace("process email", "").strip()
                 response = agent.process_email(email_content)
             else:
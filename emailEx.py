@@ -4,6 +4,9 @@ from pydantic import BaseModel, Field
 from groq import Groq
 import instructor
 from smolagents import Tool, HfApiModel, ToolCallingAgent
+from metrics import groq_http_client
+from llm_cache import cached_client
+from email_manager.preprocess import preprocess_email
 
 # Set up the Groq API key
 os.environ["GROQ_API_KEY"] = os.environ["GROQ_API_KEY"]
@@ -16,7 +19,7 @@ class MeetingInfoResponseModel(BaseModel):
     sentiment_score: int = Field(description="Importance score of the meeting on a scale of 0-10")
 
 # Patch Groq() with the instructor client
-client = instructor.from_groq(Groq(), mode=instructor.Mode.JSON)
+client = cached_client(instructor.from_groq(Groq(http_client=groq_http_client()), mode=instructor.Mode.JSON))
 
 def extract_meeting_info(email_content: str) -> dict:
     """
@@ -26,6 +29,7 @@ def extract_meeting_info(email_content: str) -> dict:
     Returns:
         dict: Dictionary containing date, time, and sentiment score.
     """
+    email_content = preprocess_email(email_content)
     query = (
         "Extract the meeting date, time,title, and its importance sentiment score (0-10) from the given email. "
         "Return only a JSON object with 'date', 'time','title, and 'sentiment_score'. "
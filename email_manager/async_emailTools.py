@@ -0,0 +1,204 @@
+import asyncio
+import os
+import weakref
+from typing import Dict, Any, Optional, List
+from datetime import datetime
+from groq import AsyncGroq
+import instructor
+from metrics import instrument_tool, async_groq_http_client
+from llm_cache import cached_async_client
+from email_manager.date_normalizer import resolve_meeting_time
+from email_manager.preprocess import preprocess_email
+from email_manager.model_router import model_router
+from email_manager.pre_classifier import VALID_CATEGORIES
+from email_manager.emailTools import (
+    COMBINED_EXTRACTION,
+    _accept_classification,
+    _meeting_request,
+    _meeting_details,
+    _task_request,
+    _classification_request,
+    _rule_classification,
+    _pre_classify,
+    _analysis_request,
+    _combined_details
+)
+
+# Requests in flight to Groq at once, across every coroutine in the process
+GROQ_MAX_CONCURRENCY = int(os.getenv("GROQ_MAX_CONCURRENCY", "8"))
+
+# Shared async Groq client; every coroutine below reuses its connection pool
+async_client = cached_async_client(
+    instructor.from_groq(AsyncGroq(http_client=async_groq_http_client()), mode=instructor.Mode.JSON)
+)
+
+# asyncio primitives belong to one event loop, so each loop gets its own semaphore
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+def _timestamp() -> str:
+    return datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+
+def _error(e: Exception) -> Dict[str, Any]:
+    return {
+        "status": "error",
+        "message": str(e),
+        "timestamp": _timestamp()
+    }
+
+async def _create(tool: str, request: Dict[str, Any], accept=None) -> Any:
+    """Helper method to send a request to the tool's model tier, at most GROQ_MAX_CONCURRENCY calls at a time"""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(GROQ_MAX_CONCURRENCY)
+
+    async def create(**kwargs) -> Any:
+        async with semaphore:
+            return await async_client.chat.completions.create(**kwargs)
+
+    return await model_router.acomplete(create, tool, request, accept)
+
+@instrument_tool
+async def extract_meeting_info(email_content: str) -> Dict[str, Any]:
+    """
+    Async version of emailTools.extract_meeting_info.
+
+    Args:
+        email_content: The email text to analyze
+
+    Returns:
+        Dict containing meeting details and extraction status
+    """
+    return await _extract_meeting_info(preprocess_email(email_content))
+
+async def _extract_meeting_info(email_content: str) -> Dict[str, Any]:
+    """Helper method to extract meeting information from an already preprocessed email"""
+    try:
+        when = resolve_meeting_time(email_content)
+        response = await _create("extract_meeting_info", _meeting_request(email_content, when))
+        return {
+            "status": "success",
+            "meeting_info": _meeting_details(response, when, email_content),
+            "extracted_at": _timestamp()
+        }
+    except Exception as e:
+        return _error(e)
+
+@instrument_tool
+async def extract_task_info(email_content: str) -> Dict[str, Any]:
+    """
+    Async version of emailTools.extract_task_info.
+
+    Args:
+        email_content: The email text to analyze
+
+    Returns:
+        Dict containing task details and extraction status
+    """
+    return await _extract_task_info(preprocess_email(email_content))
+
+async def _extract_task_info(email_content: str) -> Dict[str, Any]:
+    """Helper method to extract task information from an already preprocessed email"""
+    try:
+        response = await _create("extract_task_info", _task_request(email_content))
+        return {
+            "status": "success",
+            "task_info": response.dict(),
+            "extracted_at": _timestamp()
+        }
+    except Exception as e:
+        return _error(e)
+
+async def _classify_with_llm(email_content: str) -> Dict[str, Any]:
+    """Helper method to classify an email with the Groq model"""
+    try:
+        response = await _create("classify_email", _classification_request(email_content), _accept_classification)
+        return {
+            "status": "success",
+            "classification": response.dict(),
+            "classified_at": _timestamp()
+        }
+    except Exception as e:
+        return _error(e)
+
+@instrument_tool
+async def classify_email(email_content: str) -> Dict[str, Any]:
+    """
+    Async version of emailTools.classify_email.
+
+    Args:
+        email_content: The email text to analyze
+
+    Returns:
+        Dict containing classification result and status
+    """
+    email_content = preprocess_email(email_content)
+    rule_result = _pre_classify(email_content)
+    if rule_result is not None:
+        return _rule_classification(rule_result)
+    return await _classify_with_llm(email_content)
+
+@instrument_tool
+async def process_email(email_content: str) -> Dict[str, Any]:
+    """
+    Async version of emailTools.process_email; the meeting and task
+    extractions of a "Both" email run concurrently.
+
+    Args:
+        email_content: The email text to analyze
+
+    Returns:
+        Dict containing classification and extracted information
+    """
+    email_content = preprocess_email(email_content)
+    analysis = None
+    rule_result = _pre_classify(email_content)
+    if rule_result is not None:
+        category = rule_result["category"]
+    else:
+        if COMBINED_EXTRACTION:
+            try:
+                analysis = await _create("analyze_email", _analysis_request(email_content))
+            except Exception as e:
+                print(f"Combined email analysis failed, falling back to per-step calls: {str(e)}")
+
+            if analysis is not None and analysis.category not in VALID_CATEGORIES:
+                print(f"Combined email analysis returned unknown category {analysis.category!r}, falling back to per-step calls")
+                analysis = None
+
+        if analysis is None:
+            classification = await _classify_with_llm(email_content)
+            category = classification.get("classification", {}).get("category", "Unknown")
+        else:
+            category = analysis.category
+
+    extracted_info = {"category": category}
+    missing = _combined_details(category, analysis, email_content, extracted_info)
+    results = await asyncio.gather(*(
+        _extract_meeting_info(email_content) if key == "meeting_info" else _extract_task_info(email_content)
+        for key in missing
+    ))
+    extracted_info.update(zip(missing, results))
+    return extracted_info
+
+async def process_emails(email_contents: List[str], max_concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Processes many emails concurrently; Groq requests stay within the shared limit.
+
+    Args:
+        email_contents: Email texts to analyze
+        max_concurrency: Emails in progress at once (default: GROQ_MAX_CONCURRENCY)
+
+    Returns:
+        process_email results in input order; an email that raised gets an error dict
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or GROQ_MAX_CONCURRENCY)
+
+    async def run(email_content: str) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await process_email(email_content)
+            except Exception as e:
+                return _error(e)
+
+    return await asyncio.gather(*(run(email_content) for email_content in email_contents))
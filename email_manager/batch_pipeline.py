@@ -0,0 +1,241 @@
+import argparse
+import json
+import mailbox
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+from email import policy
+from email.parser import BytesParser
+from email.message import EmailMessage
+from typing import Dict, Any, Optional, Iterator, Tuple, Callable, Set
+from email_manager.preprocess import html_to_text
+from email_manager.dedup import DEDUP_CONFIG, EmailDedupIndex, get_index
+from email_manager.pre_classifier import VALID_CATEGORIES, OTHER_CATEGORY
+
+DEFAULT_WORKERS = int(os.getenv("EMAIL_BATCH_WORKERS", "8"))
+
+_parser = BytesParser(policy=policy.default)
+
+def iter_messages(path: str) -> Iterator[Tuple[str, EmailMessage]]:
+    """Streams messages from an mbox file or a Maildir directory
+
+    Args:
+        path: mbox file, or Maildir directory (with cur/new/tmp)
+
+    Yields:
+        (key, message) pairs; the key is the Message-ID, or the message's
+        position in the mailbox when it has none, and is stable across runs
+    """
+    if os.path.isdir(path):
+        box = mailbox.Maildir(path, factory=None, create=False)
+    else:
+        box = mailbox.mbox(path, factory=None, create=False)
+    try:
+        for position, box_key in enumerate(box.iterkeys()):
+            message = _parser.parsebytes(box.get_bytes(box_key))
+            message_id = (message.get("Message-ID") or "").strip()
+            yield message_id or f"{os.path.basename(path)}#{box_key if os.path.isdir(path) else position}", message
+    finally:
+        box.close()
+
+def message_body(message: EmailMessage) -> str:
+    """The text/plain part of a MIME message, falling back to the text/html part with tags stripped"""
+    body = message.get_body(preferencelist=("plain", "html"))
+    text = ""
+    if body is not None:
+        try:
+            text = body.get_content()
+        except (LookupError, UnicodeError):
+            payload = body.get_payload(decode=True) or b""
+            text = payload.decode("utf-8", errors="replace")
+        if body.get_content_subtype() == "html":
+            text = html_to_text(text)
+    return text.strip()
+
+def message_text(message: EmailMessage) -> str:
+    """Flattens a MIME message into the plain text the extractors read
+
+    The subject and sent date are kept as header lines, the date anchoring
+    relative expressions like "tomorrow", followed by message_body().
+    """
+    text = message_body(message)
+    headers = "".join(f"{name}: {message[name]}\n" for name in ("Subject", "Date") if message.get(name))
+    return f"{headers}\n{text.strip()}" if headers else text.strip()
+
+def result_status(result: Dict[str, Any]) -> str:
+    """"error" when a processor result reports a failure, else "success"
+
+    process_email does not fail as a whole: a failed classification comes
+    back as an unknown category and a failed extraction as a nested error
+    dict, so both count as errors here and are retried with retry_errors.
+    """
+    if result.get("status") == "error" or result.get("category") not in VALID_CATEGORIES + (OTHER_CATEGORY,):
+        return "error"
+    for key in ("meeting_info", "task_info"):
+        details = result.get(key)
+        if isinstance(details, dict) and details.get("status") == "error":
+            return "error"
+    return "success"
+
+def load_checkpoint(output_path: str, retry_errors: bool = False) -> Set[str]:
+    """Returns the keys already written to the output, which a resumed run skips
+
+    Args:
+        output_path: JSONL results file of an earlier run
+        retry_errors: Leave out keys whose processing failed so they run again
+    """
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    with open(output_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A torn final line from an interrupted run; that message runs again
+                continue
+            if retry_errors and record.get("status") == "error":
+                done.discard(record["key"])
+            else:
+                done.add(record["key"])
+    return done
+
+def _end_torn_line(output_path: str) -> None:
+    """Helper method to terminate a torn final line, so the next record appended starts on a line of its own"""
+    if not os.path.exists(output_path) or os.path.getsize(output_path) == 0:
+        return
+    with open(output_path, "rb+") as f:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b"\n":
+            f.write(b"\n")
+
+def _default_processor() -> Callable[[str], Dict[str, Any]]:
+    # Imported late so --help works without a GROQ_API_KEY
+    from email_manager.emailTools import process_email
+    return process_email
+
+def run_pipeline(
+    source: str,
+    output_path: str,
+    workers: int = DEFAULT_WORKERS,
+    process: Optional[Callable[[str], Dict[str, Any]]] = None,
+    limit: Optional[int] = None,
+    retry_errors: bool = False,
+    progress_every: int = 100,
+    dedup: bool = DEDUP_CONFIG["enabled"]
+) -> Dict[str, Any]:
+    """Classifies and extracts every message in a mailbox into a JSONL file
+
+    Messages are parsed lazily and at most 2 * workers are in flight, so
+    memory stays flat on large mailboxes. Each result is appended and
+    flushed as soon as it is ready, which also makes the output the
+    checkpoint: rerunning with the same output skips finished messages.
+
+    Args:
+        source: mbox file or Maildir directory
+        output_path: JSONL file results are appended to
+        workers: Messages processed concurrently
+        process: Function turning email text into a result dict
+            (default: emailTools.process_email)
+        limit: Stop after submitting this many new messages
+        retry_errors: Reprocess messages whose earlier result was an error
+        progress_every: Print progress after this many results
+        dedup: Skip copies of emails already processed, in this run or an
+            earlier one (see email_manager.dedup); they are written with
+            status "duplicate" and the earlier result
+
+    Returns:
+        Dict with processed, skipped, failed and duplicate counts and elapsed seconds
+    """
+    process = process or _default_processor()
+    done = load_checkpoint(output_path, retry_errors)
+    _end_torn_line(output_path)
+    index: Optional[EmailDedupIndex] = get_index() if dedup else None
+    counts = {"processed": 0, "skipped": 0, "failed": 0, "duplicates": 0}
+    write_lock = threading.Lock()
+    start = time.monotonic()
+
+    def handle(key: str, message: EmailMessage) -> None:
+        record = {
+            "key": key,
+            "subject": message.get("Subject"),
+            "from": message.get("From"),
+            "date": message.get("Date")
+        }
+        dedup_key, duplicate = None, None
+        if index is not None:
+            dedup_key, duplicate = index.claim(
+                message_body(message), message.get("Message-ID"), message.get("In-Reply-To"), message.get("References"),
+                message.get("Subject")
+            )
+            if duplicate is not None and duplicate["duplicate_of"] == dedup_key and duplicate["result"] is None:
+                # Claimed by a run that stopped before writing its result
+                duplicate = None
+        if duplicate is not None:
+            record.update(status="duplicate", duplicate_of=duplicate["duplicate_of"], reason=duplicate["reason"], result=duplicate["result"])
+        else:
+            try:
+                record["result"] = process(message_text(message))
+                record["status"] = result_status(record["result"])
+            except Exception as e:
+                record["status"] = "error"
+                record["message"] = str(e)
+            if dedup_key is not None:
+                if record["status"] == "success":
+                    index.set_result(dedup_key, record["result"])
+                else:
+                    index.release(dedup_key)
+        record["processed_at"] = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        with write_lock:
+            out.write(json.dumps(record, default=str) + "\n")
+            out.flush()
+            counts["processed"] += 1
+            counts["failed"] += record["status"] == "error"
+            counts["duplicates"] += record["status"] == "duplicate"
+            if progress_every and counts["processed"] % progress_every == 0:
+                rate = counts["processed"] / max(time.monotonic() - start, 1e-9)
+                print(f"{counts['processed']} emails processed ({rate:.1f}/s, {counts['failed']} failed)")
+
+    submitted = 0
+    with open(output_path, "a", encoding="utf-8") as out, ThreadPoolExecutor(max_workers=workers) as pool:
+        in_flight = set()
+        for key, message in iter_messages(source):
+            if key in done:
+                counts["skipped"] += 1
+                continue
+            if limit is not None and submitted >= limit:
+                break
+            # The same Message-ID twice in one mailbox is processed once
+            done.add(key)
+            if len(in_flight) >= 2 * workers:
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    future.result()
+            in_flight.add(pool.submit(handle, key, message))
+            submitted += 1
+        for future in in_flight:
+            future.result()
+
+    counts["elapsed_seconds"] = round(time.monotonic() - start, 3)
+    return counts
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Classify and extract every email in an mbox file or Maildir.")
+    parser.add_argument("source", help="mbox file or Maildir directory")
+    parser.add_argument("-o", "--output", default="email_results.jsonl", help="JSONL results file, also used to resume")
+    parser.add_argument("-w", "--workers", type=int, default=DEFAULT_WORKERS, help="emails processed concurrently")
+    parser.add_argument("--limit", type=int, help="process at most this many new emails")
+    parser.add_argument("--retry-errors", action="store_true", help="reprocess emails whose earlier result was an error")
+    parser.add_argument("--no-dedup", action="store_true", help="process copies of emails already seen")
+    args = parser.parse_args()
+
+    summary = run_pipeline(
+        args.source, args.output, args.workers, limit=args.limit, retry_errors=args.retry_errors,
+        dedup=DEDUP_CONFIG["enabled"] and not args.no_dedup
+    )
+    print(json.dumps(summary))
+
+if __name__ == "__main__":
+    main()
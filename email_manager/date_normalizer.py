@@ -0,0 +1,214 @@
+import re
+from datetime import datetime, date, timedelta
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, List, Tuple
+
+DEFAULT_TIME = "09:00"
+
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12
+}
+_WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+# Full month names and their standard abbreviations; a bare prefix ("dec" in "decide") is not a month
+MONTH_NAMES = (
+    r"(?:january|february|march|april|may|june|july|august|september|october|november|december"
+    r"|jan|feb|mar|apr|jun|jul|aug|sept|sep|oct|nov|dec)\b\.?"
+)
+_MONTH = r"(" + MONTH_NAMES + r")"
+_DAY = r"(\d{1,2})(?:st|nd|rd|th)?\b(?!\d)"
+_WEEKDAY = r"(monday|tuesday|wednesday|thursday|friday|saturday|sunday)"
+
+_HEADER_LINES = re.compile(r"(?im)^(?:date|sent|from|to|cc|bcc|message-id|in-reply-to|references):.*$")
+_SENT_HEADER = re.compile(r"(?im)^(?:date|sent):\s*(.+)$")
+
+# Expressions that name a span rather than a day; the LLM decides those emails
+_VAGUE = re.compile(
+    r"\b(?:next week|this week|later this week|end of (?:the )?(?:day|week|month)|next month|sometime|some time|soon|asap"
+    r"|january|february|march|april|june|july|august|september|october|november|december|may \d{4})\b",
+    re.IGNORECASE
+)
+
+# Words marking a date as a deadline rather than the meeting's date
+_DEADLINE_CUE = re.compile(r"\b(?:by|due|before|deadline|until|no later than)\W+(?:\w+\W+){0,2}$", re.IGNORECASE)
+
+_TIME_RANGE = re.compile(r"\b(\d{1,2})(?::(\d{2}))?\s*(?:-|–|to)\s*\d{1,2}(?::\d{2})?\s*([ap])\.?m\.?(?![a-z])", re.IGNORECASE)
+_TIME_MERIDIEM = re.compile(r"\b(\d{1,2})(?::(\d{2}))?\s*([ap])\.?m\.?(?![a-z])", re.IGNORECASE)
+_TIME_24H = re.compile(r"\b([01]?\d|2[0-3]):([0-5]\d)\b(?!\s*[ap]\.?m)", re.IGNORECASE)
+_TIME_WORDS = re.compile(r"\b(noon|midday|midnight)\b", re.IGNORECASE)
+
+def email_sent_at(text: str) -> Optional[datetime]:
+    """Sent time from a Date:/Sent: header line in the email text, if any"""
+    match = _SENT_HEADER.search(text)
+    if not match:
+        return None
+    try:
+        return parsedate_to_datetime(match.group(1).strip())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+def _body(text: str) -> str:
+    """Helper method to drop header lines, whose dates are not meeting dates"""
+    return _HEADER_LINES.sub(" ", text)
+
+def _mask(text: str, match: "re.Match") -> str:
+    return text[:match.start()] + " " * (match.end() - match.start()) + text[match.end():]
+
+def _month(name: str) -> int:
+    return _MONTHS[name.lower()[:3]]
+
+def _safe_date(year: int, month: int, day: int) -> Optional[date]:
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+def _upcoming(month: int, day: int, anchor: date) -> Optional[date]:
+    """Helper method to place a yearless date on or after the anchor"""
+    candidate = _safe_date(anchor.year, month, day)
+    if candidate is not None and candidate < anchor:
+        candidate = _safe_date(anchor.year + 1, month, day)
+    return candidate
+
+def _weekday(name: str, anchor: date, allow_today: bool) -> date:
+    """Helper method to resolve a weekday name to its next occurrence
+
+    "Monday" and "next Monday" both mean the first Monday after the anchor;
+    "this Monday" may also be the anchor day itself.
+    """
+    ahead = (_WEEKDAYS.index(name.lower()) - anchor.weekday()) % 7
+    if ahead == 0 and not allow_today:
+        ahead = 7
+    return anchor + timedelta(days=ahead)
+
+def find_dates(text: str, anchor: date) -> Tuple[List[Tuple[int, date]], bool]:
+    """Resolves every date expression in the text
+
+    Args:
+        text: Email text without header lines
+        anchor: Day relative expressions count from (the email's sent date)
+
+    Returns:
+        ((offset, date) for each date found, in order; whether a vague span
+        such as "next week" or a month without a day was mentioned)
+    """
+    found: List[Tuple[int, date]] = []
+
+    def collect(pattern: str, resolve) -> None:
+        nonlocal text
+        for match in list(re.finditer(pattern, text, re.IGNORECASE)):
+            resolved = resolve(match)
+            if resolved is not None:
+                found.append((match.start(), resolved))
+                text = _mask(text, match)
+
+    collect(r"\b(\d{4})([-/.])(\d{1,2})\2(\d{1,2})\b",
+            lambda m: _safe_date(int(m.group(1)), int(m.group(3)), int(m.group(4))))
+    # Dotted numeric dates are read day first, as they are written
+    collect(r"\b(\d{1,2})\.(\d{1,2})\.(\d{4})\b",
+            lambda m: _safe_date(int(m.group(3)), int(m.group(2)), int(m.group(1))))
+    collect(r"\b" + _MONTH + r"\s+" + _DAY + r"(?:,?\s+(\d{4}))?",
+            lambda m: _safe_date(int(m.group(3)), _month(m.group(1)), int(m.group(2))) if m.group(3)
+            else _upcoming(_month(m.group(1)), int(m.group(2)), anchor))
+    collect(r"\b" + _DAY + r"(?:\s+of)?\s+" + _MONTH + r"(?:,?\s+(\d{4}))?",
+            lambda m: _safe_date(int(m.group(3)), _month(m.group(2)), int(m.group(1))) if m.group(3)
+            else _upcoming(_month(m.group(2)), int(m.group(1)), anchor))
+    # Numeric dates are read month first, as in the rest of the team's mail
+    collect(r"(?<![\d/])(\d{1,2})/(\d{1,2})(?:/(\d{2}|\d{4}))?\b(?!/)",
+            lambda m: _safe_date(int(m.group(3)) + (2000 if len(m.group(3)) == 2 else 0), int(m.group(1)), int(m.group(2))) if m.group(3)
+            else _upcoming(int(m.group(1)), int(m.group(2)), anchor))
+    collect(r"\bday after tomorrow\b", lambda m: anchor + timedelta(days=2))
+    collect(r"\btomorrow\b", lambda m: anchor + timedelta(days=1))
+    collect(r"\b(?:today|tonight|this (?:morning|afternoon|evening))\b", lambda m: anchor)
+    collect(r"\bin (\d{1,2}) days?\b", lambda m: anchor + timedelta(days=int(m.group(1))))
+    collect(r"\bthis " + _WEEKDAY + r"\b", lambda m: _weekday(m.group(1), anchor, allow_today=True))
+    collect(r"\b(?:next |on |coming )?" + _WEEKDAY + r"\b", lambda m: _weekday(m.group(1), anchor, allow_today=False))
+
+    found.sort()
+    return found, _VAGUE.search(text) is not None
+
+def find_times(text: str) -> List[str]:
+    """Every clock time in the text as HH:MM, in order; a range contributes its start"""
+    found: List[Tuple[int, str]] = []
+
+    def clock(hour: int, minute: int, meridiem: Optional[str]) -> Optional[str]:
+        if meridiem:
+            if not 1 <= hour <= 12:
+                return None
+            hour = hour % 12 + (12 if meridiem.lower() == "p" else 0)
+        if hour > 23 or minute > 59:
+            return None
+        return f"{hour:02d}:{minute:02d}"
+
+    for pattern, resolve in (
+        (_TIME_RANGE, lambda m: clock(int(m.group(1)), int(m.group(2) or 0), m.group(3))),
+        (_TIME_MERIDIEM, lambda m: clock(int(m.group(1)), int(m.group(2) or 0), m.group(3))),
+        (_TIME_24H, lambda m: clock(int(m.group(1)), int(m.group(2)), None)),
+        (_TIME_WORDS, lambda m: "00:00" if m.group(1).lower() == "midnight" else "12:00")
+    ):
+        for match in list(pattern.finditer(text)):
+            resolved = resolve(match)
+            if resolved is not None:
+                found.append((match.start(), resolved))
+                text = _mask(text, match)
+    found.sort()
+    return [resolved for _, resolved in found]
+
+def resolve_meeting_time(email_content: str, now: Optional[datetime] = None) -> Dict[str, str]:
+    """Works out a meeting's date and time locally when the email is unambiguous
+
+    Relative expressions count from the email's Date: header, or from now.
+    A single distinct date or time is taken as the meeting's. None found,
+    several, a vague span like "next week", or a date introduced as a
+    deadline ("by Friday") leave the field for the LLM, since a phrasing
+    the parser does not know is not the same as no date at all.
+
+    Args:
+        email_content: Email text, optionally with header lines
+        now: Anchor when the email carries no Date: header (default: datetime.now())
+
+    Returns:
+        Dict with "date" (YYYY-MM-DD) and/or "time" (HH:MM) for each field resolved
+    """
+    anchor = (email_sent_at(email_content) or now or datetime.now()).date()
+    body = _body(email_content)
+    resolved = {}
+
+    dates, vague = find_dates(body, anchor)
+    distinct_dates = sorted(set(resolved_date for _, resolved_date in dates))
+    # A date given as a deadline may belong to a task in the same email
+    deadline = any(_DEADLINE_CUE.search(body[max(0, start - 30):start]) for start, _ in dates)
+    if len(distinct_dates) == 1 and not vague and not deadline:
+        resolved["date"] = distinct_dates[0].isoformat()
+
+    distinct_times = sorted(set(find_times(body)))
+    if len(distinct_times) == 1:
+        resolved["time"] = distinct_times[0]
+    return resolved
+
+def normalize_date(value: str, anchor: date) -> Optional[str]:
+    """Reads a date the LLM returned in any supported form as YYYY-MM-DD"""
+    dates, _ = find_dates(value or "", anchor)
+    return dates[0][1].isoformat() if dates else None
+
+def normalize_time(value: str) -> Optional[str]:
+    """Reads a time the LLM returned in any supported form as HH:MM"""
+    times = find_times(value or "")
+    return times[0] if times else None
+
+def apply_meeting_time(meeting_info: Dict[str, Any], email_content: str, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """Overrides an extracted meeting's date and time with the locally resolved ones
+
+    Fields the email leaves ambiguous keep the LLM's value, rewritten to
+    YYYY-MM-DD / HH:MM when it came back in another format. Only when the
+    LLM left a field empty too does it default to the next day and 09:00.
+    """
+    anchor = (email_sent_at(email_content) or now or datetime.now()).date()
+    resolved = resolve_meeting_time(email_content, now)
+    info = dict(meeting_info)
+    date_value, time_value = str(info.get("date") or "").strip(), str(info.get("time") or "").strip()
+    info["date"] = (resolved.get("date") or normalize_date(date_value, anchor) or date_value
+                    or (anchor + timedelta(days=1)).isoformat())
+    info["time"] = resolved.get("time") or normalize_time(time_value) or time_value or DEFAULT_TIME
+    return info
@@ -0,0 +1,252 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional, List, Tuple
+from datetime import date
+from email_manager.preprocess import html_to_text, strip_quoted, strip_signature
+from email_manager.date_normalizer import find_dates, find_times
+from metrics import registry
+
+DEDUP_CONFIG = {
+    "enabled": os.getenv("EMAIL_DEDUP_ENABLED", "true").lower() == "true",
+    "path": os.getenv("EMAIL_DEDUP_PATH", "email_dedup.sqlite3"),
+    # Largest SimHash Hamming distance still counted as the same email (below BANDS)
+    "max_distance": int(os.getenv("EMAIL_DEDUP_MAX_DISTANCE", "4")),
+    # Looser distance for replies within one thread, which quote-stripping leaves short
+    "thread_max_distance": int(os.getenv("EMAIL_DEDUP_THREAD_MAX_DISTANCE", "10"))
+}
+
+SIMHASH_BITS = 64
+# Eight 8-bit bands: two hashes within distance 7 share at least one band exactly
+BANDS = 8
+_BAND_BITS = SIMHASH_BITS // BANDS
+SHINGLE_WORDS = 3
+
+_MESSAGE_ID = re.compile(r"<[^<>\s]+>")
+_WORD = re.compile(r"\w+")
+# Gmail, Outlook and Apple Mail markers above a forwarded message's own headers
+_FORWARD_MARKER = re.compile(r"(?im)^\s*(?:-{2,}\s*forwarded message\s*-{2,}|begin forwarded message:)\s*$")
+_HEADER_LINE = re.compile(r"^(?:from|sent|date|subject|to|cc):", re.IGNORECASE)
+_WHEN_ANCHOR = date(2000, 1, 3)
+_SUBJECT_PREFIXES = re.compile(r"^(?:\s*(?:re|fwd?|fw|aw|wg)\s*:)+", re.IGNORECASE)
+
+def _forwarded_original(body: str) -> str:
+    """Helper method to reduce a forward to the message it forwards, without its header lines"""
+    markers = list(_FORWARD_MARKER.finditer(body))
+    if not markers:
+        return body
+    lines = body[markers[-1].end():].lstrip("\n").split("\n")
+    while lines and (_HEADER_LINE.match(lines[0].strip()) or not lines[0].strip()):
+        lines.pop(0)
+    return "\n".join(lines)
+
+def own_text(body: str) -> str:
+    """The email's own text: HTML, quoted history and signature removed
+
+    A forward is reduced to the message it forwards, so forwarded copies
+    of an invite compare equal to the invite.
+    """
+    if re.search(r"(?i)<(?:html|body|div|p|br|table)\b", body):
+        body = html_to_text(body)
+    return strip_signature(strip_quoted(_forwarded_original(body)))
+
+def normalized_words(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+def when_key(text: str) -> str:
+    """The dates and times an email mentions, so a rescheduled copy never matches the original
+
+    Relative expressions resolve against a fixed day, so "Monday" in two
+    emails compares equal whenever they were sent.
+    """
+    dates, _ = find_dates(text, _WHEN_ANCHOR)
+    return ",".join(sorted({resolved.isoformat() for _, resolved in dates} | set(find_times(text))))
+
+def simhash(words: List[str]) -> Optional[int]:
+    """64-bit SimHash over word shingles, or None for a body too short to compare"""
+    if len(words) < SHINGLE_WORDS:
+        return None
+    weights = [0] * SIMHASH_BITS
+    for start in range(len(words) - SHINGLE_WORDS + 1):
+        shingle = " ".join(words[start:start + SHINGLE_WORDS])
+        value = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit in range(SIMHASH_BITS) if weights[bit] > 0)
+
+def _bands(value: int) -> List[int]:
+    return [(value >> (band * _BAND_BITS)) & ((1 << _BAND_BITS) - 1) for band in range(BANDS)]
+
+def _signed(value: int) -> int:
+    """SQLite integers are signed 64-bit"""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+class EmailDedupIndex:
+    """Persistent index of processed emails for skipping duplicates before extraction
+
+    An email is a duplicate when its Message-ID was seen before, when its
+    body's SimHash is within max_distance of any earlier email (a
+    forwarded invite, a re-send), or when it is a reply whose own text is
+    within thread_max_distance of an earlier email in the same thread
+    (reply-all "+1"s quoting the invite); a reply with almost no text of
+    its own duplicates its thread's first email. Near matches must also
+    mention the same dates and times, so a rescheduled meeting is never
+    skipped. Threads are keyed by the first Message-ID in References,
+    else In-Reply-To, else the email itself.
+
+    claim() checks and records in one transaction, so concurrent workers
+    and processes sharing the file cannot both take the same email. The
+    caller stores the outcome with set_result(), which later duplicates
+    get back.
+    """
+
+    def __init__(self, path: str, max_distance: int = 4, thread_max_distance: int = 10):
+        if max_distance >= BANDS:
+            raise ValueError(f"max_distance must be below {BANDS} for the band index to find every match")
+        self.path = path
+        self.max_distance = max_distance
+        self.thread_max_distance = thread_max_distance
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._stats = {"checked": 0, "new": 0, "duplicate_id": 0, "near_duplicate": 0, "thread_duplicate": 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS emails ("
+                "message_id TEXT PRIMARY KEY, thread_id TEXT NOT NULL, simhash INTEGER, when_key TEXT NOT NULL, "
+                + ", ".join(f"band{band} INTEGER" for band in range(BANDS))
+                + ", result TEXT, created_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS emails_thread ON emails (thread_id)")
+            for band in range(BANDS):
+                self._conn.execute(f"CREATE INDEX IF NOT EXISTS emails_band{band} ON emails (band{band})")
+        return self._conn
+
+    @staticmethod
+    def _ids(value: Optional[str]) -> List[str]:
+        return _MESSAGE_ID.findall(value or "")
+
+    def _near(self, conn: sqlite3.Connection, value: int, when: str, thread_id: str) -> Optional[Tuple[str, str, str]]:
+        """Helper method to find an earlier email within distance; returns (message_id, result, reason)"""
+        bands = _bands(value)
+        where = " OR ".join(f"band{band} = ?" for band in range(BANDS))
+        for message_id, stored, result in conn.execute(
+            f"SELECT message_id, simhash, result FROM emails WHERE when_key = ? AND ({where})", [when] + bands
+        ):
+            if stored is not None and bin((stored ^ _signed(value)) & ((1 << 64) - 1)).count("1") <= self.max_distance:
+                return message_id, result, "near_duplicate"
+        for message_id, stored, result in conn.execute(
+            "SELECT message_id, simhash, result FROM emails WHERE thread_id = ? AND when_key = ? AND simhash IS NOT NULL",
+            (thread_id, when)
+        ):
+            if bin((stored ^ _signed(value)) & ((1 << 64) - 1)).count("1") <= self.thread_max_distance:
+                return message_id, result, "thread_duplicate"
+        return None
+
+    def claim(
+        self,
+        body: str,
+        message_id: Optional[str] = None,
+        in_reply_to: Optional[str] = None,
+        references: Optional[str] = None,
+        subject: Optional[str] = None
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Records an email as processed unless it duplicates an earlier one
+
+        Args:
+            body: Email body
+            message_id: Message-ID header (default: a hash of the subject and normalized body)
+            in_reply_to: In-Reply-To header
+            references: References header
+            subject: Subject header, without Re:/Fwd: prefixes part of the default key
+
+        Returns:
+            (key, duplicate); key identifies the email for set_result, and
+            duplicate is None for a new email, else a dict with the
+            duplicate_of key, the reason and the earlier result
+        """
+        text = own_text(body)
+        words = normalized_words(text)
+        value = simhash(words)
+        when = when_key(text)
+        key = (self._ids(message_id) or [None])[0]
+        if key is None:
+            content = normalized_words(_SUBJECT_PREFIXES.sub("", subject or "")) + ["\n"] + words
+            key = "sha256:" + hashlib.sha256(" ".join(content).encode("utf-8")).hexdigest()
+        parents = self._ids(references) or self._ids(in_reply_to)
+        thread_id = parents[0] if parents else key
+
+        with self._lock:
+            self._stats["checked"] += 1
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT result FROM emails WHERE message_id = ?", (key,)).fetchone()
+                match = (key, row[0], "duplicate_id") if row else None
+                if match is None and value is not None:
+                    match = self._near(conn, value, when, thread_id)
+                elif match is None and thread_id != key and not when:
+                    # A reply with next to no text of its own ("+1", "works for me") adds nothing to its thread
+                    row = conn.execute(
+                        "SELECT message_id, result FROM emails WHERE thread_id = ? ORDER BY created_at LIMIT 1", (thread_id,)
+                    ).fetchone()
+                    match = (row[0], row[1], "thread_duplicate") if row else None
+                if match is None:
+                    conn.execute(
+                        f"INSERT INTO emails (message_id, thread_id, simhash, when_key, {', '.join(f'band{band}' for band in range(BANDS))}, created_at) "
+                        f"VALUES (?, ?, ?, ?, {', '.join('?' for _ in range(BANDS))}, ?)",
+                        [key, thread_id, None if value is None else _signed(value), when]
+                        + (_bands(value) if value is not None else [None] * BANDS)
+                        + [time.time()]
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            if match is None:
+                self._stats["new"] += 1
+                return key, None
+            self._stats[match[2]] += 1
+        duplicate_of, result, reason = match
+        return key, {"duplicate_of": duplicate_of, "reason": reason, "result": json.loads(result) if result else None}
+
+    def set_result(self, key: str, result: Dict[str, Any]) -> None:
+        """Stores what processing the claimed email produced, for its duplicates"""
+        with self._lock:
+            self._connect().execute("UPDATE emails SET result = ? WHERE message_id = ?", (json.dumps(result, default=str), key))
+
+    def release(self, key: str) -> None:
+        """Forgets a claimed email whose processing failed, so it is tried again"""
+        with self._lock:
+            self._connect().execute("DELETE FROM emails WHERE message_id = ?", (key,))
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns new vs duplicate counts by reason, and the number of indexed emails"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["indexed"] = self._connect().execute("SELECT COUNT(*) FROM emails").fetchone()[0]
+        stats["skipped"] = stats["checked"] - stats["new"]
+        return stats
+
+_shared_index: Optional[EmailDedupIndex] = None
+_shared_lock = threading.Lock()
+
+def get_index() -> EmailDedupIndex:
+    """Process-wide index configured by DEDUP_CONFIG"""
+    global _shared_index
+    with _shared_lock:
+        if _shared_index is None:
+            _shared_index = EmailDedupIndex(
+                DEDUP_CONFIG["path"],
+                DEDUP_CONFIG["max_distance"],
+                DEDUP_CONFIG["thread_max_distance"]
+            )
+            registry.register_gauges("email_dedup", _shared_index.metrics)
+        return _shared_index
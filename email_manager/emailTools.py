@@ -1,14 +1,35 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional, List
 import os
 from datetime import datetime
 from pydantic import BaseModel, Field
 from groq import Groq
 import instructor
 from smolagents import tool
+from metrics import instrument_tool, groq_http_client, registry
+from llm_cache import cached_client
+from email_manager.pre_classifier import PreClassifier, PRE_CLASSIFIER_CONFIG, VALID_CATEGORIES
+from email_manager.date_normalizer import resolve_meeting_time, apply_meeting_time
+from email_manager.preprocess import preprocess_email, preprocessor
+from email_manager.model_router import model_router, confident, ROUTING_CONFIG
 
 # Initialize Groq client
 os.environ["GROQ_API_KEY"] = os.environ["GROQ_API_KEY"]
-client = instructor.from_groq(Groq(), mode=instructor.Mode.JSON)
+client = cached_client(instructor.from_groq(Groq(http_client=groq_http_client()), mode=instructor.Mode.JSON))
+
+# Classify and extract in one request; set to "false" to always use the per-step calls
+COMBINED_EXTRACTION = os.getenv("EMAIL_COMBINED_EXTRACTION", "true").lower() == "true"
+
+# Keyword/regex rules that settle unambiguous emails without an LLM call
+pre_classifier = PreClassifier(
+    threshold=PRE_CLASSIFIER_CONFIG["threshold"],
+    absent_below=PRE_CLASSIFIER_CONFIG["absent_below"]
+)
+registry.register_gauges("pre_classifier", pre_classifier.metrics)
+registry.register_gauges("email_preprocess", preprocessor.metrics)
+
+def _complete(tool: str, request: Dict[str, Any], accept=None) -> Any:
+    """Helper method to send a request to the model tier its tool is routed to"""
+    return model_router.complete(client.chat.completions.create, tool, request, accept)
 
 class MeetingInfoResponseModel(BaseModel):
     date: str = Field(description="Extracted date of the meeting in YYYY-MM-DD format")
@@ -17,10 +38,45 @@ class MeetingInfoResponseModel(BaseModel):
     sentiment_score: int = Field(description="Importance score of the meeting on a scale of 0-10")
     description: str = Field(description="Description of the meeting")
 
+class MeetingDetailsResponseModel(BaseModel):
+    title: str = Field(description="Extracted title of the meeting from the email")
+    sentiment_score: int = Field(description="Importance score of the meeting on a scale of 0-10")
+    description: str = Field(description="Description of the meeting")
+
+def _meeting_request(email_content: str, when: Dict[str, str]) -> Dict[str, Any]:
+    """Helper method to build the meeting extraction request; the date and time are left out once resolved locally"""
+    if "date" in when and "time" in when:
+        return dict(
+            response_model=MeetingDetailsResponseModel,
+            messages=[
+                {"role": "system", "content": "Extract meeting details including title, description, and priority score."},
+                {"role": "user", "content": email_content}
+            ],
+            temperature=0.3,
+            max_tokens=100
+        )
+    return dict(
+        response_model=MeetingInfoResponseModel,
+        messages=[
+            {"role": "system", "content": "Extract meeting details including date, time, title, description, and priority score."},
+            {"role": "user", "content": email_content}
+        ],
+        temperature=0.3,
+        max_tokens=150
+    )
+
+def _meeting_details(response: BaseModel, when: Dict[str, str], email_content: str) -> Dict[str, Any]:
+    """Helper method to merge the model's meeting details with the locally resolved date and time"""
+    if isinstance(response, MeetingDetailsResponseModel):
+        return {"date": when["date"], "time": when["time"], **response.dict()}
+    return apply_meeting_time(response.dict(), email_content)
+
 @tool
+@instrument_tool
 def extract_meeting_info(email_content: str) -> Dict[str, Any]:
     """
     Extracts meeting information from email content using Groq API.
+    The date and time are resolved locally when the email is unambiguous.
     
     Args:
         email_content: The email text to analyze
@@ -28,21 +84,17 @@ def extract_meeting_info(email_content: str) -> Dict[str, Any]:
     Returns:
         Dict containing meeting details and extraction status
     """
+    return _extract_meeting_info(preprocess_email(email_content))
+
+def _extract_meeting_info(email_content: str) -> Dict[str, Any]:
+    """Helper method to extract meeting information from an already preprocessed email"""
     try:
-        response = client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            response_model=MeetingInfoResponseModel,
-            messages=[
-                {"role": "system", "content": "Extract meeting details including date, time, title, description, and priority score."},
-                {"role": "user", "content": email_content}
-            ],
-            temperature=0.3,
-            max_tokens=150
-        )
+        when = resolve_meeting_time(email_content)
+        response = _complete("extract_meeting_info", _meeting_request(email_content, when))
         
         return {
             "status": "success",
-            "meeting_info": response.dict(),
+            "meeting_info": _meeting_details(response, when, email_content),
             "extracted_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
         }
     except Exception as e:
@@ -56,7 +108,20 @@ class TaskInfoResponseModel(BaseModel):
     date: str = Field(description="Extracted date of the task in YYYY-MM-DD format")
     title: str = Field(description="Extracted title of the task from the email")
 
+def _task_request(email_content: str) -> Dict[str, Any]:
+    """Helper method to build the task extraction request"""
+    return dict(
+        response_model=TaskInfoResponseModel,
+        messages=[
+            {"role": "system", "content": "Extract task details including title and date."},
+            {"role": "user", "content": email_content}
+        ],
+        temperature=0.3,
+        max_tokens=100
+    )
+
 @tool
+@instrument_tool
 def extract_task_info(email_content: str) -> Dict[str, Any]:
     """
     Extracts task information from email content using Groq API.
@@ -67,17 +132,12 @@ def extract_task_info(email_content: str) -> Dict[str, Any]:
     Returns:
         Dict containing task details and extraction status
     """
+    return _extract_task_info(preprocess_email(email_content))
+
+def _extract_task_info(email_content: str) -> Dict[str, Any]:
+    """Helper method to extract task information from an already preprocessed email"""
     try:
-        response = client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            response_model=TaskInfoResponseModel,
-            messages=[
-                {"role": "system", "content": "Extract task details including title and date."},
-                {"role": "user", "content": email_content}
-            ],
-            temperature=0.3,
-            max_tokens=100
-        )
+        response = _complete("extract_task_info", _task_request(email_content))
         
         return {
             "status": "success",
@@ -93,11 +153,49 @@ def extract_task_info(email_content: str) -> Dict[str, Any]:
 
 class EmailClassificationResponseModel(BaseModel):
     category: str = Field(description="Classified category of the email: 'Task Creation', 'Meeting Schedule', or 'Both'")
+    confidence: float = Field(description="Confidence in the category, from 0 to 1")
+
+_confident = confident(ROUTING_CONFIG["escalation_threshold"])
+
+def _accept_classification(response: EmailClassificationResponseModel) -> bool:
+    """Helper method to keep a classification only if it names a known category with enough confidence"""
+    return response.category in VALID_CATEGORIES and _confident(response)
+
+def _classification_request(email_content: str) -> Dict[str, Any]:
+    """Helper method to build the classification request"""
+    return dict(
+        response_model=EmailClassificationResponseModel,
+        messages=[
+            {"role": "system", "content": "Classify the email as 'Task Creation', 'Meeting Schedule', or 'Both', with your confidence from 0 to 1."},
+            {"role": "user", "content": email_content}
+        ],
+        temperature=0.3,
+        max_tokens=50
+    )
+
+def _rule_classification(rule_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Helper method to shape a pre-classifier decision like an LLM classification"""
+    return {
+        "status": "success",
+        "classification": {"category": rule_result["category"]},
+        "source": "rules",
+        "confidence": rule_result["confidence"],
+        "classified_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+def _pre_classify(email_content: str) -> Optional[Dict[str, Any]]:
+    """Helper method to classify an email with the local rules, or None when the LLM should decide"""
+    if not PRE_CLASSIFIER_CONFIG["enabled"]:
+        return None
+    return pre_classifier.classify(email_content)
 
 @tool
+@instrument_tool
 def classify_email(email_content: str) -> Dict[str, Any]:
     """
     Classifies the email content into categories: 'Task Creation', 'Meeting Schedule', or 'Both'.
+    Unambiguous emails are classified by local rules without an LLM call;
+    newsletters and other bulk mail are classified as 'Other'.
     
     Args:
         email_content: The email text to analyze
@@ -105,17 +203,16 @@ def classify_email(email_content: str) -> Dict[str, Any]:
     Returns:
         Dict containing classification result and status
     """
+    email_content = preprocess_email(email_content)
+    rule_result = _pre_classify(email_content)
+    if rule_result is not None:
+        return _rule_classification(rule_result)
+    return _classify_with_llm(email_content)
+
+def _classify_with_llm(email_content: str) -> Dict[str, Any]:
+    """Helper method to classify an email with the Groq model"""
     try:
-        response = client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            response_model=EmailClassificationResponseModel,
-            messages=[
-                {"role": "system", "content": "Classify the email as 'Task Creation', 'Meeting Schedule', or 'Both'."},
-                {"role": "user", "content": email_content}
-            ],
-            temperature=0.3,
-            max_tokens=50
-        )
+        response = _complete("classify_email", _classification_request(email_content), _accept_classification)
         
         return {
             "status": "success",
@@ -129,7 +226,68 @@ def classify_email(email_content: str) -> Dict[str, Any]:
             "timestamp": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
         }
 
+class EmailAnalysisResponseModel(BaseModel):
+    category: str = Field(description="Classified category of the email: 'Task Creation', 'Meeting Schedule', or 'Both'")
+    meeting_info: Optional[MeetingInfoResponseModel] = Field(default=None, description="Meeting details, when the category is 'Meeting Schedule' or 'Both'")
+    task_info: Optional[TaskInfoResponseModel] = Field(default=None, description="Task details, when the category is 'Task Creation' or 'Both'")
+
+def _analysis_request(email_content: str) -> Dict[str, Any]:
+    """Helper method to build the request classifying an email and extracting its meeting and task details at once"""
+    return dict(
+        response_model=EmailAnalysisResponseModel,
+        messages=[
+            {"role": "system", "content": (
+                "Classify the email as 'Task Creation', 'Meeting Schedule', or 'Both'. "
+                "For meetings, extract date, time, title, description, and priority score. "
+                "For tasks, extract title and date. Leave out the details that do not apply."
+            )},
+            {"role": "user", "content": email_content}
+        ],
+        temperature=0.3,
+        max_tokens=300
+    )
+
+def _analyze_email(email_content: str) -> EmailAnalysisResponseModel:
+    """Helper method to classify an email and extract its meeting and task details in one Groq call"""
+    return _complete("analyze_email", _analysis_request(email_content))
+
+def _wrap(key: str, details: Dict[str, Any]) -> Dict[str, Any]:
+    """Helper method to shape combined-call details like the per-step tool results"""
+    return {
+        "status": "success",
+        key: details,
+        "extracted_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+def _combined_details(
+    category: str,
+    analysis: Optional[EmailAnalysisResponseModel],
+    email_content: str,
+    extracted_info: Dict[str, Any]
+) -> List[str]:
+    """Helper method to fill in the details the combined call returned
+
+    Returns:
+        Each of "meeting_info" / "task_info" the category calls for but the
+        combined call did not provide; its slot in extracted_info is None
+    """
+    missing = []
+    if category in ("Meeting Schedule", "Both"):
+        if analysis is not None and analysis.meeting_info is not None:
+            extracted_info["meeting_info"] = _wrap("meeting_info", apply_meeting_time(analysis.meeting_info.dict(), email_content))
+        else:
+            extracted_info["meeting_info"] = None
+            missing.append("meeting_info")
+    if category in ("Task Creation", "Both"):
+        if analysis is not None and analysis.task_info is not None:
+            extracted_info["task_info"] = _wrap("task_info", analysis.task_info.dict())
+        else:
+            extracted_info["task_info"] = None
+            missing.append("task_info")
+    return missing
+
 @tool
+@instrument_tool
 def process_email(email_content: str) -> Dict[str, Any]:
     """
     Processes an email to classify it and extract relevant task or meeting details.
@@ -140,17 +298,33 @@ def process_email(email_content: str) -> Dict[str, Any]:
     Returns:
         Dict containing classification and extracted information
     """
-    classification = classify_email(email_content)
-    category = classification.get("classification", {}).get("category", "Unknown")
+    email_content = preprocess_email(email_content)
+    analysis = None
+    rule_result = _pre_classify(email_content)
+    if rule_result is not None:
+        # The category is settled, so only the extraction calls it needs are made
+        category = rule_result["category"]
+    else:
+        if COMBINED_EXTRACTION:
+            try:
+                analysis = _analyze_email(email_content)
+            except Exception as e:
+                print(f"Combined email analysis failed, falling back to per-step calls: {str(e)}")
+
+            if analysis is not None and analysis.category not in VALID_CATEGORIES:
+                print(f"Combined email analysis returned unknown category {analysis.category!r}, falling back to per-step calls")
+                analysis = None
+
+        if analysis is None:
+            classification = _classify_with_llm(email_content)
+            category = classification.get("classification", {}).get("category", "Unknown")
+        else:
+            category = analysis.category
     
     extracted_info = {"category": category}
     
-    if category == "Meeting Schedule":
-        extracted_info["meeting_info"] = extract_meeting_info(email_content)
-    elif category == "Task Creation":
-        extracted_info["task_info"] = extract_task_info(email_content)
-    elif category == "Both":
-        extracted_info["meeting_info"] = extract_meeting_info(email_content)
-        extracted_info["task_info"] = extract_task_info(email_content)
+    # Details the combined call left out are fetched with the per-step tools
+    for key in _combined_details(category, analysis, email_content, extracted_info):
+        extracted_info[key] = _extract_meeting_info(email_content) if key == "meeting_info" else _extract_task_info(email_content)
     
     return extracted_info
\ No newline at end of file
@@ -1,14 +1,22 @@
 from typing import Dict, Any
 import os
+import sys
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
 from groq import Groq
 import instructor
 from smolagents import tool
 
+# Share the repo-wide call metrics when run from this directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from metrics import instrument_tool, groq_http_client
+from llm_cache import cached_client
+from email_manager.date_normalizer import resolve_meeting_time, apply_meeting_time
+from email_manager.preprocess import preprocess_email
+
 # Initialize Groq client
 os.environ["GROQ_API_KEY"] = os.environ["GROQ_API_KEY"]
-client = instructor.from_groq(Groq(), mode=instructor.Mode.JSON)
+client = cached_client(instructor.from_groq(Groq(http_client=groq_http_client()), mode=instructor.Mode.JSON))
 
 class MeetingInfoResponseModel(BaseModel):
     date: str = Field(description="Extracted date of the meeting in YYYY-MM-DD format")
@@ -17,10 +25,17 @@ class MeetingInfoResponseModel(BaseModel):
     sentiment_score: int = Field(description="Importance score of the meeting on a scale of 0-10")
     description: str = Field(description="Description of the meeting")
 
+class MeetingDetailsResponseModel(BaseModel):
+    title: str = Field(description="Extracted title of the meeting from the email")
+    sentiment_score: int = Field(description="Importance score of the meeting on a scale of 0-10")
+    description: str = Field(description="Description of the meeting")
+
 @tool
+@instrument_tool
 def extract_meeting_info(email_content: str) -> Dict[str, Any]:
     """
     Extracts meeting information from email content using Groq API.
+    The date and time are resolved locally when the email is unambiguous.
     
     Args:
         email_content: The email text to analyze
@@ -28,7 +43,29 @@ def extract_meeting_info(email_content: str) -> Dict[str, Any]:
     Returns:
         Dict containing meeting details and extraction status
     """
+    email_content = preprocess_email(email_content)
     try:
+        when = resolve_meeting_time(email_content)
+        if "date" in when and "time" in when:
+            response = client.chat.completions.create(
+                model="llama-3.3-70b-versatile",
+                response_model=MeetingDetailsResponseModel,
+                messages=[
+                    {"role": "system", "content": (
+                        "You are an email analysis assistant. Extract the meeting title, description, and its importance "
+                        "sentiment score as an integer (0-10). If no sentiment score is given, estimate based on urgency keywords and title."
+                    )},
+                    {"role": "user", "content": f"Email Content: {email_content}"}
+                ],
+                temperature=0.3,
+                max_tokens=100
+            )
+            return {
+                "status": "success",
+                "meeting_info": {"date": when["date"], "time": when["time"], **response.dict()},
+                "extracted_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+            }
+
         query = (
             "Extract the meeting date, time, title, description, and its importance sentiment score (0-10) from the given email. "
             "Return only a JSON object with 'date', 'time', 'title', 'description', and 'sentiment_score'. "
@@ -55,7 +92,7 @@ def extract_meeting_info(email_content: str) -> Dict[str, Any]:
         
         return {
             "status": "success",
-            "meeting_info": response.dict(),
+            "meeting_info": apply_meeting_time(response.dict(), email_content),
             "extracted_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
         }
     except Exception as e:
@@ -71,6 +108,7 @@ class EmailClassificationResponseModel(BaseModel):
     category: str = Field(description="Classified category of the email: 'Task Creation', 'Meeting Schedule', or 'Both'")
 
 @tool
+@instrument_tool
 def classify_email(email_content: str) -> Dict[str, Any]:
     """
     Classifies the email content into categories: 'Task Creation', 'Meeting Schedule', or 'Both'.
@@ -81,6 +119,7 @@ def classify_email(email_content: str) -> Dict[str, Any]:
     Returns:
         Dict containing classification result and status
     """
+    email_content = preprocess_email(email_content)
     try:
         query = (
             "Analyze the given email content and classify it into one of the following categories: "
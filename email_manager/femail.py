@@ -1,13 +1,20 @@
 from typing import Dict, Any
 import os
+import sys
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
 from groq import Groq
 import instructor
 
+# Share the repo-wide call metrics when run from this directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from metrics import groq_http_client
+from llm_cache import cached_client
+from email_manager.preprocess import preprocess_email
+
 # Initialize Groq client
 os.environ["GROQ_API_KEY"] = os.environ["GROQ_API_KEY"]
-client = instructor.from_groq(Groq(), mode=instructor.Mode.JSON)
+client = cached_client(instructor.from_groq(Groq(http_client=groq_http_client()), mode=instructor.Mode.JSON))
 
 class MeetingInfoResponseModel(BaseModel):
     date: str = Field(description="Extracted date of the meeting in YYYY-MM-DD format")
@@ -92,6 +99,7 @@ def extract_meeting_info(email_content: str) -> Dict[str, Any]:
         return {"status": "error", "message": str(e)}
 
 def process_email(email_content: str) -> Dict[str, Any]:
+    email_content = preprocess_email(email_content)
     classification = classify_email(email_content)
     category = classification.get("category", "Unknown")
     
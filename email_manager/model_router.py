@@ -0,0 +1,153 @@
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, Optional, List, Callable, Awaitable
+from metrics import registry
+
+# Groq model behind each tier, smallest first; a rejected answer escalates to the next tier
+MODEL_TIERS = {
+    "small": os.getenv("GROQ_SMALL_MODEL", "llama-3.1-8b-instant"),
+    "large": os.getenv("GROQ_LARGE_MODEL", "llama-3.3-70b-versatile")
+}
+
+# Tool or response model name -> tier; EMAIL_MODEL_ROUTES (JSON) overrides entries
+DEFAULT_ROUTES = {
+    "classify_email": "small",
+    "analyze_email": "large",
+    "extract_meeting_info": "large",
+    "extract_task_info": "large"
+}
+
+ROUTING_CONFIG = {
+    "routes": {**DEFAULT_ROUTES, **json.loads(os.getenv("EMAIL_MODEL_ROUTES", "{}"))},
+    # Answers reporting a lower confidence than this are retried on the next tier
+    "escalation_threshold": float(os.getenv("EMAIL_ESCALATION_THRESHOLD", "0.7"))
+}
+
+def confident(threshold: float) -> Callable[[Any], bool]:
+    """Accepts a response whose confidence field, if it has one, reaches the threshold"""
+    def accept(response: Any) -> bool:
+        confidence = getattr(response, "confidence", None)
+        return confidence is None or confidence >= threshold
+    return accept
+
+class ModelRouter:
+    """Picks the model for each email tool and escalates rejected answers
+
+    A request goes to the tier its tool (or, failing that, its response
+    model) is routed to, large when neither is listed. If that call raises
+    or the caller's accept() rejects the answer, the request is repeated on
+    the next larger tier. Latency is recorded per tier as "model_tier"
+    calls, and calls and escalations are counted per tool.
+    """
+
+    def __init__(self, tiers: Dict[str, str], routes: Dict[str, str]):
+        unknown = set(routes.values()) - set(tiers)
+        if unknown:
+            raise ValueError(f"Unknown model tiers in routes: {', '.join(sorted(unknown))}")
+        self.tiers = tiers
+        self.routes = routes
+        self._order: List[str] = list(tiers)
+        self._lock = threading.Lock()
+        self._calls: Dict[str, int] = {}
+        self._escalations: Dict[str, int] = {}
+
+    def tier_for(self, tool: str, response_model: Optional[type] = None) -> str:
+        tier = self.routes.get(tool)
+        if tier is None and response_model is not None:
+            tier = self.routes.get(response_model.__name__)
+        return tier or self._order[-1]
+
+    def _next_tier(self, tier: str) -> Optional[str]:
+        position = self._order.index(tier)
+        return self._order[position + 1] if position + 1 < len(self._order) else None
+
+    def _record(self, tool: str, tier: str, start: float, error: bool) -> None:
+        registry.observe("model_tier", tier, time.perf_counter() - start, error=error)
+        with self._lock:
+            self._calls[tool] = self._calls.get(tool, 0) + 1
+
+    def _escalate(self, tool: str, tier: str) -> Optional[str]:
+        """Helper method to count an escalation; returns the next tier, or None at the top"""
+        next_tier = self._next_tier(tier)
+        if next_tier is not None:
+            with self._lock:
+                self._escalations[tool] = self._escalations.get(tool, 0) + 1
+        return next_tier
+
+    def complete(
+        self,
+        create: Callable[..., Any],
+        tool: str,
+        request: Dict[str, Any],
+        accept: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """Sends a completion request on the routed tier, escalating as needed
+
+        Args:
+            create: chat.completions.create of the (instructor) client
+            tool: Routing key of the calling tool
+            request: create() keyword arguments, without model
+            accept: Tells whether an answer is good enough to keep; answers
+                from the largest tier are always kept
+
+        Returns:
+            The response of the last tier tried
+        """
+        tier = self.tier_for(tool, request.get("response_model"))
+        while True:
+            start = time.perf_counter()
+            try:
+                response = create(model=self.tiers[tier], **request)
+            except Exception:
+                self._record(tool, tier, start, True)
+                next_tier = self._escalate(tool, tier)
+                if next_tier is None:
+                    raise
+                tier = next_tier
+                continue
+            self._record(tool, tier, start, False)
+            if accept is None or accept(response) or self._next_tier(tier) is None:
+                return response
+            tier = self._escalate(tool, tier)
+
+    async def acomplete(
+        self,
+        create: Callable[..., Awaitable[Any]],
+        tool: str,
+        request: Dict[str, Any],
+        accept: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """Async version of complete()"""
+        tier = self.tier_for(tool, request.get("response_model"))
+        while True:
+            start = time.perf_counter()
+            try:
+                response = await create(model=self.tiers[tier], **request)
+            except Exception:
+                self._record(tool, tier, start, True)
+                next_tier = self._escalate(tool, tier)
+                if next_tier is None:
+                    raise
+                tier = next_tier
+                continue
+            self._record(tool, tier, start, False)
+            if accept is None or accept(response) or self._next_tier(tier) is None:
+                return response
+            tier = self._escalate(tool, tier)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns calls, escalations and the escalation rate per tool"""
+        with self._lock:
+            stats: Dict[str, Any] = {}
+            for tool, calls in self._calls.items():
+                escalations = self._escalations.get(tool, 0)
+                stats[f"{tool}_calls"] = calls
+                stats[f"{tool}_escalations"] = escalations
+                # Each escalation is one extra call, so requests = calls - escalations
+                stats[f"{tool}_escalation_rate"] = round(escalations / max(calls - escalations, 1), 4)
+        return stats
+
+model_router = ModelRouter(MODEL_TIERS, ROUTING_CONFIG["routes"])
+registry.register_gauges("model_router", model_router.metrics)
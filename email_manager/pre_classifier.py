@@ -0,0 +1,150 @@
+import os
+import re
+import threading
+from typing import Dict, Any, Optional, List, Tuple
+from email_manager.date_normalizer import MONTH_NAMES
+
+MEETING = "meeting"
+TASK = "task"
+BULK = "bulk"
+
+# Categories the email tools extract details for
+VALID_CATEGORIES = ("Task Creation", "Meeting Schedule", "Both")
+# Category used for newsletters and other bulk mail, which need no extraction
+OTHER_CATEGORY = "Other"
+
+PRE_CLASSIFIER_CONFIG = {
+    "enabled": os.getenv("EMAIL_PRECLASSIFIER_ENABLED", "true").lower() == "true",
+    "threshold": float(os.getenv("EMAIL_PRECLASSIFIER_THRESHOLD", "0.85")),
+    # A signal scoring at or below this counts as absent
+    "absent_below": float(os.getenv("EMAIL_PRECLASSIFIER_ABSENT_BELOW", "0.3"))
+}
+
+_DATE = (
+    r"(?:\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}(?:/\d{2,4})?"
+    r"|" + MONTH_NAMES + r" \d{1,2}"
+    r"|\d{1,2} " + MONTH_NAMES +
+    r"|(?:mon|tues|wednes|thurs|fri|satur|sun)day|tomorrow|today|tonight|(?:end of|this|next) (?:day|week|month))"
+)
+_TIME = r"(?:\d{1,2}:\d{2}\s*(?:am|pm)?|\d{1,2}\s*(?:am|pm))"
+
+class Rule:
+    """One keyword or regex signal for a label
+
+    Args:
+        label: MEETING, TASK or BULK
+        pattern: Regular expression, matched case-insensitively
+        weight: Probability-like strength of the signal on its own (0-1)
+        name: Identifier reported in the match list (default: the pattern)
+    """
+
+    def __init__(self, label: str, pattern: str, weight: float, name: Optional[str] = None):
+        self.label = label
+        self.pattern = re.compile(pattern, re.IGNORECASE)
+        self.weight = weight
+        self.name = name or pattern
+
+    def matches(self, text: str) -> bool:
+        return self.pattern.search(text) is not None
+
+def keyword_rule(label: str, keywords: List[str], weight: float, name: Optional[str] = None) -> Rule:
+    """Builds a rule matching any of the keywords as whole words"""
+    pattern = r"\b(?:" + "|".join(re.escape(keyword) for keyword in keywords) + r")\b"
+    return Rule(label, pattern, weight, name or keywords[0])
+
+DEFAULT_RULES = [
+    # Calendar invites
+    Rule(MEETING, r"BEGIN:VCALENDAR|METHOD:REQUEST|text/calendar", 0.97, "ics"),
+    Rule(MEETING, r"(?m)^subject:\s*(?:updated )?invitation:", 0.95, "invitation subject"),
+    Rule(MEETING, r"\b(?:zoom\.us/j|meet\.google\.com|teams\.microsoft\.com|webex\.com)\b", 0.8, "video link"),
+    Rule(MEETING, r"\b(?:meeting|call|sync|stand-?up|1:1|one-on-one|interview|demo)\b[^.\n]{0,60}\b(?:on|at)\b[^.\n]{0,20}" + _TIME, 0.9, "meeting at time"),
+    keyword_rule(MEETING, ["meeting", "call", "sync", "stand-up", "standup", "catch up", "get together"], 0.45),
+    keyword_rule(MEETING, ["schedule a", "scheduled for", "reschedule", "calendar invite", "join us", "agenda"], 0.55),
+    # Requests with a deadline
+    Rule(TASK, r"\b(?:please|kindly|could you|can you|need you to)\b[^.\n]{0,80}\b(?:by|before|no later than|until)\s+(?:the\s+)?" + _DATE, 0.93, "request by date"),
+    Rule(TASK, r"\b(?:deadline|due(?: date)?)\b[^.\n]{0,20}" + _DATE, 0.85, "deadline date"),
+    keyword_rule(TASK, ["action item", "action items", "to-do", "todo", "assigned to you", "deliverable"], 0.6),
+    keyword_rule(TASK, ["please complete", "please submit", "please review", "please prepare", "please send", "please finish"], 0.6),
+    keyword_rule(TASK, ["deadline", "due by", "due on"], 0.5),
+    # Newsletters and other bulk mail
+    Rule(BULK, r"(?m)^list-unsubscribe:", 0.9, "list-unsubscribe header"),
+    keyword_rule(BULK, ["unsubscribe", "manage your preferences", "email preferences"], 0.85),
+    keyword_rule(BULK, ["newsletter", "view in browser", "view this email in your browser", "weekly digest"], 0.7)
+]
+
+class PreClassifier:
+    """Rule-based classifier consulted before the LLM
+
+    Rules matching the email are combined per label with a noisy-OR,
+    1 - prod(1 - weight), giving a score for meetings, tasks and bulk mail.
+    A category is returned only when its own score(s) reach the threshold
+    and every competing signal is absent; anything else returns None so
+    the caller falls back to the LLM.
+    """
+
+    def __init__(self, rules: Optional[List[Rule]] = None, threshold: float = 0.85, absent_below: float = 0.3):
+        self.rules = list(DEFAULT_RULES if rules is None else rules)
+        self.threshold = threshold
+        self.absent_below = absent_below
+        self._lock = threading.Lock()
+        self._stats = {"checked": 0, "bypassed": 0}
+        self._by_category: Dict[str, int] = {}
+
+    def add_rule(self, rule: Rule) -> None:
+        self.rules.append(rule)
+
+    def score(self, text: str) -> Tuple[Dict[str, float], List[str]]:
+        """Returns the per-label scores and the names of the matching rules"""
+        misses = {MEETING: 1.0, TASK: 1.0, BULK: 1.0}
+        matched = []
+        for rule in self.rules:
+            if rule.matches(text):
+                misses[rule.label] *= 1 - rule.weight
+                matched.append(rule.name)
+        return {label: round(1 - miss, 4) for label, miss in misses.items()}, matched
+
+    def _decide(self, scores: Dict[str, float]) -> Tuple[Optional[str], float]:
+        """Helper method to turn label scores into (category, confidence)"""
+        meeting, task, bulk = scores[MEETING], scores[TASK], scores[BULK]
+        absent = lambda score: score <= self.absent_below
+        if bulk >= self.threshold and absent(meeting) and absent(task):
+            return OTHER_CATEGORY, bulk
+        if not absent(bulk):
+            return None, 0.0
+        if meeting >= self.threshold and task >= self.threshold:
+            return "Both", min(meeting, task)
+        if meeting >= self.threshold and absent(task):
+            return "Meeting Schedule", meeting
+        if task >= self.threshold and absent(meeting):
+            return "Task Creation", task
+        return None, 0.0
+
+    def classify(self, text: str) -> Optional[Dict[str, Any]]:
+        """Classifies an email when the rules are confident enough
+
+        Args:
+            text: Email text, optionally including headers
+
+        Returns:
+            Dict with category, confidence and matched rule names, or None
+            when the LLM should decide
+        """
+        scores, matched = self.score(text)
+        category, confidence = self._decide(scores)
+        with self._lock:
+            self._stats["checked"] += 1
+            if category is not None:
+                self._stats["bypassed"] += 1
+                self._by_category[category] = self._by_category.get(category, 0) + 1
+        if category is None:
+            return None
+        return {"category": category, "confidence": confidence, "rules": matched}
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns how many emails were checked and how many skipped the LLM, per category"""
+        with self._lock:
+            stats = dict(self._stats)
+            for category, count in self._by_category.items():
+                stats["bypassed_" + category.lower().replace(" ", "_")] = count
+        stats["bypass_rate"] = round(stats["bypassed"] / stats["checked"], 4) if stats["checked"] else 0.0
+        return stats
@@ -0,0 +1,212 @@
+import os
+import re
+import threading
+from html import unescape
+from datetime import date
+from typing import Dict, Any, Tuple
+from email_manager.date_normalizer import find_dates, find_times
+
+PREPROCESS_CONFIG = {
+    "enabled": os.getenv("EMAIL_PREPROCESS_ENABLED", "true").lower() == "true",
+    # Approximate prompt tokens an email body may use; 0 disables truncation
+    "token_budget": int(os.getenv("EMAIL_TOKEN_BUDGET", "1024"))
+}
+
+# Rough size of a token for English text; close enough to budget prompts without a tokenizer
+CHARS_PER_TOKEN = 4
+
+_HEADER_LINE = re.compile(r"^(?:subject|date|from|to|cc|sent):", re.IGNORECASE)
+_HEADER = re.compile(r"^([A-Za-z][A-Za-z-]*):\s*(.*)$")
+# A pasted header block must carry at least one of these to be split off
+_KNOWN_HEADERS = {"message-id", "in-reply-to", "references", "subject", "from", "to", "date"}
+
+# The start of quoted history; everything from here on is dropped
+_QUOTE_STARTS = [
+    re.compile(r"^on\b.{0,200}\bwrote:\s*$", re.IGNORECASE),
+    re.compile(r"^-{2,}\s*original message\s*-{2,}\s*$", re.IGNORECASE),
+    re.compile(r"^_{10,}\s*$")
+]
+# Outlook quotes a reply as a From:/Sent: header pair inside the body
+_OUTLOOK_FROM = re.compile(r"^from:\s", re.IGNORECASE)
+_OUTLOOK_SENT = re.compile(r"^(?:sent|date):\s", re.IGNORECASE)
+
+# A sign-off; what follows is only dropped when it all looks like a signature
+_SIGN_OFFS = [
+    re.compile(r"^(?:best|kind|warm)?\s*regards,?\s*$", re.IGNORECASE),
+    re.compile(r"^(?:thanks|thank you|cheers|best|sincerely|br)[,!.]?\s*$", re.IGNORECASE)
+]
+# The start of a signature delimiter or legal footer; everything from here on is dropped
+_FOOTER_STARTS = [
+    re.compile(r"^--\s*$"),
+    re.compile(r"^sent from my \w+", re.IGNORECASE),
+    re.compile(r"^(?:confidentiality notice|disclaimer)\b", re.IGNORECASE),
+    re.compile(r"^this (?:e-?mail|message)(?: and any attachments?)? (?:is|are|may contain)\b.{0,40}\bconfidential", re.IGNORECASE)
+]
+_CONTACT_LINE = re.compile(r"[\w.+-]+@[\w-]+\.\w|https?://|www\.|\+?\d[\d ().-]{6,}\d")
+
+# Signatures and footers are only looked for in the last few lines of the body
+_SIGNATURE_TAIL_LINES = 8
+# Longest line, in words, still read as a name or title rather than a sentence
+_SIGNATURE_LINE_WORDS = 6
+
+_SENTENCE = re.compile(r"[^.!?\n]+(?:[.!?]+|\n|$)")
+
+def html_to_text(html: str) -> str:
+    """Strips tags, scripts and styles from an HTML body, keeping line breaks"""
+    html = re.sub(r"(?is)<(script|style).*?</\1>", " ", html)
+    html = re.sub(r"(?i)<br\s*/?>|</p>|</div>|</tr>|</li>", "\n", html)
+    return unescape(re.sub(r"<[^>]+>", " ", html))
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+def split_headers(email_content: str) -> Tuple[Dict[str, str], str]:
+    """Splits a leading RFC 822 header block off pasted email text
+
+    Returns:
+        (lower-cased header name -> value, body); the headers are empty when
+        the text does not start with a header block
+    """
+    lines = email_content.replace("\r\n", "\n").split("\n")
+    headers: Dict[str, str] = {}
+    last = None
+    for position, line in enumerate(lines):
+        if not line.strip():
+            if headers.keys() & _KNOWN_HEADERS:
+                return headers, "\n".join(lines[position + 1:])
+            break
+        if line[:1] in " \t" and last:
+            headers[last] += " " + line.strip()
+            continue
+        match = _HEADER.match(line)
+        if not match:
+            break
+        last = match.group(1).lower()
+        headers[last] = match.group(2).strip()
+    return {}, email_content
+
+def strip_quoted(text: str) -> str:
+    """Drops quoted reply history: '>' lines and everything after an 'On ... wrote:', Original Message or Outlook From:/Sent: marker
+
+    A leading header block is kept as is, and a From:/Sent: pair only
+    counts as a quote marker once some body text has been seen.
+    """
+    _, body = split_headers(text)
+    kept = [text[:len(text) - len(body)].rstrip("\n")] if body is not text else []
+    has_body = False
+    lines = body.split("\n")
+    for position, line in enumerate(lines):
+        stripped = line.strip()
+        if any(pattern.match(stripped) for pattern in _QUOTE_STARTS):
+            break
+        if (has_body and _OUTLOOK_FROM.match(stripped) and position + 1 < len(lines)
+                and _OUTLOOK_SENT.match(lines[position + 1].strip())):
+            break
+        if stripped.startswith(">"):
+            continue
+        has_body = has_body or bool(stripped and not _HEADER_LINE.match(stripped))
+        kept.append(line)
+    return "\n".join(kept)
+
+def _signature_line(line: str) -> bool:
+    """Helper method to tell whether a line reads as part of a signature: blank, a contact line, or a short name or title"""
+    stripped = line.strip()
+    if not stripped or _CONTACT_LINE.search(stripped):
+        return True
+    return len(stripped.split()) <= _SIGNATURE_LINE_WORDS and not re.search(r"[.?!:;]$", stripped)
+
+def strip_signature(text: str) -> str:
+    """Drops a trailing signature block, sign-off or legal footer
+
+    A block is only dropped after some body text, and never when it
+    mentions a date or time, which may be what the email is about. After
+    a sign-off such as "Thanks!", every remaining line must look like a
+    signature, so instructions written after it are kept.
+    """
+    lines = text.rstrip().split("\n")
+    for position in range(max(len(lines) - _SIGNATURE_TAIL_LINES, 1), len(lines)):
+        stripped = lines[position].strip()
+        tail = lines[position + 1:]
+        footer = any(pattern.match(stripped) for pattern in _FOOTER_STARTS)
+        sign_off = any(pattern.match(stripped) for pattern in _SIGN_OFFS) and all(_signature_line(line) for line in tail)
+        if not (footer or sign_off):
+            continue
+        has_body = any(line.strip() and not _HEADER_LINE.match(line) for line in lines[:position])
+        if has_body and not _has_date("\n".join(tail)):
+            return "\n".join(lines[:position])
+    return "\n".join(lines)
+
+def collapse_whitespace(text: str) -> str:
+    """Collapses runs of spaces and blank lines, keeping single line breaks"""
+    lines = [" ".join(line.split()) for line in text.split("\n")]
+    return "\n".join(line for line in lines if line)
+
+def _has_date(sentence: str) -> bool:
+    dates, vague = find_dates(sentence, date.today())
+    return bool(dates) or vague or bool(find_times(sentence))
+
+def truncate_to_budget(text: str, token_budget: int) -> str:
+    """Cuts text down to about token_budget tokens
+
+    Header lines are always kept. Body sentences mentioning a date or time
+    come next, then the remaining sentences from the top, and the kept
+    sentences are put back in their original order.
+    """
+    if token_budget <= 0 or estimate_tokens(text) <= token_budget:
+        return text
+    lines = text.split("\n")
+    headers = [line for line in lines if _HEADER_LINE.match(line)]
+    body = "\n".join(line for line in lines if not _HEADER_LINE.match(line))
+    sentences = [match.group(0).strip() for match in _SENTENCE.finditer(body) if match.group(0).strip()]
+
+    budget = token_budget * CHARS_PER_TOKEN - sum(len(line) + 1 for line in headers)
+    order = sorted(range(len(sentences)), key=lambda index: (not _has_date(sentences[index]), index))
+    chosen = set()
+    for index in order:
+        cost = len(sentences[index]) + 1
+        if cost > budget:
+            continue
+        chosen.add(index)
+        budget -= cost
+    return "\n".join(headers + [" ".join(sentences[index] for index in sorted(chosen))])
+
+class EmailPreprocessor:
+    """Cleans an email before it is sent to the LLM
+
+    HTML is converted to text, quoted history, signatures and legal
+    footers are dropped, whitespace is collapsed and the result is cut to
+    the token budget, keeping date-bearing sentences first.
+    """
+
+    def __init__(self, token_budget: int = 1024):
+        self.token_budget = token_budget
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "tokens_in": 0, "tokens_out": 0, "truncated": 0}
+
+    def __call__(self, email_content: str) -> str:
+        text = email_content
+        if re.search(r"(?i)<(?:html|body|div|p|br|table)\b", text):
+            text = html_to_text(text)
+        text = collapse_whitespace(strip_signature(strip_quoted(text.replace("\r\n", "\n"))))
+        cleaned = truncate_to_budget(text, self.token_budget)
+        with self._lock:
+            self._stats["calls"] += 1
+            self._stats["tokens_in"] += estimate_tokens(email_content)
+            self._stats["tokens_out"] += estimate_tokens(cleaned)
+            self._stats["truncated"] += cleaned != text
+        return cleaned
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns estimated prompt tokens before and after preprocessing, and tokens saved"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["tokens_saved"] = stats["tokens_in"] - stats["tokens_out"]
+        return stats
+
+preprocessor = EmailPreprocessor(PREPROCESS_CONFIG["token_budget"])
+
+def preprocess_email(email_content: str) -> str:
+    """Cleans an email with the shared preprocessor, or returns it unchanged when disabled"""
+    if not PREPROCESS_CONFIG["enabled"]:
+        return email_content
+    return preprocessor(email_content)
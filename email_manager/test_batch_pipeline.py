@@ -0,0 +1,59 @@
+import json
+import mailbox
+from email.message import EmailMessage
+from email_manager.batch_pipeline import load_checkpoint, message_text, result_status, run_pipeline
+
+def _mbox(path, count):
+    box = mailbox.mbox(str(path))
+    for n in range(count):
+        message = EmailMessage()
+        message["Subject"] = f"Meeting {n}"
+        message["Message-ID"] = f"<m{n}@x>"
+        message["Date"] = "Mon, 2 Feb 2026 10:00:00 +0000"
+        message.set_content(f"Body {n}")
+        box.add(message)
+    box.close()
+
+def _records(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+def test_result_status():
+    assert result_status({"category": "Meeting Schedule", "meeting_info": {"status": "success"}}) == "success"
+    assert result_status({"category": "Other"}) == "success"
+    assert result_status({"category": "Unknown"}) == "error"
+    assert result_status({"category": "Both", "meeting_info": {"status": "error"}, "task_info": {"status": "success"}}) == "error"
+    assert result_status({"status": "error", "message": "boom"}) == "error"
+
+def test_message_text_keeps_subject_and_date():
+    message = EmailMessage()
+    message["Subject"] = "Sync"
+    message["Date"] = "Mon, 02 Feb 2026 10:00:00 +0000"
+    message.set_content("Let's meet tomorrow.")
+    assert message_text(message) == "Subject: Sync\nDate: Mon, 02 Feb 2026 10:00:00 +0000\n\nLet's meet tomorrow."
+
+def test_failed_results_are_errors_and_retried(tmp_path):
+    source, output = tmp_path / "box.mbox", tmp_path / "out.jsonl"
+    _mbox(source, 2)
+
+    counts = run_pipeline(str(source), str(output), workers=2, process=lambda text: {"category": "Unknown"}, dedup=False)
+    assert counts["failed"] == 2
+    assert {record["status"] for record in _records(output)} == {"error"}
+    assert load_checkpoint(str(output), retry_errors=True) == set()
+
+    counts = run_pipeline(
+        str(source), str(output), workers=2, process=lambda text: {"category": "Task Creation"},
+        retry_errors=True, dedup=False
+    )
+    assert (counts["processed"], counts["failed"]) == (2, 0)
+
+def test_checkpoint_skips_finished_messages(tmp_path):
+    source, output = tmp_path / "box.mbox", tmp_path / "out.jsonl"
+    _mbox(source, 3)
+    run_pipeline(str(source), str(output), process=lambda text: {"category": "Other"}, limit=2, dedup=False)
+    with open(output, "a", encoding="utf-8") as f:
+        f.write('{"key": "torn')
+
+    counts = run_pipeline(str(source), str(output), process=lambda text: {"category": "Other"}, dedup=False)
+    assert (counts["processed"], counts["skipped"]) == (1, 2)
+    assert load_checkpoint(str(output)) == {"<m0@x>", "<m1@x>", "<m2@x>"}
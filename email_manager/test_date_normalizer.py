@@ -0,0 +1,67 @@
+from datetime import date, datetime
+from email_manager.date_normalizer import (
+    apply_meeting_time,
+    find_dates,
+    find_times,
+    normalize_date,
+    normalize_time,
+    resolve_meeting_time
+)
+
+# A Saturday
+NOW = datetime(2026, 10, 17, 12, 0)
+
+def test_find_dates_forms():
+    anchor = NOW.date()
+    assert find_dates("on 2026-02-22", anchor)[0][0][1] == date(2026, 2, 22)
+    assert find_dates("on 2026/02/22", anchor)[0][0][1] == date(2026, 2, 22)
+    assert find_dates("on 22.02.2026", anchor)[0][0][1] == date(2026, 2, 22)
+    assert find_dates("on Feb. 22", anchor)[0][0][1] == date(2027, 2, 22)
+    assert find_dates("on 3 September", anchor)[0][0][1] == date(2027, 9, 3)
+    assert find_dates("on 10/20", anchor)[0][0][1] == date(2026, 10, 20)
+    assert find_dates("next Monday", anchor)[0][0][1] == date(2026, 10, 19)
+
+def test_find_dates_ignores_month_prefixes():
+    assert find_dates("Please decide 2 options", NOW.date()) == ([], False)
+    assert find_dates("Please separate 3 workstreams", NOW.date()) == ([], False)
+
+def test_find_dates_vague():
+    assert find_dates("sometime next week", NOW.date())[1]
+    assert find_dates("in March 2027", NOW.date())[1]
+
+def test_find_times():
+    assert find_times("at 3pm") == ["15:00"]
+    assert find_times("from 2-3 pm") == ["14:00"]
+    assert find_times("at 15:30 or noon") == ["15:30", "12:00"]
+
+def test_resolve_meeting_time_single_values():
+    assert resolve_meeting_time("Let's meet tomorrow at 3pm", NOW) == {"date": "2026-10-18", "time": "15:00"}
+    assert resolve_meeting_time("Meeting 22.02.2026 at 15:00", NOW) == {"date": "2026-02-22", "time": "15:00"}
+    assert resolve_meeting_time("Call 2026/02/22 at 3pm", NOW) == {"date": "2026-02-22", "time": "15:00"}
+
+def test_resolve_meeting_time_leaves_unparsed_fields_to_llm():
+    assert resolve_meeting_time("Let's meet on the 5th at 3pm", NOW) == {"time": "15:00"}
+    assert resolve_meeting_time("Sync at 1530 tomorrow", NOW) == {"date": "2026-10-18"}
+    assert resolve_meeting_time("half past three on Friday", NOW) == {"date": "2026-10-23"}
+    assert resolve_meeting_time("Let's catch up", NOW) == {}
+
+def test_resolve_meeting_time_ambiguous():
+    assert "date" not in resolve_meeting_time("Meet Monday or Tuesday at 3pm", NOW)
+    assert "date" not in resolve_meeting_time("Please send it by Friday. Meeting at 3pm", NOW)
+    assert "date" not in resolve_meeting_time("Let's meet next week", NOW)
+
+def test_resolve_meeting_time_uses_sent_date():
+    text = "Date: Mon, 2 Feb 2026 10:00:00 +0000\n\nLet's meet tomorrow at 10am"
+    assert resolve_meeting_time(text, NOW) == {"date": "2026-02-03", "time": "10:00"}
+
+def test_normalize():
+    assert normalize_date("Feb 22, 2026", NOW.date()) == "2026-02-22"
+    assert normalize_time("3:30 PM") == "15:30"
+    assert normalize_time("whenever") is None
+
+def test_apply_meeting_time():
+    info = apply_meeting_time({"date": "March 5, 2027", "time": "3 PM"}, "Let's meet on the 5th", NOW)
+    assert (info["date"], info["time"]) == ("2027-03-05", "15:00")
+    # Defaults only apply when the LLM left the field empty as well
+    info = apply_meeting_time({"date": "", "time": None}, "Let's catch up", NOW)
+    assert (info["date"], info["time"]) == ("2026-10-18", "09:00")
@@ -0,0 +1,73 @@
+import threading
+import pytest
+from email_manager.dedup import EmailDedupIndex, normalized_words, simhash, when_key
+
+INVITE = (
+    "Hi all,\nLet's meet on Monday at 3 PM in room 4 to review the Q3 launch plan and budget numbers. "
+    "Please bring the slides.\nThanks,\nAlice"
+)
+
+@pytest.fixture
+def index(tmp_path):
+    return EmailDedupIndex(str(tmp_path / "dedup.sqlite3"))
+
+def test_simhash_ignores_case_punctuation_and_spacing():
+    original = simhash(normalized_words(INVITE))
+    assert simhash(normalized_words(INVITE.upper().replace(". ", "!  "))) == original
+    other = simhash(normalized_words("The server is down, please restart the database cluster before noon today."))
+    assert bin(original ^ other).count("1") > 4
+    assert simhash(["too", "short"]) is None
+
+def test_when_key_ignores_send_date():
+    assert when_key("Monday at 3 PM") == when_key("see you monday, 3pm")
+    assert when_key("Monday at 3 PM") != when_key("Monday at 4 PM")
+
+def test_same_message_id(index):
+    key, duplicate = index.claim(INVITE, message_id="<a@x>")
+    assert duplicate is None
+    index.set_result(key, {"task": "T1"})
+    key, duplicate = index.claim(INVITE, message_id="<a@x>")
+    assert duplicate == {"duplicate_of": "<a@x>", "reason": "duplicate_id", "result": {"task": "T1"}}
+
+def test_forward_is_near_duplicate(index):
+    index.claim(INVITE, message_id="<a@x>")
+    forward = "FYI\n\n---------- Forwarded message ---------\nFrom: Alice <a@x.com>\nDate: Mon\nSubject: Q3\nTo: team\n\n" + INVITE
+    assert index.claim(forward, message_id="<f@x>")[1]["reason"] == "near_duplicate"
+
+def test_rescheduled_copy_is_new(index):
+    index.claim(INVITE, message_id="<a@x>")
+    assert index.claim(INVITE.replace("3 PM", "4 PM"), message_id="<g@x>")[1] is None
+
+def test_thread_replies(index):
+    index.claim(INVITE, message_id="<a@x>")
+    assert index.claim("+1\n\nOn Fri, Alice wrote:\n> Hi all", message_id="<c@x>", references="<a@x>")[1]["reason"] == "thread_duplicate"
+    assert index.claim("Tuesday instead?", message_id="<h@x>", references="<a@x>")[1] is None
+
+def test_release_lets_a_copy_run_again(index):
+    key, _ = index.claim(INVITE, message_id="<a@x>")
+    index.release(key)
+    assert index.claim(INVITE, message_id="<a@x>")[1] is None
+
+def test_unfinished_claim_returns_no_result(index):
+    key, _ = index.claim(INVITE, message_id="<a@x>")
+    _, duplicate = index.claim(INVITE, message_id="<a@x>")
+    # Callers treat a self-match without a result as new
+    assert duplicate["duplicate_of"] == key and duplicate["result"] is None
+
+def test_key_without_message_id(index):
+    key, _ = index.claim("Same body for the weekly report here", subject="Report")
+    assert key.startswith("sha256:")
+    assert index.claim("Same body for the weekly report here", subject="Re: Report")[1]["reason"] == "duplicate_id"
+
+def test_concurrent_claims(index):
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(index.claim("concurrent same body text for everyone here")[1]))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sum(result is None for result in results) == 1
+    assert index.metrics()["indexed"] == 1
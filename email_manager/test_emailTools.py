@@ -0,0 +1,54 @@
+import asyncio
+import os
+import pytest
+
+# The tools build their Groq client at import time
+for module in ("groq", "instructor", "smolagents"):
+    pytest.importorskip(module)
+os.environ.setdefault("GROQ_API_KEY", "test")
+
+from email_manager import emailTools
+from email_manager import async_emailTools
+
+CLASSIFICATION = {"status": "success", "classification": {"category": "Task Creation"}}
+
+def _analysis(category):
+    return emailTools.EmailAnalysisResponseModel.model_construct(category=category, meeting_info=None, task_info=None)
+
+@pytest.fixture
+def llm(monkeypatch):
+    calls = []
+
+    def record(name, result):
+        def call(*args, **kwargs):
+            calls.append(name)
+            return result
+        return call
+
+    def record_async(name, result):
+        async def call(*args, **kwargs):
+            calls.append(name)
+            return result
+        return call
+
+    for module, wrap in ((emailTools, record), (async_emailTools, record_async)):
+        monkeypatch.setattr(module, "_pre_classify", lambda email_content: None)
+        monkeypatch.setattr(module, "_classify_with_llm", wrap("classify", CLASSIFICATION))
+        monkeypatch.setattr(module, "_extract_task_info", wrap("task", {"status": "success"}))
+        monkeypatch.setattr(module, "_extract_meeting_info", wrap("meeting", {"status": "success"}))
+    return calls
+
+def test_unknown_combined_category_falls_back_to_classifier(llm, monkeypatch):
+    monkeypatch.setattr(emailTools, "_analyze_email", lambda email_content: _analysis("Newsletter"))
+    result = emailTools.process_email("Please send the report by Friday.")
+    assert result["category"] == "Task Creation"
+    assert llm == ["classify", "task"]
+
+def test_unknown_combined_category_falls_back_to_classifier_async(llm, monkeypatch):
+    async def create(tool, request):
+        return _analysis("Newsletter")
+
+    monkeypatch.setattr(async_emailTools, "_create", create)
+    result = asyncio.run(async_emailTools.process_email("Please send the report by Friday."))
+    assert result["category"] == "Task Creation"
+    assert llm == ["classify", "task"]
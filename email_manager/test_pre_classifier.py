@@ -0,0 +1,37 @@
+from email_manager.pre_classifier import PreClassifier, Rule, MEETING, OTHER_CATEGORY
+
+def test_calendar_invite_is_a_meeting():
+    result = PreClassifier().classify("Subject: Invitation: Design review @ Tue 10am\n\nBEGIN:VCALENDAR\nMETHOD:REQUEST")
+    assert result["category"] == "Meeting Schedule"
+
+def test_header_rules_match_on_any_line():
+    classifier = PreClassifier()
+    _, matched = classifier.score("From: news@shop.com\nSubject: Updated invitation: Sync\nList-Unsubscribe: <mailto:u@shop.com>\n\nHi")
+    assert "invitation subject" in matched
+    assert "list-unsubscribe header" in matched
+
+def test_bulk_mail_is_other():
+    result = PreClassifier().classify("From: news@shop.com\nList-Unsubscribe: <mailto:u@shop.com>\n\nOur weekly newsletter is here!")
+    assert result["category"] == OTHER_CATEGORY
+
+def test_request_with_deadline_is_a_task():
+    result = PreClassifier().classify("Subject: Report\n\nHi, please complete the quarterly report by March 5.")
+    assert result["category"] == "Task Creation"
+
+def test_month_prefixes_are_not_dates():
+    _, matched = PreClassifier().score("Please decide 2 options and separate 3 workstreams.")
+    assert "request by date" not in matched
+
+def test_meeting_and_task_is_both():
+    result = PreClassifier().classify("Let's have a meeting on Monday at 10:30 AM. Also, please submit the slides by Friday.")
+    assert result["category"] == "Both"
+
+def test_ambiguous_email_goes_to_the_llm():
+    assert PreClassifier().classify("Hey, how are things? Let's talk sometime.") is None
+
+def test_custom_rules_and_metrics():
+    classifier = PreClassifier(rules=[Rule(MEETING, r"\bstandup\b", 0.9, "standup")])
+    assert classifier.classify("Standup moved")["rules"] == ["standup"]
+    assert classifier.classify("Lunch?") is None
+    stats = classifier.metrics()
+    assert (stats["checked"], stats["bypassed"], stats["bypass_rate"]) == (2, 1, 0.5)
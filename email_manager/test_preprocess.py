@@ -0,0 +1,53 @@
+from email_manager.preprocess import (
+    EmailPreprocessor,
+    split_headers,
+    strip_quoted,
+    strip_signature,
+    truncate_to_budget
+)
+
+HEADERS = "Subject: Budget sync\nFrom: alice@x.com\nDate: Mon, 2 Feb 2026 10:00:00 +0000\n\n"
+
+def test_split_headers():
+    headers, body = split_headers(HEADERS + "Body text")
+    assert headers["subject"] == "Budget sync"
+    assert body == "Body text"
+    assert split_headers("Just a body") == ({}, "Just a body")
+
+def test_strip_quoted_keeps_leading_headers():
+    text = HEADERS + "Let us meet tomorrow at 3pm to review the budget."
+    assert "Let us meet tomorrow at 3pm" in strip_quoted(text)
+    assert strip_quoted(text).startswith("Subject: Budget sync")
+
+def test_strip_quoted_drops_history():
+    assert strip_quoted("Sounds good.\nOn Mon, Feb 2, 2026 Bob wrote:\n> old") == "Sounds good."
+    assert strip_quoted("Sounds good.\nFrom: Bob\nSent: Monday\nold") == "Sounds good."
+    assert strip_quoted("New line\n> quoted\nMore") == "New line\nMore"
+
+def test_strip_signature_drops_signature_block():
+    text = "Hi team,\nPlease prepare the Q3 report.\nThanks!\nBob Smith\nHead of Finance\nbob@acme.com\n+1 555 123 4567"
+    assert strip_signature(text) == "Hi team,\nPlease prepare the Q3 report."
+
+def test_strip_signature_keeps_text_after_sign_off():
+    text = "Hi team,\nPlease prepare the Q3 report.\nThanks!\nAlso include the revenue numbers and the hiring plan in it.\nBob"
+    assert strip_signature(text) == text
+
+def test_strip_signature_keeps_dates_and_bare_sign_offs():
+    assert strip_signature("Thanks!\nBob") == "Thanks!\nBob"
+    text = "Report attached.\n--\nSee you March 3 at 2pm"
+    assert strip_signature(text) == text
+
+def test_truncate_keeps_dated_sentences():
+    filler = " ".join(f"Filler sentence number {n} about nothing." for n in range(40))
+    text = "Subject: Launch\n" + filler + " The launch meeting is on March 3 at 2pm."
+    cut = truncate_to_budget(text, 40)
+    assert cut.startswith("Subject: Launch")
+    assert "The launch meeting is on March 3 at 2pm." in cut
+    assert len(cut) <= 40 * 4
+
+def test_preprocessor_metrics():
+    preprocessor = EmailPreprocessor(token_budget=1024)
+    preprocessor("<html><body><p>Hello</p><p>Please send the report.</p></body></html>")
+    stats = preprocessor.metrics()
+    assert stats["calls"] == 1
+    assert stats["tokens_saved"] == stats["tokens_in"] - stats["tokens_out"] > 0
@@ -7,6 +7,7 @@ from dotenv import load_dotenv
 # Import all tools from task_manager_functions
 from task_manager.task_manager_functions import (
     create_task,
+    create_tasks,
     update_task_status,
     get_tasks_by_status,
     send_reminders,
@@ -15,8 +16,10 @@ from task_manager.task_manager_functions import (
     generate_daily_report,
     update_task_priority,
     update_task_due_date,
+    update_task,
     get_task_details,
-    get_overdue_tasks
+    get_overdue_tasks,
+    get_upcoming_tasks
 )
 
 class TaskManagerAgent:
@@ -37,6 +40,7 @@ class TaskManagerAgent:
         # Define all available tools as a list
         self.tools = [
             create_task,
+            create_tasks,
             update_task_status,
             get_tasks_by_status,
             send_reminders,
@@ -45,8 +49,10 @@ class TaskManagerAgent:
             generate_daily_report,
             update_task_priority,
             update_task_due_date,
+            update_task,
             get_task_details,
-            get_overdue_tasks
+            get_overdue_tasks,
+            get_upcoming_tasks
         ]
         
         # Create the CodeAgent with tools
@@ -0,0 +1,205 @@
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from types import SimpleNamespace
+from typing import Dict, Any, Optional, List
+from metrics import registry
+
+LLM_CACHE_CONFIG = {
+    "enabled": os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true",
+    "path": os.getenv("LLM_CACHE_PATH", "llm_cache.sqlite3"),
+    "max_bytes": int(float(os.getenv("LLM_CACHE_MAX_MB", "64")) * 1024 * 1024),
+    # Bump to drop every cached result, e.g. after a prompt rewrite the schema does not reflect
+    "prompt_version": os.getenv("LLM_CACHE_PROMPT_VERSION", "1")
+}
+
+_QUOTE_MARKERS = re.compile(r"(?m)^[ \t>]+")
+_FORWARD_PREFIXES = re.compile(r"(?im)^(subject:\s*)(?:(?:fwd?|fw):\s*)+")
+
+def normalize_text(text: str) -> str:
+    """Canonical form of a prompt, so re-forwarded or re-wrapped copies of an email share a key
+
+    Quote markers and Fwd:/FW: subject prefixes are dropped and whitespace
+    runs collapse to one space.
+    """
+    text = _FORWARD_PREFIXES.sub(r"\1", _QUOTE_MARKERS.sub("", text))
+    return " ".join(text.split())
+
+class LLMCache:
+    """Content-addressed on-disk cache of structured LLM responses
+
+    Keys hash the normalized messages, the response model and its schema,
+    the model name, the request parameters and the prompt version, so any
+    change to what would be sent is a miss. Entries are evicted least
+    recently used first once the stored payloads exceed max_bytes. The
+    database runs in WAL mode with a busy timeout, so several processes
+    (the app, batch runs, the scheduler) can share one file.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 64 * 1024 * 1024, prompt_version: str = "1"):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.prompt_version = prompt_version
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, model TEXT, payload TEXT NOT NULL, size INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, last_used REAL NOT NULL, hits INTEGER NOT NULL DEFAULT 0)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+            self._conn.commit()
+        return self._conn
+
+    def key(self, model: str, response_model: type, messages: List[Dict[str, Any]], params: Dict[str, Any]) -> str:
+        """Content hash identifying one request"""
+        material = {
+            "version": self.prompt_version,
+            "model": model,
+            "response_model": response_model.__name__,
+            "schema": response_model.schema(),
+            "params": params,
+            "messages": [
+                {"role": message.get("role"), "content": normalize_text(str(message.get("content", "")))}
+                for message in messages
+            ]
+        }
+        return hashlib.sha256(json.dumps(material, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the cached JSON payload for a key, or None"""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT payload FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            conn.execute("UPDATE responses SET last_used = ?, hits = hits + 1 WHERE key = ?", (time.time(), key))
+            conn.commit()
+            self._stats["hits"] += 1
+            return row[0]
+
+    def put(self, key: str, model: str, payload: str) -> None:
+        """Stores a JSON payload, then evicts least recently used entries past max_bytes"""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, payload, size, created_at, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, payload, len(payload.encode("utf-8")), now, now)
+            )
+            self._stats["writes"] += 1
+            self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Helper method to trim the cache to 90% of max_bytes, oldest use first"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = self.max_bytes * 0.9
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_used").fetchall():
+            if total <= target:
+                break
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self._stats["evictions"] += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns this process's hit/miss counters and hit rate, plus the stored entries and bytes"""
+        with self._lock:
+            stats = dict(self._stats)
+            entries, size = self._connect().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["entries"] = entries
+        stats["bytes"] = size
+        return stats
+
+class CachedClient:
+    """Wraps an instructor client so chat.completions.create is served from an LLMCache
+
+    Only calls with a response_model are cached; anything else, and any
+    cached payload that no longer validates against the model, goes to
+    the wrapped client.
+    """
+
+    def __init__(self, client: Any, cache: LLMCache):
+        self._client = client
+        self.cache = cache
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, response_model: Optional[type] = None, messages: Optional[List[Dict[str, Any]]] = None, model: Optional[str] = None, **kwargs):
+        if response_model is None:
+            return self._client.chat.completions.create(messages=messages, model=model, **kwargs)
+        key = self.cache.key(model, response_model, messages or [], kwargs)
+        payload = self.cache.get(key)
+        if payload is not None:
+            try:
+                return response_model.parse_raw(payload)
+            except ValueError:
+                pass
+        response = self._client.chat.completions.create(response_model=response_model, messages=messages, model=model, **kwargs)
+        self.cache.put(key, model, response.json())
+        return response
+
+class AsyncCachedClient:
+    """CachedClient for an async instructor client; cache reads and writes run in a worker thread"""
+
+    def __init__(self, client: Any, cache: LLMCache):
+        self._client = client
+        self.cache = cache
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, response_model: Optional[type] = None, messages: Optional[List[Dict[str, Any]]] = None, model: Optional[str] = None, **kwargs):
+        if response_model is None:
+            return await self._client.chat.completions.create(messages=messages, model=model, **kwargs)
+        key = self.cache.key(model, response_model, messages or [], kwargs)
+        payload = await asyncio.to_thread(self.cache.get, key)
+        if payload is not None:
+            try:
+                return response_model.parse_raw(payload)
+            except ValueError:
+                pass
+        response = await self._client.chat.completions.create(response_model=response_model, messages=messages, model=model, **kwargs)
+        await asyncio.to_thread(self.cache.put, key, model, response.json())
+        return response
+
+_shared_cache: Optional[LLMCache] = None
+_shared_lock = threading.Lock()
+
+def get_cache() -> LLMCache:
+    """Process-wide cache configured by LLM_CACHE_CONFIG"""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = LLMCache(
+                LLM_CACHE_CONFIG["path"],
+                LLM_CACHE_CONFIG["max_bytes"],
+                LLM_CACHE_CONFIG["prompt_version"]
+            )
+            registry.register_gauges("llm_cache", _shared_cache.metrics)
+        return _shared_cache
+
+def cached_client(client: Any) -> Any:
+    """Returns the client wrapped with the shared cache, or unchanged when caching is disabled"""
+    if not LLM_CACHE_CONFIG["enabled"]:
+        return client
+    return CachedClient(client, get_cache())
+
+def cached_async_client(client: Any) -> Any:
+    """Async counterpart of cached_client, sharing the same cache"""
+    if not LLM_CACHE_CONFIG["enabled"]:
+        return client
+    return AsyncCachedClient(client, get_cache())
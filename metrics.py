@@ -0,0 +1,386 @@
+import asyncio
+import functools
+import json
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Dict, Any, Optional, List, Tuple, Callable
+import httpx
+
+# Upper bounds, in seconds, of the latency histogram buckets
+LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0]
+
+METRICS_CONFIG = {
+    "port": int(os.getenv("METRICS_PORT", "0")),
+    "dump_path": os.getenv("METRICS_DUMP_PATH"),
+    "dump_seconds": float(os.getenv("METRICS_DUMP_SECONDS", "60"))
+}
+
+# Notion/Groq object IDs in URL paths; collapsed so each endpoint is one series
+_ID_SEGMENT = re.compile(r"/[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}")
+
+class CallStats:
+    """Latency histogram, call and error counts and payload bytes for one call site"""
+
+    __slots__ = ("buckets", "count", "errors", "total_seconds", "max_seconds", "bytes_out", "bytes_in")
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.bytes_out = 0
+        self.bytes_in = 0
+
+    def quantile(self, q: float) -> float:
+        """Estimates a latency quantile as the upper bound of the bucket it falls in"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, hits in enumerate(self.buckets):
+            seen += hits
+            if seen >= rank:
+                return LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else self.max_seconds
+        return self.max_seconds
+
+class MetricsRegistry:
+    """Process-wide call metrics for tools and outbound Notion and Groq requests"""
+
+    def __init__(self):
+        self._stats: Dict[Tuple[str, str], CallStats] = {}
+        self._gauges: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(
+        self,
+        kind: str,
+        name: str,
+        seconds: float,
+        error: bool = False,
+        bytes_out: int = 0,
+        bytes_in: int = 0
+    ) -> None:
+        """Records one call
+
+        Args:
+            kind: Call family, e.g. "tool", "notion" or "groq"
+            name: Call site within the family, e.g. a tool or endpoint name
+            seconds: Wall-clock latency of the call
+            error: Whether the call failed
+            bytes_out: Request payload size
+            bytes_in: Response payload size
+        """
+        with self._lock:
+            stats = self._stats.get((kind, name))
+            if stats is None:
+                stats = self._stats[(kind, name)] = CallStats()
+            stats.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            stats.count += 1
+            stats.errors += bool(error)
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.bytes_out += bytes_out
+            stats.bytes_in += bytes_in
+
+    def register_gauges(self, prefix: str, read: Callable[[], Dict[str, Any]]) -> None:
+        """Exports the numeric values of a component's metrics() dict as gauges"""
+        self._gauges[prefix] = read
+
+    def snapshot(self) -> List[Tuple[str, str, CallStats]]:
+        """Returns (kind, name, stats) for every call site, sorted by kind and name"""
+        with self._lock:
+            return [(kind, name, self._copy(stats)) for (kind, name), stats in sorted(self._stats.items())]
+
+    @staticmethod
+    def _copy(stats: CallStats) -> CallStats:
+        copy = CallStats()
+        for field in CallStats.__slots__:
+            value = getattr(stats, field)
+            setattr(copy, field, list(value) if isinstance(value, list) else value)
+        return copy
+
+    def gauges(self) -> Dict[str, float]:
+        values = {}
+        for prefix, read in list(self._gauges.items()):
+            try:
+                for key, value in read().items():
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        values[f"{prefix}_{key}"] = value
+            except Exception as e:
+                print(f"Error reading {prefix} metrics: {str(e)}")
+        return values
+
+    def render_prometheus(self) -> str:
+        """Renders every metric in the Prometheus text exposition format"""
+        lines = [
+            "# TYPE call_latency_seconds histogram",
+            "# TYPE call_errors_total counter",
+            "# TYPE call_payload_bytes_total counter"
+        ]
+        for kind, name, stats in self.snapshot():
+            labels = f'kind="{kind}",name="{_escape(name)}"'
+            cumulative = 0
+            for bound, hits in zip(LATENCY_BUCKETS + ["+Inf"], stats.buckets):
+                cumulative += hits
+                lines.append(f'call_latency_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"call_latency_seconds_sum{{{labels}}} {stats.total_seconds}")
+            lines.append(f"call_latency_seconds_count{{{labels}}} {stats.count}")
+            lines.append(f"call_errors_total{{{labels}}} {stats.errors}")
+            lines.append(f'call_payload_bytes_total{{{labels},direction="out"}} {stats.bytes_out}')
+            lines.append(f'call_payload_bytes_total{{{labels},direction="in"}} {stats.bytes_in}')
+        for gauge, value in sorted(self.gauges().items()):
+            lines.append(f"# TYPE {gauge} gauge")
+            lines.append(f"{gauge} {value}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> str:
+        """Renders a table of call sites ordered by p99 latency, slowest first"""
+        rows = sorted(self.snapshot(), key=lambda row: row[2].quantile(0.99), reverse=True)
+        header = f"{'kind':<7}{'name':<45}{'calls':>7}{'errors':>7}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{'KB out':>9}{'KB in':>9}"
+        lines = [header, "-" * len(header)]
+        for kind, name, stats in rows:
+            lines.append(
+                f"{kind:<7}{name[:44]:<45}{stats.count:>7}{stats.errors:>7}"
+                f"{stats.quantile(0.5):>9.3f}{stats.quantile(0.95):>9.3f}{stats.quantile(0.99):>9.3f}{stats.max_seconds:>9.3f}"
+                f"{stats.bytes_out / 1024:>9.1f}{stats.bytes_in / 1024:>9.1f}"
+            )
+        for gauge, value in sorted(self.gauges().items()):
+            lines.append(f"{gauge}: {value}")
+        return "\n".join(lines)
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+def _payload_size(value: Any) -> int:
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+registry = MetricsRegistry()
+
+def instrument_tool(function: Callable) -> Callable:
+    """Records latency, errors and argument/result sizes for a tool function
+
+    Place it under @tool so smolagents still sees the original signature
+    and docstring. Tools report failures as {"status": "error"} rather than
+    raising, so those results count as errors too. Coroutine functions get
+    an async wrapper.
+    """
+    def record(start: float, args: tuple, kwargs: dict, result: Any, raised: bool) -> None:
+        registry.observe(
+            "tool",
+            function.__name__,
+            time.perf_counter() - start,
+            error=raised or (isinstance(result, dict) and result.get("status") == "error"),
+            bytes_out=_payload_size([args, kwargs]),
+            bytes_in=_payload_size(result)
+        )
+
+    if asyncio.iscoroutinefunction(function):
+        @functools.wraps(function)
+        async def async_wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = await function(*args, **kwargs)
+            except BaseException:
+                record(start, args, kwargs, None, True)
+                raise
+            record(start, args, kwargs, result, False)
+            return result
+        return async_wrapper
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        except BaseException:
+            record(start, args, kwargs, None, True)
+            raise
+        record(start, args, kwargs, result, False)
+        return result
+    return wrapper
+
+def endpoint_label(method: str, path: str) -> str:
+    """Series name for an HTTP call: method and path with object IDs collapsed"""
+    return f"{method} {_ID_SEGMENT.sub('/:id', path)}"
+
+def endpoint_name(request: httpx.Request) -> str:
+    return endpoint_label(request.method, request.url.path)
+
+class _CountingStream(httpx.SyncByteStream):
+    """Counts response bytes as they are read and records the call once the body is closed"""
+
+    def __init__(self, stream: httpx.SyncByteStream, done: Callable[[int], None]):
+        self._stream = stream
+        self._done = done
+        self._size = 0
+
+    def __iter__(self):
+        for chunk in self._stream:
+            self._size += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if self._done:
+                self._done(self._size)
+                self._done = None
+
+class _AsyncCountingStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, done: Callable[[int], None]):
+        self._stream = stream
+        self._done = done
+        self._size = 0
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            self._size += len(chunk)
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._done:
+                self._done(self._size)
+                self._done = None
+
+class MetricsTransport(httpx.BaseTransport):
+    """httpx transport that records every request it sends
+
+    Latency runs until the response body has been read, so it covers the
+    full download, and response bytes are counted off the wire.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        transport: Optional[httpx.BaseTransport] = None,
+        name: Callable[[httpx.Request], str] = endpoint_name
+    ):
+        self.kind = kind
+        self.transport = transport or httpx.HTTPTransport()
+        self.name = name
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        name = self.name(request)
+        bytes_out = int(request.headers.get("content-length", 0))
+        try:
+            response = self.transport.handle_request(request)
+        except Exception:
+            registry.observe(self.kind, name, time.perf_counter() - start, error=True, bytes_out=bytes_out)
+            raise
+        error = response.status_code >= 400
+        response.stream = _CountingStream(
+            response.stream,
+            lambda size: registry.observe(
+                self.kind, name, time.perf_counter() - start, error=error, bytes_out=bytes_out, bytes_in=size
+            )
+        )
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+class AsyncMetricsTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of MetricsTransport"""
+
+    def __init__(
+        self,
+        kind: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        name: Callable[[httpx.Request], str] = endpoint_name
+    ):
+        self.kind = kind
+        self.transport = transport or httpx.AsyncHTTPTransport()
+        self.name = name
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        name = self.name(request)
+        bytes_out = int(request.headers.get("content-length", 0))
+        try:
+            response = await self.transport.handle_async_request(request)
+        except Exception:
+            registry.observe(self.kind, name, time.perf_counter() - start, error=True, bytes_out=bytes_out)
+            raise
+        error = response.status_code >= 400
+        response.stream = _AsyncCountingStream(
+            response.stream,
+            lambda size: registry.observe(
+                self.kind, name, time.perf_counter() - start, error=error, bytes_out=bytes_out, bytes_in=size
+            )
+        )
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+def model_name(request: httpx.Request) -> str:
+    """Series name for LLM calls: endpoint plus the requested model"""
+    try:
+        model = json.loads(request.content).get("model", "?")
+    except Exception:
+        # Streaming or non-JSON body
+        model = "?"
+    return f"{endpoint_name(request)} {model}"
+
+def groq_http_client() -> httpx.Client:
+    """httpx client for Groq(http_client=...) that records every completion call"""
+    return httpx.Client(transport=MetricsTransport("groq", name=model_name), timeout=60.0)
+
+def async_groq_http_client() -> httpx.AsyncClient:
+    """httpx client for AsyncGroq(http_client=...) that records every completion call"""
+    return httpx.AsyncClient(transport=AsyncMetricsTransport("groq", name=model_name), timeout=60.0)
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = registry.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_http_server(port: int) -> HTTPServer:
+    """Serves the Prometheus text format on every GET path from a daemon thread"""
+    server = HTTPServer(("127.0.0.1", port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+def start_file_dump(path: str, interval_seconds: float) -> threading.Thread:
+    """Rewrites the Prometheus text dump at path every interval_seconds from a daemon thread"""
+    def run():
+        while True:
+            time.sleep(interval_seconds)
+            try:
+                tmp_path = path + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(registry.render_prometheus())
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"Error writing metrics dump: {str(e)}")
+
+    thread = threading.Thread(target=run, name="metrics-dump", daemon=True)
+    thread.start()
+    return thread
+
+def start_exporters() -> None:
+    """Starts the HTTP endpoint and/or file dump configured in METRICS_CONFIG"""
+    if METRICS_CONFIG["port"]:
+        start_http_server(METRICS_CONFIG["port"])
+    if METRICS_CONFIG["dump_path"]:
+        start_file_dump(METRICS_CONFIG["dump_path"], METRICS_CONFIG["dump_seconds"])
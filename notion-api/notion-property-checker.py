@@ -1,8 +1,8 @@
-import requests
 import os
 import json
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
+from notion_session import notion_request
 
 @dataclass
 class TaskPriority:
@@ -58,16 +58,8 @@ def get_database_properties(notion_token: str, database_id: str) -> Dict[str, An
     Returns:
         Dict[str, Any]: Database properties information
     """
-    headers = {
-        "Authorization": f"Bearer {notion_token}",
-        "Notion-Version": "2022-06-28",
-        "Content-Type": "application/json"
-    }
-    
-    url = f"https://api.notion.com/v1/databases/{database_id}"
-    
     try:
-        response = requests.get(url, headers=headers)
+        response = notion_request(notion_token, "GET", f"databases/{database_id}")
         if response.status_code != 200:
             print(f"❌ Failed to get database: {response.status_code}")
             print(f"   Error: {response.text}")
@@ -0,0 +1,95 @@
+import os
+import sys
+import threading
+import time
+from typing import Dict, Any
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+
+# Share the task manager's process-wide Notion rate limiter
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from task_manager.rate_limiter import notion_rate_limiter
+from metrics import registry, endpoint_label
+
+NOTION_API_URL = "https://api.notion.com/v1"
+NOTION_VERSION = "2022-06-28"
+
+# All traffic goes to one host, so a single pool with room for concurrent callers is enough
+POOL_CONNECTIONS = 1
+POOL_MAXSIZE = int(os.getenv("NOTION_POOL_MAXSIZE", "10"))
+REQUEST_TIMEOUT = float(os.getenv("NOTION_REQUEST_TIMEOUT", "30"))
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+def get_notion_session(notion_token: str) -> requests.Session:
+    """
+    Returns a keep-alive session for the Notion API, creating it on first use.
+
+    The standard Notion headers are set once on the session, and the
+    connection pool is reused across calls so pagination loops don't pay a
+    new TLS handshake per page.
+
+    Args:
+        notion_token (str): Your Notion integration token
+
+    Returns:
+        requests.Session: Session shared by every call made with this token
+    """
+    with _sessions_lock:
+        session = _sessions.get(notion_token)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({
+                "Authorization": f"Bearer {notion_token}",
+                "Notion-Version": NOTION_VERSION,
+                "Content-Type": "application/json",
+                "Accept-Encoding": "gzip, deflate, br",
+                "Connection": "keep-alive"
+            })
+            # Retries are handled by the rate limiter, not urllib3
+            adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=0)
+            session.mount("https://", adapter)
+            _sessions[notion_token] = session
+        return session
+
+def notion_request(notion_token: str, method: str, path: str, **kwargs: Any) -> requests.Response:
+    """
+    Sends a request to the Notion API over the pooled session.
+
+    Args:
+        notion_token (str): Your Notion integration token
+        method (str): HTTP method, e.g. "GET" or "POST"
+        path (str): Endpoint path relative to /v1, e.g. "search"
+        **kwargs: Extra arguments for requests, such as json
+
+    Returns:
+        requests.Response: The response, after rate limiting and retries
+    """
+    session = get_notion_session(notion_token)
+    url = f"{NOTION_API_URL}/{path.lstrip('/')}"
+    kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+    return notion_rate_limiter.call(
+        lambda: _timed_request(session, method, url, **kwargs),
+        discard=lambda response: response.close()
+    )
+
+def _timed_request(session: requests.Session, method: str, url: str, **kwargs: Any) -> requests.Response:
+    """Sends one attempt and records it in the shared call metrics"""
+    name = endpoint_label(method.upper(), urlparse(url).path)
+    start = time.perf_counter()
+    try:
+        response = session.request(method, url, **kwargs)
+    except Exception:
+        registry.observe("notion", name, time.perf_counter() - start, error=True)
+        raise
+    registry.observe(
+        "notion",
+        name,
+        time.perf_counter() - start,
+        error=response.status_code >= 400,
+        bytes_out=len(response.request.body or b""),
+        bytes_in=len(response.content)
+    )
+    return response
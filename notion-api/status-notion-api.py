@@ -1,7 +1,7 @@
-import requests
 import os
 import json
 from datetime import datetime
+from notion_session import notion_request
 
 def check_notion_access(notion_token):
     """
@@ -13,16 +13,10 @@ def check_notion_access(notion_token):
     Returns:
         dict: Summary of accessible content
     """
-    headers = {
-        "Authorization": f"Bearer {notion_token}",
-        "Notion-Version": "2022-06-28",
-        "Content-Type": "application/json"
-    }
-    
     # First, verify the token works at all with a simple users endpoint
     print("Step 1: Verifying API token...")
     try:
-        user_response = requests.get("https://api.notion.com/v1/users", headers=headers)
+        user_response = notion_request(notion_token, "GET", "users")
         if user_response.status_code == 200:
             print("✅ Authentication successful!")
             users = user_response.json()["results"]
@@ -37,8 +31,6 @@ def check_notion_access(notion_token):
     
     # Now search for ALL content (not filtering by type)
     print("\nStep 2: Searching for ALL accessible content...")
-    search_url = "https://api.notion.com/v1/search"
-    
     all_results = []
     start_cursor = None
     
@@ -49,7 +41,7 @@ def check_notion_access(notion_token):
             payload["start_cursor"] = start_cursor
             
         try:
-            response = requests.post(search_url, headers=headers, json=payload)
+            response = notion_request(notion_token, "POST", "search", json=payload)
             if response.status_code != 200:
                 print(f"❌ Search failed with status code: {response.status_code}")
                 print(f"   Error: {response.text}")
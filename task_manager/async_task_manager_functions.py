@@ -0,0 +1,651 @@
+"""Async counterparts of the task manager tools on a shared notion_client.AsyncClient
+
+Notion requests are issued on async_notion, so concurrent callers fan out
+on one event loop. Results are written through to the same page cache and
+task mirrors as the sync tools, and reads are served from a mirror while it
+is within its staleness bound.
+
+Three calls still run in a worker thread, because they block on local state
+shared with the sync tools rather than on a Notion request of their own:
+journal appends in write-behind mode (an fsync under the journal's lock),
+syncing a stale mirror (it pages through Notion with its own client while
+holding the mirror lock), and reloading the user directory when a lookup
+misses its cache (one reload at a time, behind the directory's load lock).
+"""
+import asyncio
+import heapq
+from itertools import chain, islice
+from typing import Dict, Any, Optional, List, Callable, Tuple
+from datetime import datetime, timedelta
+from notion_client import AsyncClient
+import httpx
+import os
+from dotenv import load_dotenv
+from task_manager.config import BULK_CONFIG, TaskPriority, TaskStatus, SystemMetadata
+from task_manager.task_mirror import TaskMirror
+from task_manager.task_record import Task
+from task_manager.task_shards import TaskShard
+from task_manager.notion_pagination import aiter_database_query
+from task_manager.report_engine import build_report
+from task_manager.rate_limiter import notion_rate_limiter, AsyncRateLimitedTransport
+from metrics import instrument_tool, AsyncMetricsTransport
+from task_manager.task_manager_functions import (
+    task_shards,
+    page_cache,
+    user_directory,
+    write_journal,
+    _by_due_date,
+    _by_priority_descending,
+    _shard_for_page,
+    _known_shard,
+    _shard_named,
+    _get_user_id as _sync_get_user_id,
+    _new_task_page,
+    _validate_task_spec,
+    _journal_create,
+    _journal_update,
+    _record_created_page,
+    _mirror_write,
+    _cached_task,
+    _task_update_properties
+)
+
+load_dotenv()
+NOTION_KEY = os.getenv("NOTION_KEY")
+current_user = SystemMetadata.CURRENT_USER
+
+# Shared async Notion client; every coroutine below reuses its connection pool
+async_notion = AsyncClient(
+    auth=NOTION_KEY,
+    client=httpx.AsyncClient(transport=AsyncRateLimitedTransport(notion_rate_limiter, AsyncMetricsTransport("notion")))
+)
+
+VALID_STATUSES = [getattr(TaskStatus, s) for s in dir(TaskStatus) if not s.startswith("_")]
+VALID_PRIORITIES = [getattr(TaskPriority, p) for p in dir(TaskPriority) if not p.startswith("_")]
+
+def _timestamp() -> str:
+    return datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+
+def _error(e: Exception) -> Dict[str, Any]:
+    return {
+        "status": "error",
+        "message": str(e),
+        "timestamp": _timestamp()
+    }
+
+async def _fresh_mirror(shard: TaskShard) -> Optional[TaskMirror]:
+    """Helper method to return a database's mirror once it is within its staleness bound
+
+    A stale mirror is synced in a worker thread; fresh mirrors are read
+    without leaving the event loop.
+
+    Returns:
+        The synced TaskMirror, or None if the mirror is disabled or could not
+        be synced, in which case callers fall back to a live Notion query
+    """
+    mirror = shard.mirror
+    if mirror is None:
+        return None
+    try:
+        if mirror.staleness() > mirror.max_staleness_seconds:
+            await asyncio.to_thread(mirror.ensure_fresh)
+        return mirror
+    except Exception as e:
+        print(f"Error syncing task mirror for {shard.name}: {str(e)}")
+        return None
+
+async def _query_tasks(
+    read_mirror: Callable[[TaskMirror], List[Task]],
+    filter: Optional[Dict[str, Any]] = None,
+    sorts: Optional[List[Dict[str, Any]]] = None,
+    key: Optional[Callable[[Task], Any]] = None,
+    limit: Optional[int] = None
+) -> List[Task]:
+    """Helper method to query every database concurrently and merge the Tasks on key
+
+    Like the sync _query_shards, each database is read from its mirror when
+    fresh, else queried live with the filter and sorts translated to its schema.
+    """
+    async def query(shard: TaskShard) -> List[Task]:
+        mirror = await _fresh_mirror(shard)
+        if mirror:
+            return read_mirror(mirror)[:limit]
+        return [
+            shard.parse(page)
+            async for page in aiter_database_query(
+                async_notion, shard.database_id, filter=shard.translate(filter), sorts=shard.translate(sorts), limit=limit
+            )
+        ]
+
+    per_shard = await asyncio.gather(*(query(shard) for shard in task_shards))
+    merged = heapq.merge(*per_shard, key=key) if key else chain.from_iterable(per_shard)
+    return list(islice(merged, limit))
+
+async def _create_page(page: Dict[str, Any], shard: TaskShard) -> Tuple[str, bool]:
+    """Helper method to create a task page, or journal it in write-behind mode
+
+    Either way the new task is recorded exactly as the sync tools record
+    it: with its database, in the page cache and in the task mirror.
+
+    Returns:
+        (task_id, True if the create was queued in the journal)
+    """
+    if write_journal:
+        return await asyncio.to_thread(_journal_create, page, shard), True
+    return _record_created_page(await async_notion.pages.create(**page), shard), False
+
+async def _update_page(task_id: str, properties: Dict[str, Any]) -> bool:
+    """Helper method to apply a property update, or journal it in write-behind mode
+
+    Mirrors the sync _write_properties: the cached page is dropped and the
+    page Notion returns is written through to the page cache and mirror.
+
+    Returns:
+        True if the update was queued in the journal rather than applied
+    """
+    page_cache.invalidate(task_id)
+    shard = _known_shard(task_id) or _shard_for_page(await async_notion.pages.retrieve(page_id=task_id))
+    properties = shard.translate_properties(properties)
+    if write_journal:
+        await asyncio.to_thread(_journal_update, task_id, properties)
+        return True
+    _mirror_write(await async_notion.pages.update(page_id=task_id, properties=properties))
+    return False
+
+async def _get_user_id(email: str) -> Optional[str]:
+    """Helper method to resolve an assignee, leaving the event loop only when the user directory must be consulted"""
+    return user_directory.cached_user_id(email) or await asyncio.to_thread(_sync_get_user_id, email)
+
+@instrument_tool
+async def create_task(
+    title: str,
+    description: str,
+    assignee: str,
+    due_date: str,
+    priority: str = TaskPriority.MEDIUM,
+    database: Optional[str] = None
+) -> Dict[str, Any]:
+    """Creates a new task in Notion database
+
+    Args:
+        title: The title of the task
+        description: Detailed description of the task
+        assignee: Email address of the person assigned to the task
+        due_date: Due date in YYYY-MM-DD format
+        priority: Task priority level (Urgent, High, Medium, Low)
+        database: Name of the team database to create the task in (default: the first configured database)
+
+    Returns:
+        Dict with task creation status and details
+    """
+    try:
+        if priority not in VALID_PRIORITIES:
+            priority = TaskPriority.MEDIUM
+
+        assignee_id = await _get_user_id(assignee)
+        if not assignee_id:
+            return {
+                "status": "error",
+                "message": f"Unknown assignee: {assignee}",
+                "timestamp": _timestamp()
+            }
+        shard = _shard_named(database)
+        task_id, queued = await _create_page(_new_task_page(title, description, assignee_id, due_date, priority, shard), shard)
+        return {
+            "status": "success",
+            "task_id": task_id,
+            "queued": queued,
+            "created_by": current_user,
+            "created_at": _timestamp()
+        }
+    except Exception as e:
+        return _error(e)
+
+@instrument_tool
+async def create_tasks(
+    tasks: List[Dict[str, Any]],
+    max_workers: Optional[int] = None
+) -> Dict[str, Any]:
+    """Creates many tasks in the Notion database concurrently
+
+    Args:
+        tasks: List of task specs, each a dict with title, due_date (YYYY-MM-DD) and optional description, assignee (email), priority and database
+        max_workers: Number of uploads in flight at once (default: BULK_CONFIG max_workers)
+
+    Returns:
+        Dict with per-task results in input order and success/failure counts
+    """
+    try:
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tasks)
+        pending = []
+        for index, spec in enumerate(tasks):
+            try:
+                pending.append((index, _validate_task_spec(spec)))
+            except ValueError as ve:
+                results[index] = {"index": index, "status": "error", "message": str(ve)}
+
+        emails = sorted({spec["assignee"] for _, spec in pending if spec["assignee"]})
+        ids = await asyncio.gather(*(_get_user_id(email) for email in emails))
+        assignee_ids = dict(zip(emails, ids))
+
+        semaphore = asyncio.Semaphore(max_workers or BULK_CONFIG["max_workers"])
+
+        async def upload(index: int, spec: Dict[str, Any]) -> None:
+            if spec["assignee"] and not assignee_ids[spec["assignee"]]:
+                results[index] = {"index": index, "status": "error", "message": f"Unknown assignee: {spec['assignee']}"}
+                return
+            shard = _shard_named(spec["database"])
+            page = _new_task_page(
+                spec["title"], spec["description"], assignee_ids.get(spec["assignee"]), spec["due_date"], spec["priority"], shard
+            )
+            async with semaphore:
+                try:
+                    task_id, queued = await _create_page(page, shard)
+                    results[index] = {"index": index, "status": "success", "task_id": task_id, "queued": queued}
+                except Exception as e:
+                    results[index] = {"index": index, "status": "error", "message": str(e)}
+
+        await asyncio.gather(*(upload(index, spec) for index, spec in pending))
+
+        created = sum(1 for result in results if result["status"] == "success")
+        return {
+            "status": "success" if created == len(tasks) else "partial" if created else "error",
+            "results": results,
+            "created": created,
+            "failed": len(tasks) - created,
+            "created_by": current_user,
+            "created_at": _timestamp()
+        }
+    except Exception as e:
+        return _error(e)
+
+@instrument_tool
+async def update_task_status(task_id: str, status: str) -> Dict[str, Any]:
+    """Updates the status of an existing task
+
+    Args:
+        task_id: The unique identifier of the task to update
+        status: New status value for the task (Blocked, Not Started, In Progress, Completed)
+
+    Returns:
+        Dict with update status and details
+    """
+    try:
+        if status not in VALID_STATUSES:
+            raise ValueError(f"Invalid status: {status}")
+
+        queued = await _update_page(task_id, {"Status": {"select": {"name": status}}})
+        return {
+            "status": "success",
+            "task_id": task_id,
+            "new_status": status,
+            "queued": queued,
+            "updated_by": current_user,
+            "updated_at": _timestamp()
+        }
+    except Exception as e:
+        return _error(e)
+
+@instrument_tool
+async def update_task_priority(task_id: str, priority: str) -> Dict[str, Any]:
+    """Updates the priority of an existing task
+
+    Args:
+        task_id: The unique identifier of the task to update
+        priority: New priority value for the task (Urgent, High, Medium, Low)
+
+    Returns:
+        Dict with update status and details
+    """
+    try:
+        if priority not in VALID_PRIORITIES:
+            raise ValueError(f"Invalid priority: {priority}")
+
+        queued = await _update_page(task_id, {"Priority": {"select": {"name": priority}}})
+        return {
+            "status": "success",
+            "task_id": task_id,
+            "new_priority": priority,
+            "queued": queued,
+            "updated_by": current_user,
+            "updated_at": _timestamp()
+        }
+    except Exception as e:
+        return _error(e)
+
+@instrument_tool
+async def update_task_due_date(task_id: str, due_date: str) -> Dict[str, Any]:
+    """Updates the due date of an existing task
+
+    Args:
+        task_id: The unique identifier of the task to update
+        due_date: New due date in YYYY-MM-DD format
+
+    Returns:
+        Dict with update status and details
+    """
+    try:
+        datetime.strptime(due_date, "%Y-%m-%d")
+    except ValueError:
+        return {
+            "status": "error",
+            "message": "Invalid date format. Use YYYY-MM-DD",
+            "timestamp": _timestamp()
+        }
+    try:
+        queued = await _update_page(task_id, {"Due Date": {"date": {"start": due_date}}})
+        return {
+            "status": "success",
+            "task_id": task_id,
+            "new_due_date": due_date,
+            "queued": queued,
+            "updated_by": current_user,
+            "updated_at": _timestamp()
+        }
+    except Exception as e:
+        return _error(e)
+
+@instrument_tool
+async def update_task(
+    task_id: str,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    due_date: Optional[str] = None
+) -> Dict[str, Any]:
+    """Updates several fields of an existing task in a single write
+
+    Args:
+        task_id: The unique identifier of the task to update
+        status: New status value for the task (Blocked, Not Started, In Progress, Completed)
+        priority: New priority value for the task (Urgent, High, Medium, Low)
+        due_date: New due date in YYYY-MM-DD format
+
+    Returns:
+        Dict with update status and the fields that were changed
+    """
+    try:
+        properties, updated_fields = _task_update_properties(status, priority, due_date)
+        queued = await _update_page(task_id, properties)
+        return {
+            "status": "success",
+            "task_id": task_id,
+            "updated_fields": updated_fields,
+            "queued": queued,
+            "updated_by": current_user,
+            "updated_at": _timestamp()
+        }
+    except Exception as e:
+        return _error(e)
+
+@instrument_tool
+async def get_tasks_by_status(status: str, limit: Optional[int] = None) -> Dict[str, Any]:
+    """Retrieves tasks filtered by status
+
+    Args:
+        status: Status value to filter tasks by (Blocked, Not Started, In Progress, Completed)
+        limit: Maximum number of tasks to return, soonest due first (default: all)
+
+    Returns:
+        Dict containing matching tasks and count
+    """
+    try:
+        if status not in VALID_STATUSES:
+            raise ValueError(f"Invalid status: {status}")
+
+        found = await _query_tasks(
+            lambda mirror: mirror.tasks_by_status(status),
+            filter={"property": "Status", "select": {"equals": status}},
+            sorts=[{"property": "Due Date", "direction": "ascending"}],
+            key=_by_due_date,
+            limit=limit
+        )
+        tasks = [task.summary() for task in found]
+        return {
+            "status": "success",
+            "tasks": tasks,
+            "count": len(tasks),
+            "queried_by": current_user,
+            "timestamp": _timestamp()
+        }
+    except Exception as e:
+        return _error(e)
+
+@instrument_tool
+async def get_tasks_by_priority(priority: str, limit: Optional[int] = None) -> Dict[str, Any]:
+    """Retrieves tasks filtered by priority level
+
+    Args:
+        priority: Priority level to filter tasks by (Urgent, High, Medium, Low)
+        limit: Maximum number of tasks to return, soonest due first (default: all)
+
+    Returns:
+        Dict containing matching tasks and count
+    """
+    try:
+        if priority not in VALID_PRIORITIES:
+            raise ValueError(f"Invalid priority: {priority}")
+
+        found = await _query_tasks(
+            lambda mirror: mirror.tasks_by_priority(priority),
+            filter={"property": "Priority", "select": {"equals": priority}},
+            sorts=[{"property": "Due Date", "direction": "ascending"}],
+            key=_by_due_date,
+            limit=limit
+        )
+        tasks = [task.summary() for task in found]
+        return {
+            "status": "success",
+            "tasks": tasks,
+            "count": len(tasks),
+            "queried_by": current_user,
+            "timestamp": _timestamp()
+        }
+    except Exception as e:
+        return _error(e)
+
+@instrument_tool
+async def get_tasks_by_date(date: str, limit: Optional[int] = None) -> Dict[str, Any]:
+    """Retrieves tasks for a specific date
+
+    Args:
+        date: Date in YYYY-MM-DD format
+        limit: Maximum number of tasks to return (default: all)
+
+    Returns:
+        Dict containing matching tasks and count
+    """
+    try:
+        datetime.strptime(date, "%Y-%m-%d")
+    except ValueError:
+        return {
+            "status": "error",
+            "message": "Invalid date format. Use YYYY-MM-DD",
+            "timestamp": _timestamp()
+        }
+    try:
+        found = await _query_tasks(
+            lambda mirror: mirror.tasks_by_date(date),
+            filter={"property": "Due Date", "date": {"equals": date}},
+            sorts=[{"property": "Priority", "direction": "descending"}],
+            key=_by_priority_descending,
+            limit=limit
+        )
+        tasks = [{**task.summary(), "due_date": date} for task in found]
+        return {
+            "status": "success",
+            "tasks": tasks,
+            "count": len(tasks),
+            "queried_by": current_user,
+            "timestamp": _timestamp()
+        }
+    except Exception as e:
+        return _error(e)
+
+@instrument_tool
+async def get_overdue_tasks(limit: Optional[int] = None) -> Dict[str, Any]:
+    """Retrieves all tasks that are past their due date and not completed
+
+    Args:
+        limit: Maximum number of tasks to return, most overdue first (default: all)
+
+    Returns:
+        Dict containing list of overdue tasks and count
+    """
+    try:
+        now = datetime.now()
+        found = await _query_tasks(
+            lambda mirror: [task for task, _ in mirror.due_index.overdue(now.date())],
+            filter={
+                "and": [
+                    {"property": "Due Date", "date": {"before": now.strftime("%Y-%m-%d")}},
+                    {"property": "Status", "select": {"does_not_equal": TaskStatus.COMPLETED}}
+                ]
+            },
+            sorts=[{"property": "Due Date", "direction": "ascending"}],
+            key=_by_due_date,
+            limit=limit
+        )
+        today_ordinal = now.date().toordinal()
+        overdue_tasks = [{
+            **task.summary(),
+            "days_overdue": today_ordinal - datetime.fromisoformat(task.due_date[:10]).toordinal()
+        } for task in found]
+        return {
+            "status": "success",
+            "overdue_tasks": overdue_tasks,
+            "count": len(overdue_tasks),
+            "queried_by": current_user,
+            "timestamp": _timestamp()
+        }
+    except Exception as e:
+        return _error(e)
+
+@instrument_tool
+async def get_upcoming_tasks(days: int = 7, limit: Optional[int] = None) -> Dict[str, Any]:
+    """Retrieves open tasks due between today and the given number of days from now
+
+    Args:
+        days: How many days ahead to look (default: 7)
+        limit: Maximum number of tasks to return, soonest first (default: all)
+
+    Returns:
+        Dict containing list of upcoming tasks and count
+    """
+    try:
+        today = datetime.now().date()
+        found = await _query_tasks(
+            lambda mirror: mirror.due_index.due_within(today, days),
+            filter={
+                "and": [
+                    {"property": "Due Date", "date": {"on_or_after": today.isoformat()}},
+                    {"property": "Due Date", "date": {"on_or_before": (today + timedelta(days=days)).isoformat()}},
+                    {"property": "Status", "select": {"does_not_equal": TaskStatus.COMPLETED}}
+                ]
+            },
+            sorts=[{"property": "Due Date", "direction": "ascending"}],
+            key=_by_due_date,
+            limit=limit
+        )
+        tasks = [task.summary() for task in found]
+        return {
+            "status": "success",
+            "tasks": tasks,
+            "count": len(tasks),
+            "days": days,
+            "queried_by": current_user,
+            "timestamp": _timestamp()
+        }
+    except Exception as e:
+        return _error(e)
+
+@instrument_tool
+async def send_reminders() -> Dict[str, Any]:
+    """Sends reminders for tasks due tomorrow
+
+    Returns:
+        Dict containing list of tasks due tomorrow and count
+    """
+    try:
+        due = datetime.now().date() + timedelta(days=1)
+        tomorrow = due.isoformat()
+        found = await _query_tasks(
+            lambda mirror: mirror.due_index.due_on(due),
+            filter={
+                "and": [
+                    {"property": "Due Date", "date": {"equals": tomorrow}},
+                    {"property": "Status", "select": {"does_not_equal": TaskStatus.COMPLETED}}
+                ]
+            }
+        )
+        reminders = [{
+            "task_id": task.id,
+            "title": task.title,
+            "assignee": task.assignee,
+            "assignees": task.assignee_emails.split(",") if task.assignee_emails else [],
+            "due_date": tomorrow,
+            "status": task.status
+        } for task in found]
+        return {
+            "status": "success",
+            "reminders": reminders,
+            "count": len(reminders),
+            "generated_by": current_user,
+            "timestamp": _timestamp()
+        }
+    except Exception as e:
+        return _error(e)
+
+@instrument_tool
+async def get_task_details(task_id: str) -> Dict[str, Any]:
+    """Retrieves detailed information about a specific task
+
+    Args:
+        task_id: The unique identifier of the task
+
+    Returns:
+        Dict containing detailed task information
+    """
+    try:
+        # Only the mirror of the database known to hold the task is synced
+        shard = _known_shard(task_id)
+        mirror = await _fresh_mirror(shard) if shard else None
+        mirrored = mirror.get_task(task_id) if mirror else None
+        task = _cached_task(task_id, mirrored)
+        cached = task is not None
+        if not cached:
+            task = mirrored
+            if task is None:
+                page = await async_notion.pages.retrieve(page_id=task_id)
+                task = _shard_for_page(page).parse(page)
+            page_cache.put(task)
+        return {
+            "status": "success",
+            "task": {**task.details(), "id": task_id},
+            "cached": cached,
+            "queried_by": current_user,
+            "timestamp": _timestamp()
+        }
+    except Exception as e:
+        return _error(e)
+
+@instrument_tool
+async def generate_daily_report() -> Dict[str, Any]:
+    """Generates a daily progress report of all tasks
+
+    Returns:
+        Dict containing task summary and breakdown by status/priority
+    """
+    try:
+        # Databases are scanned concurrently, so this takes as long as the slowest one
+        found = await _query_tasks(lambda mirror: mirror.all_tasks())
+        breakdown = build_report(found, datetime.now().date())
+        return {
+            "summary": breakdown["summary"],
+            "details": breakdown["details"],
+            "generated_by": current_user,
+            "generated_at": _timestamp(),
+            "priority_distribution": breakdown["priority_distribution"],
+            "due_distribution": breakdown["due_distribution"]
+        }
+    except Exception as e:
+        return _error(e)
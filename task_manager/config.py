@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+import json
 import os
 from datetime import datetime
 from dotenv import load_dotenv
@@ -27,6 +28,10 @@ class SystemMetadata:
 
 NOTION_CONFIG = {
     "database_id": os.getenv("NOTION_DATABASE_ID"),
+    # Team-sharded boards: JSON list of {"name", "database_id", "properties", "types"},
+    # where properties/types map task fields to that database's property names/types.
+    # Empty means the single database_id above with the schema below.
+    "databases": json.loads(os.getenv("NOTION_DATABASES", "[]")),
     "database_properties": {
         "Priority": {
             "select": {
@@ -55,6 +60,64 @@ NOTION_CONFIG = {
     }
 }
 
+QUERY_CONFIG = {
+    "page_size": int(os.getenv("NOTION_PAGE_SIZE", "100"))
+}
+
+FANOUT_CONFIG = {
+    "max_workers": int(os.getenv("NOTION_FANOUT_WORKERS", "8"))
+}
+
+MIRROR_CONFIG = {
+    "enabled": os.getenv("TASK_MIRROR_ENABLED", "true").lower() == "true",
+    "path": os.getenv("TASK_MIRROR_PATH", "task_mirror.sqlite3"),
+    "max_staleness_seconds": int(os.getenv("TASK_MIRROR_MAX_STALENESS", "60")),
+    "full_resync_seconds": int(os.getenv("TASK_MIRROR_FULL_RESYNC", "3600"))
+}
+
+USER_DIRECTORY_CONFIG = {
+    "ttl_seconds": int(os.getenv("NOTION_USERS_TTL", "3600")),
+    "negative_ttl_seconds": int(os.getenv("NOTION_USERS_NEGATIVE_TTL", "300"))
+}
+
+BULK_CONFIG = {
+    "max_workers": int(os.getenv("NOTION_BULK_WORKERS", "3"))
+}
+
+RATE_LIMIT_CONFIG = {
+    "requests_per_second": float(os.getenv("NOTION_RATE_LIMIT", "3")),
+    "burst": int(os.getenv("NOTION_RATE_BURST", "3")),
+    "max_retries": int(os.getenv("NOTION_MAX_RETRIES", "5")),
+    "base_delay_seconds": float(os.getenv("NOTION_RETRY_BASE_DELAY", "0.5")),
+    "max_delay_seconds": float(os.getenv("NOTION_RETRY_MAX_DELAY", "30"))
+}
+
+WRITE_BEHIND_CONFIG = {
+    "enabled": os.getenv("TASK_WRITE_BEHIND", "false").lower() == "true",
+    "path": os.getenv("TASK_JOURNAL_PATH", "task_journal.jsonl"),
+    "retry_seconds": float(os.getenv("TASK_JOURNAL_RETRY_SECONDS", "5")),
+    # How long provisional pending:<key> task IDs keep resolving after their create is applied
+    "resolved_ttl_seconds": float(os.getenv("TASK_JOURNAL_RESOLVED_TTL", "86400"))
+}
+
+PAGE_CACHE_CONFIG = {
+    "ttl_seconds": float(os.getenv("TASK_PAGE_CACHE_TTL", "300")),
+    "max_entries": int(os.getenv("TASK_PAGE_CACHE_SIZE", "1024"))
+}
+
+REMINDER_CONFIG = {
+    "lead_hours": [float(hours) for hours in os.getenv("REMINDER_LEAD_HOURS", "24,1").split(",")],
+    "due_hour": int(os.getenv("REMINDER_DUE_HOUR", "17")),
+    "batch_window_seconds": float(os.getenv("REMINDER_BATCH_WINDOW", "60")),
+    "refresh_seconds": float(os.getenv("REMINDER_REFRESH_SECONDS", "300")),
+    "delivery": os.getenv("REMINDER_DELIVERY", "stdout"),
+    "file_path": os.getenv("REMINDER_FILE_PATH", "reminders.jsonl"),
+    "smtp_host": os.getenv("REMINDER_SMTP_HOST", "localhost"),
+    "smtp_port": int(os.getenv("REMINDER_SMTP_PORT", "1025")),
+    "smtp_sender": os.getenv("REMINDER_SMTP_SENDER", "reminders@localhost"),
+    "sent_path": os.getenv("REMINDER_SENT_PATH", "reminders_sent.json")
+}
+
 def get_current_user():
     """Returns the current user's login"""
     return SystemMetadata.CURRENT_USER
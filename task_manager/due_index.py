@@ -0,0 +1,77 @@
+import threading
+from bisect import bisect_left, insort
+from datetime import date
+from typing import Dict, Optional, List, Tuple, Iterable
+from task_manager.config import TaskStatus
+from task_manager.task_record import Task
+
+class DueDateIndex:
+    """In-process index of open tasks ordered by due date
+
+    Tasks are kept in a sorted list keyed by (due date ordinal, task id),
+    so "overdue", "due on" and "due within N days" are bisect range reads.
+    Completed and undated tasks are left out.
+    """
+
+    def __init__(self):
+        self._keys: List[Tuple[int, str]] = []
+        self._entries: Dict[str, Tuple[Tuple[int, str], Task]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _discard(self, task_id: str) -> None:
+        entry = self._entries.pop(task_id, None)
+        if entry is not None:
+            del self._keys[bisect_left(self._keys, entry[0])]
+
+    def upsert(self, task: Task) -> None:
+        """Adds, moves or drops a task after it was created, updated or synced"""
+        with self._lock:
+            self._discard(task.id)
+            if task.due_date and task.status != TaskStatus.COMPLETED:
+                key = (date.fromisoformat(task.due_date[:10]).toordinal(), task.id)
+                insort(self._keys, key)
+                self._entries[task.id] = (key, task)
+
+    def remove(self, task_id: str) -> None:
+        """Drops a task that was deleted or archived"""
+        with self._lock:
+            self._discard(task_id)
+
+    def get(self, task_id: str) -> Optional[Task]:
+        """Returns the indexed open task with this ID, if any"""
+        with self._lock:
+            entry = self._entries.get(task_id)
+        return entry[1] if entry else None
+
+    def load(self, tasks: Iterable[Task]) -> None:
+        """Replaces the index contents with the given tasks"""
+        with self._lock:
+            self._keys = []
+            self._entries = {}
+        for task in tasks:
+            self.upsert(task)
+
+    def _range(self, start: Optional[int], end: Optional[int]) -> List[Tuple[int, Task]]:
+        """Returns (due ordinal, task) pairs with start <= due < end"""
+        with self._lock:
+            lo = 0 if start is None else bisect_left(self._keys, (start, ""))
+            hi = len(self._keys) if end is None else bisect_left(self._keys, (end, ""))
+            return [(key[0], self._entries[key[1]][1]) for key in self._keys[lo:hi]]
+
+    def overdue(self, today: date) -> List[Tuple[Task, int]]:
+        """Returns open tasks due before today with their days overdue, most overdue first"""
+        today_ordinal = today.toordinal()
+        return [(task, today_ordinal - ordinal) for ordinal, task in self._range(None, today_ordinal)]
+
+    def due_on(self, day: date) -> List[Task]:
+        """Returns open tasks due on the given day"""
+        ordinal = day.toordinal()
+        return [task for _, task in self._range(ordinal, ordinal + 1)]
+
+    def due_within(self, today: date, days: int) -> List[Task]:
+        """Returns open tasks due from today through today + days, soonest first"""
+        ordinal = today.toordinal()
+        return [task for _, task in self._range(ordinal, ordinal + days + 1)]
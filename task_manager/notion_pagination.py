@@ -0,0 +1,124 @@
+from typing import Dict, Any, Optional, List, Iterator, AsyncIterator, Awaitable, Callable
+from task_manager.config import QUERY_CONFIG
+
+# Notion rejects list and query requests with a page_size above 100
+MAX_PAGE_SIZE = 100
+
+def iter_paginated(
+    list_fn: Callable[..., Dict[str, Any]],
+    page_size: Optional[int] = None,
+    limit: Optional[int] = None,
+    **kwargs: Any
+) -> Iterator[Dict[str, Any]]:
+    """Streams the results of any cursor-paginated Notion endpoint
+
+    Pages are fetched lazily, one response at a time, so callers that stop
+    iterating early never request the remaining pages.
+
+    Args:
+        list_fn: Endpoint method, e.g. client.databases.query or client.users.list
+        page_size: Rows requested per round trip, defaults to QUERY_CONFIG["page_size"]
+        limit: Maximum number of rows to yield, or None for all rows
+        **kwargs: Extra arguments passed to every call of list_fn
+
+    Yields:
+        Result objects in endpoint order
+    """
+    if limit is not None and limit <= 0:
+        return
+    page_size = min(page_size or QUERY_CONFIG["page_size"], MAX_PAGE_SIZE)
+    if limit is not None:
+        page_size = min(page_size, limit)
+
+    kwargs["page_size"] = page_size
+    yielded = 0
+    while True:
+        response = list_fn(**kwargs)
+        for result in response["results"]:
+            yield result
+            yielded += 1
+            if limit is not None and yielded >= limit:
+                return
+        if not response.get("has_more") or not response.get("next_cursor"):
+            return
+        kwargs["start_cursor"] = response["next_cursor"]
+
+def iter_database_query(
+    client: Any,
+    database_id: str,
+    filter: Optional[Dict[str, Any]] = None,
+    sorts: Optional[List[Dict[str, Any]]] = None,
+    page_size: Optional[int] = None,
+    limit: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """Streams the pages of a Notion database query across cursors
+
+    Args:
+        client: Notion client used to run the query
+        database_id: ID of the database to query
+        filter: Optional Notion filter object
+        sorts: Optional list of Notion sort objects
+        page_size: Rows requested per round trip, defaults to QUERY_CONFIG["page_size"]
+        limit: Maximum number of rows to yield, or None for all rows
+
+    Yields:
+        Page objects in query order
+    """
+    kwargs = {"database_id": database_id}
+    if filter:
+        kwargs["filter"] = filter
+    if sorts:
+        kwargs["sorts"] = sorts
+    return iter_paginated(client.databases.query, page_size=page_size, limit=limit, **kwargs)
+
+async def aiter_paginated(
+    list_fn: Callable[..., Awaitable[Dict[str, Any]]],
+    page_size: Optional[int] = None,
+    limit: Optional[int] = None,
+    **kwargs: Any
+) -> AsyncIterator[Dict[str, Any]]:
+    """Async counterpart of iter_paginated for notion_client.AsyncClient endpoints
+
+    Args:
+        list_fn: Async endpoint method, e.g. client.databases.query
+        page_size: Rows requested per round trip, defaults to QUERY_CONFIG["page_size"]
+        limit: Maximum number of rows to yield, or None for all rows
+        **kwargs: Extra arguments passed to every call of list_fn
+
+    Yields:
+        Result objects in endpoint order
+    """
+    if limit is not None and limit <= 0:
+        return
+    page_size = min(page_size or QUERY_CONFIG["page_size"], MAX_PAGE_SIZE)
+    if limit is not None:
+        page_size = min(page_size, limit)
+
+    kwargs["page_size"] = page_size
+    yielded = 0
+    while True:
+        response = await list_fn(**kwargs)
+        for result in response["results"]:
+            yield result
+            yielded += 1
+            if limit is not None and yielded >= limit:
+                return
+        if not response.get("has_more") or not response.get("next_cursor"):
+            return
+        kwargs["start_cursor"] = response["next_cursor"]
+
+def aiter_database_query(
+    client: Any,
+    database_id: str,
+    filter: Optional[Dict[str, Any]] = None,
+    sorts: Optional[List[Dict[str, Any]]] = None,
+    page_size: Optional[int] = None,
+    limit: Optional[int] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """Async counterpart of iter_database_query"""
+    kwargs = {"database_id": database_id}
+    if filter:
+        kwargs["filter"] = filter
+    if sorts:
+        kwargs["sorts"] = sorts
+    return aiter_paginated(client.databases.query, page_size=page_size, limit=limit, **kwargs)
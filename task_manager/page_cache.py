@@ -0,0 +1,56 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+from task_manager.task_record import Task
+
+class PageCache:
+    """Per-page cache of parsed tasks for detail lookups
+
+    Entries are served locally for ttl_seconds after they were stored.
+    A put never replaces an entry with an older copy of the page, judged by
+    last_edited_time, so a lagging read cannot undo a write that already
+    landed. The least recently used entries are dropped past max_entries.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Task]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def get(self, page_id: str) -> Optional[Task]:
+        """Returns the cached task if it is still fresh, else None"""
+        with self._lock:
+            entry = self._entries.get(page_id)
+            if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(page_id)
+            self._stats["hits"] += 1
+            return entry[1]
+
+    def put(self, task: Task) -> None:
+        """Stores a task unless a copy with a later last_edited_time is already cached"""
+        with self._lock:
+            entry = self._entries.get(task.id)
+            if entry and (entry[1].last_edited_time or "") > (task.last_edited_time or ""):
+                return
+            self._entries[task.id] = (time.monotonic(), task)
+            self._entries.move_to_end(task.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, page_id: str) -> None:
+        """Drops a page after a write to it was submitted"""
+        with self._lock:
+            if self._entries.pop(page_id, None) is not None:
+                self._stats["invalidations"] += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns hit, miss and invalidation counters and the current size"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        return stats
@@ -0,0 +1,215 @@
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Callable, Awaitable
+import httpx
+from task_manager.config import RATE_LIMIT_CONFIG
+
+# Status codes worth retrying: rate limited, or a transient server error
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header given either in seconds or as an HTTP date
+
+    Args:
+        value: Raw header value, or None if the header was absent
+
+    Returns:
+        Number of seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class NotionRateLimiter:
+    """Process-wide token bucket shared by every Notion call
+
+    Callers reserve a token before each request and sleep until their slot
+    comes up, which spreads bursts out to a steady `rate` requests per
+    second. A 429 pauses the whole bucket for its Retry-After, and 429/5xx
+    responses are retried with jittered exponential backoff.
+    """
+
+    def __init__(
+        self,
+        rate: float = 3.0,
+        burst: int = 3,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "throttled": 0,
+            "retries": 0,
+            "queue_depth": 0,
+            "max_queue_depth": 0,
+            "wait_seconds_total": 0.0
+        }
+
+    def _reserve(self) -> float:
+        """Takes a token and returns how long the caller must wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Tokens go negative while callers are queued for future slots
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            wait = max(wait, self._paused_until - now)
+            self._stats["requests"] += 1
+            if wait > 0:
+                self._stats["queue_depth"] += 1
+                self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], self._stats["queue_depth"])
+                self._stats["wait_seconds_total"] += wait
+            return wait
+
+    def _release(self) -> None:
+        with self._lock:
+            self._stats["queue_depth"] -= 1
+
+    def acquire(self) -> None:
+        """Blocks the calling thread until a request slot is available"""
+        wait = self._reserve()
+        if wait > 0:
+            try:
+                time.sleep(wait)
+            finally:
+                self._release()
+
+    async def aacquire(self) -> None:
+        """Waits without blocking the event loop until a request slot is available"""
+        wait = self._reserve()
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self._release()
+
+    def _retry_delay(self, response: Any, attempt: int) -> float:
+        """Works out how long to back off after a retryable response"""
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if response.status_code == 429:
+            with self._lock:
+                self._stats["throttled"] += 1
+                if retry_after is not None:
+                    self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+        if retry_after is not None:
+            return retry_after
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _should_retry(self, response: Any, attempt: int) -> bool:
+        if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= self.max_retries:
+            return False
+        with self._lock:
+            self._stats["retries"] += 1
+        return True
+
+    def call(self, send: Callable[[], Any], discard: Optional[Callable[[Any], None]] = None) -> Any:
+        """Sends a request through the limiter, retrying on 429 and 5xx
+
+        Works with any response object exposing status_code and headers,
+        so both requests and httpx responses can be passed through.
+
+        Args:
+            send: Zero-argument function that performs the request
+            discard: Optional function that releases a response being retried
+
+        Returns:
+            The first non-retryable response, or the last one once retries run out
+        """
+        attempt = 0
+        while True:
+            self.acquire()
+            response = send()
+            if not self._should_retry(response, attempt):
+                return response
+            delay = self._retry_delay(response, attempt)
+            if discard:
+                discard(response)
+            time.sleep(delay)
+            attempt += 1
+
+    async def acall(
+        self,
+        send: Callable[[], Awaitable[Any]],
+        discard: Optional[Callable[[Any], Awaitable[None]]] = None
+    ) -> Any:
+        """Async counterpart of call"""
+        attempt = 0
+        while True:
+            await self.aacquire()
+            response = await send()
+            if not self._should_retry(response, attempt):
+                return response
+            delay = self._retry_delay(response, attempt)
+            if discard:
+                await discard(response)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns request, throttling and queue-depth counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["paused_for"] = max(0.0, self._paused_until - time.monotonic())
+        return stats
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """httpx transport that sends every request through a NotionRateLimiter"""
+
+    def __init__(self, limiter: NotionRateLimiter, transport: Optional[httpx.BaseTransport] = None):
+        self.limiter = limiter
+        self.transport = transport or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.limiter.call(
+            lambda: self.transport.handle_request(request),
+            discard=lambda response: response.close()
+        )
+
+    def close(self) -> None:
+        self.transport.close()
+
+class AsyncRateLimitedTransport(httpx.AsyncBaseTransport):
+    """Async httpx transport that sends every request through a NotionRateLimiter"""
+
+    def __init__(self, limiter: NotionRateLimiter, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.limiter = limiter
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.limiter.acall(
+            lambda: self.transport.handle_async_request(request),
+            discard=lambda response: response.aclose()
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+notion_rate_limiter = NotionRateLimiter(
+    rate=RATE_LIMIT_CONFIG["requests_per_second"],
+    burst=RATE_LIMIT_CONFIG["burst"],
+    max_retries=RATE_LIMIT_CONFIG["max_retries"],
+    base_delay=RATE_LIMIT_CONFIG["base_delay_seconds"],
+    max_delay=RATE_LIMIT_CONFIG["max_delay_seconds"]
+)
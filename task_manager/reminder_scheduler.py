@@ -0,0 +1,271 @@
+import heapq
+import json
+import math
+import os
+import smtplib
+import threading
+from datetime import datetime, date, timedelta
+from email.message import EmailMessage
+from typing import Dict, Any, Optional, List, Tuple, Callable
+from task_manager.config import REMINDER_CONFIG
+from task_manager.task_mirror import TaskMirror
+from task_manager.task_record import Task
+
+# Delivery callable: (recipient, reminders) -> None, raising if the reminders were not delivered
+Delivery = Callable[[str, List[Dict[str, Any]]], None]
+
+def _due_at(due_date: str, due_hour: int) -> datetime:
+    """Local time a task falls due; date-only due dates fall due at due_hour"""
+    if len(due_date) > 10:
+        due = datetime.fromisoformat(due_date.replace("Z", "+00:00"))
+        return due.astimezone().replace(tzinfo=None) if due.tzinfo else due
+    return datetime.combine(date.fromisoformat(due_date), datetime.min.time()).replace(hour=due_hour)
+
+def _recipients(task: Task) -> List[str]:
+    """Every assignee email on the task, or the assignee name when Notion hides emails"""
+    if task.assignee_emails:
+        return task.assignee_emails.split(",")
+    return [task.assignee or "unassigned"]
+
+def _format_reminders(recipient: str, reminders: List[Dict[str, Any]]) -> str:
+    lines = [f"Reminder for {recipient}: {len(reminders)} task(s) due soon"]
+    for reminder in reminders:
+        lines.append(f"- {reminder['title']} ({reminder['priority']}, {reminder['status']}) due {reminder['due_date']}")
+    return "\n".join(lines)
+
+def deliver_stdout(recipient: str, reminders: List[Dict[str, Any]]) -> None:
+    """Prints the reminders batch"""
+    print(_format_reminders(recipient, reminders))
+
+class FileDelivery:
+    """Appends each reminders batch to a JSON-lines file"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def __call__(self, recipient: str, reminders: List[Dict[str, Any]]) -> None:
+        record = {
+            "recipient": recipient,
+            "reminders": reminders,
+            "sent_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+class SmtpDelivery:
+    """Sends each reminders batch as one email through an SMTP server
+
+    Meant for a local relay or stand-in such as `python -m aiosmtpd -n`;
+    no authentication or TLS is attempted.
+    """
+
+    def __init__(self, host: str, port: int, sender: str):
+        self.host = host
+        self.port = port
+        self.sender = sender
+
+    def __call__(self, recipient: str, reminders: List[Dict[str, Any]]) -> None:
+        if "@" not in recipient:
+            print(f"Skipping email reminders for {recipient}: no email address")
+            return
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = recipient
+        message["Subject"] = f"{len(reminders)} task(s) due soon"
+        message.set_content(_format_reminders(recipient, reminders))
+        with smtplib.SMTP(self.host, self.port) as smtp:
+            smtp.send_message(message)
+
+def get_delivery(name: str) -> Delivery:
+    """Builds the delivery named in REMINDER_CONFIG ("stdout", "file" or "smtp")"""
+    if name == "stdout":
+        return deliver_stdout
+    if name == "file":
+        return FileDelivery(REMINDER_CONFIG["file_path"])
+    if name == "smtp":
+        return SmtpDelivery(REMINDER_CONFIG["smtp_host"], REMINDER_CONFIG["smtp_port"], REMINDER_CONFIG["smtp_sender"])
+    raise ValueError(f"Unknown reminder delivery: {name}")
+
+class ReminderScheduler:
+    """Long-running scheduler that sends reminders ahead of task due dates
+
+    Upcoming (due time - lead time) events are kept in a heap built from
+    the due-date indexes of the task mirrors, one per task database. The scheduler sleeps until the next
+    event or the next mirror refresh, whichever is sooner, so nothing is
+    queried between events beyond an incremental sync. Events falling
+    within the batch window are grouped into one notification per
+    assignee, and sent reminders are recorded on disk so restarts do not
+    send them again.
+    """
+
+    def __init__(
+        self,
+        mirrors: List[TaskMirror],
+        deliver: Delivery,
+        lead_hours: List[float],
+        due_hour: int = 17,
+        batch_window_seconds: float = 60.0,
+        refresh_seconds: float = 300.0,
+        sent_path: str = "reminders_sent.json"
+    ):
+        self.mirrors = mirrors
+        self.deliver = deliver
+        self.lead_hours = sorted(lead_hours)
+        self.due_hour = due_hour
+        self.batch_window = timedelta(seconds=batch_window_seconds)
+        self.refresh_seconds = refresh_seconds
+        self.sent_path = sent_path
+        self._heap: List[Tuple[datetime, str, int, str, float]] = []
+        self._sent: Dict[str, str] = self._load_sent()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._stats = {"notifications": 0, "reminders": 0, "deduplicated": 0, "failures": 0}
+
+    @staticmethod
+    def _key(task_id: str, due_date: str, lead: float) -> str:
+        return f"{task_id}|{due_date}|{lead:g}"
+
+    def _load_sent(self) -> Dict[str, str]:
+        if not os.path.exists(self.sent_path):
+            return {}
+        with open(self.sent_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_sent(self) -> None:
+        tmp_path = self.sent_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._sent, f)
+        os.replace(tmp_path, self.sent_path)
+
+    def reschedule(self) -> int:
+        """Rebuilds the event heap from the mirrors' open tasks
+
+        Returns:
+            Number of reminder events now scheduled
+        """
+        today = datetime.now().date()
+        horizon_days = math.ceil(self.lead_hours[-1] / 24) + 1
+        heap = []
+        for position, mirror in enumerate(self.mirrors):
+            mirror.ensure_fresh()
+            for task in mirror.due_index.due_within(today, horizon_days):
+                due_at = _due_at(task.due_date, self.due_hour)
+                for lead in self.lead_hours:
+                    key = self._key(task.id, task.due_date, lead)
+                    if key not in self._sent:
+                        heap.append((due_at - timedelta(hours=lead), key, position, task.id, lead))
+        heapq.heapify(heap)
+        self._heap = heap
+
+        # Forget sent reminders for due dates that have passed
+        cutoff = (today - timedelta(days=1)).isoformat()
+        stale = [key for key, due_date in self._sent.items() if due_date[:10] < cutoff]
+        if stale:
+            for key in stale:
+                del self._sent[key]
+            self._save_sent()
+        return len(heap)
+
+    def fire_due(self, now: Optional[datetime] = None) -> int:
+        """Sends every reminder whose time falls before now plus the batch window
+
+        Args:
+            now: Current local time (default: datetime.now())
+
+        Returns:
+            Number of notifications delivered
+        """
+        now = now or datetime.now()
+        batch: Dict[str, Tuple[Task, List[str]]] = {}
+        while self._heap and self._heap[0][0] <= now + self.batch_window:
+            _, key, position, task_id, lead = heapq.heappop(self._heap)
+            task = self.mirrors[position].due_index.get(task_id)
+            if task is None or key != self._key(task.id, task.due_date, lead):
+                # Completed, removed or rescheduled since the event was queued
+                continue
+            if _due_at(task.due_date, self.due_hour) <= now:
+                continue
+            if task_id in batch:
+                # A later start can make several lead times due at once; send one reminder
+                self._stats["deduplicated"] += 1
+                batch[task_id][1].append(key)
+            else:
+                batch[task_id] = (task, [key])
+
+        by_recipient: Dict[str, List[Task]] = {}
+        for task, _ in batch.values():
+            for recipient in _recipients(task):
+                by_recipient.setdefault(recipient, []).append(task)
+
+        delivered = 0
+        failed_tasks = set()
+        for recipient, tasks in by_recipient.items():
+            reminders = [task.summary() for task in sorted(tasks, key=lambda task: task.due_date)]
+            try:
+                self.deliver(recipient, reminders)
+            except Exception as e:
+                # Unsent events are picked up again by the next reschedule
+                print(f"Error delivering reminders to {recipient}: {str(e)}")
+                self._stats["failures"] += 1
+                failed_tasks.update(task.id for task in tasks)
+                continue
+            delivered += 1
+            self._stats["reminders"] += len(reminders)
+
+        for task, keys in batch.values():
+            if task.id not in failed_tasks:
+                for key in keys:
+                    self._sent[key] = task.due_date
+        if batch:
+            self._save_sent()
+        self._stats["notifications"] += delivered
+        return delivered
+
+    def notify_changed(self) -> None:
+        """Wakes the scheduler early after tasks were created or updated in this process"""
+        self._wake.set()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    def run(self) -> None:
+        """Runs until stop() is called"""
+        while not self._stop.is_set():
+            try:
+                self.reschedule()
+                self.fire_due()
+            except Exception as e:
+                print(f"Error running reminder scheduler: {str(e)}")
+            timeout = self.refresh_seconds
+            if self._heap:
+                until_next = (self._heap[0][0] - self.batch_window - datetime.now()).total_seconds()
+                timeout = min(timeout, max(until_next, 0))
+            self._wake.wait(timeout)
+            self._wake.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns delivery counters and the number of scheduled events"""
+        stats = dict(self._stats)
+        stats["scheduled"] = len(self._heap)
+        stats["sent_keys"] = len(self._sent)
+        return stats
+
+if __name__ == "__main__":
+    from task_manager.task_manager_functions import task_shards
+    mirrors = [shard.mirror for shard in task_shards if shard.mirror is not None]
+    if not mirrors:
+        raise SystemExit("The reminder scheduler needs the task mirror; set NOTION_DATABASE_ID and TASK_MIRROR_ENABLED=true")
+    scheduler = ReminderScheduler(
+        mirrors,
+        get_delivery(REMINDER_CONFIG["delivery"]),
+        REMINDER_CONFIG["lead_hours"],
+        due_hour=REMINDER_CONFIG["due_hour"],
+        batch_window_seconds=REMINDER_CONFIG["batch_window_seconds"],
+        refresh_seconds=REMINDER_CONFIG["refresh_seconds"],
+        sent_path=REMINDER_CONFIG["sent_path"]
+    )
+    try:
+        scheduler.run()
+    except KeyboardInterrupt:
+        scheduler.stop()
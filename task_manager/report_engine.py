@@ -0,0 +1,60 @@
+from typing import Dict, Any, List, Iterable
+from datetime import date, timedelta
+from task_manager.config import TaskStatus
+from task_manager.task_record import Task
+
+DUE_BUCKETS = ["overdue", "due_today", "due_this_week", "due_later", "no_due_date"]
+
+def _status_order() -> List[str]:
+    return [getattr(TaskStatus, s) for s in dir(TaskStatus) if not s.startswith("_")]
+
+def _due_bucket(due_date: str, today: date) -> str:
+    """Places a due date into one of DUE_BUCKETS relative to today"""
+    if not due_date:
+        return "no_due_date"
+    due = date.fromisoformat(due_date[:10])
+    if due < today:
+        return "overdue"
+    if due == today:
+        return "due_today"
+    if due <= today + timedelta(days=7):
+        return "due_this_week"
+    return "due_later"
+
+def build_report(tasks: Iterable[Task], today: date) -> Dict[str, Any]:
+    """Aggregates tasks into the daily report breakdowns in a single pass
+
+    Args:
+        tasks: Tasks from the task mirror or parsed from a database scan
+        today: Date the due buckets are computed against
+
+    Returns:
+        Dict with summary (count per status), details (tasks grouped by
+        status and ordered by due date), priority_distribution and
+        due_distribution
+    """
+    statuses = _status_order()
+    by_status = {status: [] for status in statuses}
+    priority_counts = {}
+    due_counts = {bucket: 0 for bucket in DUE_BUCKETS}
+
+    for task in tasks:
+        group = by_status.get(task.status)
+        if group is None:
+            continue
+        group.append(task.summary())
+        priority_counts[task.priority] = priority_counts.get(task.priority, 0) + 1
+        if task.status != TaskStatus.COMPLETED:
+            due_counts[_due_bucket(task.due_date, today)] += 1
+
+    details = []
+    for status in statuses:
+        # Undated tasks sort last, matching Notion's ascending date sort
+        details.extend(sorted(by_status[status], key=lambda summary: (summary["due_date"] is None, summary["due_date"] or "")))
+
+    return {
+        "summary": {status: len(by_status[status]) for status in statuses},
+        "details": details,
+        "priority_distribution": priority_counts,
+        "due_distribution": due_counts
+    }
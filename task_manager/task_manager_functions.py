@@ -1,26 +1,304 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Tuple
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+import heapq
 from smolagents import tool
 from notion_client import Client
+import httpx
 import os
 from dotenv import load_dotenv
-from task_manager.config import NOTION_CONFIG, TaskPriority, TaskStatus, SystemMetadata
+from task_manager.config import NOTION_CONFIG, MIRROR_CONFIG, USER_DIRECTORY_CONFIG, BULK_CONFIG, WRITE_BEHIND_CONFIG, PAGE_CACHE_CONFIG, FANOUT_CONFIG, TaskPriority, TaskStatus, SystemMetadata
+from task_manager.task_mirror import TaskMirror
+from task_manager.task_record import Task
+from task_manager.task_shards import TaskShard, load_shards, mirror_path
+from task_manager.notion_pagination import iter_database_query
+from task_manager.report_engine import build_report
+from task_manager.user_directory import UserDirectory
+from task_manager.rate_limiter import notion_rate_limiter, RateLimitedTransport
+from task_manager.write_journal import WriteJournal, PENDING_PREFIX
+from task_manager.page_cache import PageCache
+from metrics import registry, instrument_tool, MetricsTransport
 
 load_dotenv()
 NOTION_KEY = os.getenv("NOTION_KEY")
 database_id = NOTION_CONFIG["database_id"]
 current_user = SystemMetadata.CURRENT_USER
 
-# Initialize Notion client
-notion = Client(auth=NOTION_KEY)
+# Initialize Notion client; every request goes through the shared rate limiter
+notion = Client(
+    auth=NOTION_KEY,
+    client=httpx.Client(transport=RateLimitedTransport(notion_rate_limiter, MetricsTransport("notion")))
+)
+
+# Workspace users indexed by email, loaded on first lookup
+user_directory = UserDirectory(
+    notion,
+    ttl_seconds=USER_DIRECTORY_CONFIG["ttl_seconds"],
+    negative_ttl_seconds=USER_DIRECTORY_CONFIG["negative_ttl_seconds"]
+)
+
+# Every task database (one per team when sharded), each with its own local
+# read mirror, synced lazily on first read
+task_shards = load_shards()
+for shard in task_shards:
+    if MIRROR_CONFIG["enabled"] and shard.database_id:
+        shard.mirror = TaskMirror(
+            notion,
+            shard.database_id,
+            mirror_path(shard, len(task_shards)),
+            max_staleness_seconds=MIRROR_CONFIG["max_staleness_seconds"],
+            full_resync_seconds=MIRROR_CONFIG["full_resync_seconds"],
+            parse=shard.parse
+        )
+# Mirror of the first database, for callers that work with a single board
+task_mirror = task_shards[0].mirror
+
+# Shared pool that queries the databases concurrently
+shard_pool = ThreadPoolExecutor(max_workers=FANOUT_CONFIG["max_workers"], thread_name_prefix="task-shard")
+
+# Notion sorts select properties by their option order
+PRIORITY_RANK = {
+    option["name"]: rank
+    for rank, option in enumerate(NOTION_CONFIG["database_properties"]["Priority"]["select"]["options"])
+}
+
+def _by_due_date(task: Task):
+    # Undated tasks sort last, matching Notion's ascending date sort
+    return (task.due_date is None, task.due_date or "")
+
+def _by_priority_descending(task: Task):
+    rank = PRIORITY_RANK.get(task.priority)
+    return (rank is None, -(rank or 0))
+
+def _fresh_mirror(shard: TaskShard) -> Optional[TaskMirror]:
+    """Returns a database's mirror once it is within its staleness bound
+    
+    Returns:
+        The synced TaskMirror, or None if the mirror is disabled or could not
+        be synced, in which case callers fall back to a live Notion query
+    """
+    if shard.mirror is None:
+        return None
+    try:
+        shard.mirror.ensure_fresh()
+        return shard.mirror
+    except Exception as e:
+        print(f"Error syncing task mirror for {shard.name}: {str(e)}")
+        return None
+
+def _query_shards(
+    read_mirror: Callable[[TaskMirror], List[Task]],
+    filter: Optional[Dict[str, Any]] = None,
+    sorts: Optional[List[Dict[str, Any]]] = None,
+    key: Optional[Callable[[Task], Any]] = None,
+    limit: Optional[int] = None
+) -> List[Task]:
+    """Helper method to run one task query against every database and merge the results
+    
+    Each database is read from its mirror when fresh, else queried live with
+    the filter and sorts translated to its schema. Databases are queried
+    concurrently, so the call takes as long as the slowest one.
+    
+    Args:
+        read_mirror: Reads the matching tasks from a mirror, already ordered by key
+        filter: Notion filter written against the default schema
+        sorts: Notion sorts written against the default schema, matching key
+        key: Sort key the per-database results are merged on (default: concatenate)
+        limit: Maximum number of tasks to return
+        
+    Returns:
+        Matching tasks across all databases
+    """
+    def query(shard: TaskShard) -> List[Task]:
+        mirror = _fresh_mirror(shard)
+        if mirror:
+            return read_mirror(mirror)[:limit]
+        return list(map(shard.parse, iter_database_query(
+            notion,
+            shard.database_id,
+            filter=shard.translate(filter),
+            sorts=shard.translate(sorts),
+            limit=limit
+        )))
+
+    if len(task_shards) == 1:
+        per_shard = [query(task_shards[0])]
+    else:
+        per_shard = list(shard_pool.map(query, task_shards))
+    merged = heapq.merge(*per_shard, key=key) if key else chain.from_iterable(per_shard)
+    return list(islice(merged, limit))
+
+def _shard_for_page(page: Dict[str, Any]) -> TaskShard:
+    """Helper method to find the database a Notion page belongs to"""
+    if len(task_shards) > 1:
+        for shard in task_shards:
+            if shard.owns(page):
+                return shard
+    return task_shards[0]
+
+def _known_shard(task_id: str) -> Optional[TaskShard]:
+    """Helper method to find the database holding a task without calling Notion"""
+    if len(task_shards) == 1:
+        return task_shards[0]
+    if task_id in _created_in:
+        return _created_in[task_id]
+    for shard in task_shards:
+        if shard.mirror is not None and shard.mirror.get_task(task_id) is not None:
+            return shard
+    return None
+
+def _mirrored_task(task_id: str) -> Optional[Task]:
+    """Helper method to read a task from the fresh mirror of the database holding it
+    
+    Only that database's mirror is synced. When the database is not known
+    locally this returns None, and the caller retrieves the page instead of
+    syncing every mirror to find it.
+    """
+    shard = _known_shard(task_id)
+    mirror = _fresh_mirror(shard) if shard else None
+    return mirror.get_task(task_id) if mirror else None
+
+def _cached_task(task_id: str, mirrored: Optional[Task]) -> Optional[Task]:
+    """Helper method to return the cached task unless the fresh mirror row replaces it
+    
+    An edit the mirror picked up replaces the cached copy; last_edited_time
+    has minute precision, so the mirror row also wins ties.
+    """
+    task = page_cache.get(task_id)
+    if task is not None and mirrored is not None and (mirrored.last_edited_time or "") >= (task.last_edited_time or ""):
+        return None
+    return task
+
+def _shard_for_task(task_id: str) -> TaskShard:
+    """Helper method to find the database holding a task, retrieving the page only if it is not known locally"""
+    return _known_shard(task_id) or _shard_for_page(notion.pages.retrieve(page_id=task_id))
+
+def _shard_named(name: Optional[str]) -> TaskShard:
+    """Helper method to pick the database a new task goes to (default: the first)"""
+    if name is None:
+        return task_shards[0]
+    for shard in task_shards:
+        if shard.name == name:
+            return shard
+    raise ValueError(f"Unknown database: {name}")
+
+# Task or pending task ID -> database it was created in by this process
+_created_in: Dict[str, TaskShard] = {}
+
+def _record_created(task_id: str, shard: TaskShard) -> None:
+    if len(task_shards) > 1:
+        _created_in[task_id] = shard
+
+# Parsed pages served to get_task_details without a round trip while fresh
+page_cache = PageCache(
+    ttl_seconds=PAGE_CACHE_CONFIG["ttl_seconds"],
+    max_entries=PAGE_CACHE_CONFIG["max_entries"]
+)
+
+def _mirror_write(page: Dict[str, Any]) -> None:
+    """Writes a page returned by Notion through to the page cache and task mirror"""
+    shard = _shard_for_page(page)
+    page_cache.put(shard.parse(page))
+    if shard.mirror is None:
+        return
+    try:
+        shard.mirror.upsert_page(page)
+    except Exception as e:
+        print(f"Error updating task mirror: {str(e)}")
+
+# Optional write-behind mode: mutations are journaled locally and replayed in the background
+write_journal = WriteJournal(
+    notion,
+    WRITE_BEHIND_CONFIG["path"],
+    database_id,
+    retry_seconds=WRITE_BEHIND_CONFIG["retry_seconds"],
+    resolved_ttl_seconds=WRITE_BEHIND_CONFIG["resolved_ttl_seconds"],
+    on_applied=_mirror_write
+) if WRITE_BEHIND_CONFIG["enabled"] else None
+if write_journal and write_journal.pending_count():
+    write_journal.start()
+
+registry.register_gauges("notion_rate_limiter", notion_rate_limiter.metrics)
+registry.register_gauges("page_cache", page_cache.metrics)
+if write_journal:
+    registry.register_gauges("write_journal", lambda: {"pending": write_journal.pending_count()})
+
+def _write_properties(task_id: str, properties: Dict[str, Any]) -> bool:
+    """Applies a property update, or journals it in write-behind mode
+    
+    Returns:
+        True if the update was queued in the journal rather than applied
+    """
+    page_cache.invalidate(task_id)
+    properties = _shard_for_task(task_id).translate_properties(properties)
+    if write_journal:
+        _journal_update(task_id, properties)
+        return True
+    _mirror_write(notion.pages.update(page_id=task_id, properties=properties))
+    return False
+
+def _journal_update(task_id: str, properties: Dict[str, Any]) -> None:
+    """Helper method to journal a property update, already translated for its database, in write-behind mode"""
+    write_journal.append("update", {"page_id": task_id, "properties": properties})
+
+def _journal_create(page: Dict[str, Any], shard: TaskShard) -> str:
+    """Helper method to journal a new task page in write-behind mode; returns its provisional pending:<key> ID"""
+    task_id = PENDING_PREFIX + write_journal.append("create", page)
+    _record_created(task_id, shard)
+    return task_id
+
+def _record_created_page(page: Dict[str, Any], shard: TaskShard) -> str:
+    """Helper method to record a page Notion just created with its database, the page cache and the mirror; returns its ID"""
+    _record_created(page["id"], shard)
+    _mirror_write(page)
+    return page["id"]
+
+def _task_update_properties(
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    due_date: Optional[str] = None
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """Helper method to validate update_task fields and build their Notion properties
+    
+    Returns:
+        (properties, updated_fields)
+        
+    Raises:
+        ValueError: If a value is invalid or no field is given
+    """
+    properties = {}
+    updated_fields = {}
+    if status is not None:
+        if status not in [getattr(TaskStatus, s) for s in dir(TaskStatus) if not s.startswith("_")]:
+            raise ValueError(f"Invalid status: {status}")
+        properties["Status"] = {"select": {"name": status}}
+        updated_fields["status"] = status
+    if priority is not None:
+        if priority not in [getattr(TaskPriority, p) for p in dir(TaskPriority) if not p.startswith("_")]:
+            raise ValueError(f"Invalid priority: {priority}")
+        properties["Priority"] = {"select": {"name": priority}}
+        updated_fields["priority"] = priority
+    if due_date is not None:
+        try:
+            datetime.strptime(due_date, "%Y-%m-%d")
+        except ValueError:
+            raise ValueError("Invalid date format. Use YYYY-MM-DD")
+        properties["Due Date"] = {"date": {"start": due_date}}
+        updated_fields["due_date"] = due_date
+    if not properties:
+        raise ValueError("No fields to update")
+    return properties, updated_fields
 
 @tool
+@instrument_tool
 def create_task(
     title: str,
     description: str,
     assignee: str,
     due_date: str,
-    priority: str = TaskPriority.MEDIUM
+    priority: str = TaskPriority.MEDIUM,
+    database: Optional[str] = None
 ) -> Dict[str, Any]:
     """Creates a new task in Notion database
     
@@ -30,6 +308,7 @@ def create_task(
         assignee: Email address of the person assigned to the task
         due_date: Due date in YYYY-MM-DD format
         priority: Task priority level (Urgent, High, Medium, Low)
+        database: Name of the team database to create the task in (default: the first configured database)
         
     Returns:
         Dict with task creation status and details
@@ -38,21 +317,29 @@ def create_task(
         if priority not in [getattr(TaskPriority, p) for p in dir(TaskPriority) if not p.startswith("_")]:
             priority = TaskPriority.MEDIUM
 
-        task = {
-            "parent": {"database_id": database_id},
-            "properties": {
-                "Title": {"title": [{"text": {"content": title}}]},
-                "Description": {"rich_text": [{"text": {"content": description}}]},
-                "Assignee": {"people": [{"id": _get_user_id(assignee)}]},
-                "Due Date": {"date": {"start": due_date}},
-                "Priority": {"select": {"name": priority}},
-                "Status": {"select": {"name": TaskStatus.NOT_STARTED}}
+        assignee_id = _get_user_id(assignee)
+        if not assignee_id:
+            return {
+                "status": "error",
+                "message": f"Unknown assignee: {assignee}",
+                "timestamp": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
             }
-        }
-        result = notion.pages.create(**task)
+
+        shard = _shard_named(database)
+        task = _new_task_page(title, description, assignee_id, due_date, priority, shard)
+        if write_journal:
+            task_id = _journal_create(task, shard)
+            return {
+                "status": "success",
+                "task_id": task_id,
+                "queued": True,
+                "created_by": current_user,
+                "created_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+            }
+        task_id = _record_created_page(notion.pages.create(**task), shard)
         return {
             "status": "success",
-            "task_id": result["id"],
+            "task_id": task_id,
             "created_by": current_user,
             "created_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
         }
@@ -64,6 +351,86 @@ def create_task(
         }
 
 @tool
+@instrument_tool
+def create_tasks(
+    tasks: List[Dict[str, Any]],
+    max_workers: Optional[int] = None
+) -> Dict[str, Any]:
+    """Creates many tasks in the Notion database in one call
+    
+    Args:
+        tasks: List of task specs, each a dict with title, due_date (YYYY-MM-DD) and optional description, assignee (email), priority (Urgent, High, Medium, Low) and database (team database name)
+        max_workers: Number of concurrent uploads (default: BULK_CONFIG max_workers)
+        
+    Returns:
+        Dict with per-task results in input order and success/failure counts
+    """
+    try:
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tasks)
+        pending = []
+
+        # Validate every spec before anything is uploaded
+        for index, spec in enumerate(tasks):
+            try:
+                pending.append((index, _validate_task_spec(spec)))
+            except ValueError as ve:
+                results[index] = {"index": index, "status": "error", "message": str(ve)}
+
+        # Resolve each distinct assignee once
+        assignee_ids = {}
+        for email in {spec["assignee"] for _, spec in pending if spec["assignee"]}:
+            assignee_ids[email] = _get_user_id(email)
+
+        uploads = []
+        for index, spec in pending:
+            if spec["assignee"] and not assignee_ids[spec["assignee"]]:
+                results[index] = {
+                    "index": index,
+                    "status": "error",
+                    "message": f"Unknown assignee: {spec['assignee']}"
+                }
+                continue
+            shard = _shard_named(spec["database"])
+            uploads.append((index, shard, _new_task_page(
+                spec["title"],
+                spec["description"],
+                assignee_ids.get(spec["assignee"]),
+                spec["due_date"],
+                spec["priority"],
+                shard
+            )))
+
+        def upload(item):
+            index, shard, page = item
+            try:
+                if write_journal:
+                    return {"index": index, "status": "success", "task_id": _journal_create(page, shard), "queued": True}
+                return {"index": index, "status": "success", "task_id": _record_created_page(notion.pages.create(**page), shard)}
+            except Exception as e:
+                return {"index": index, "status": "error", "message": str(e)}
+
+        with ThreadPoolExecutor(max_workers=max_workers or BULK_CONFIG["max_workers"]) as pool:
+            for result in pool.map(upload, uploads):
+                results[result["index"]] = result
+
+        created = sum(1 for result in results if result["status"] == "success")
+        return {
+            "status": "success" if created == len(tasks) else "partial" if created else "error",
+            "results": results,
+            "created": created,
+            "failed": len(tasks) - created,
+            "created_by": current_user,
+            "created_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "timestamp": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        }
+
+@tool
+@instrument_tool
 def update_task_status(
     task_id: str,
     status: str
@@ -81,14 +448,12 @@ def update_task_status(
         if status not in [getattr(TaskStatus, s) for s in dir(TaskStatus) if not s.startswith("_")]:
             raise ValueError(f"Invalid status: {status}")
 
-        result = notion.pages.update(
-            page_id=task_id,
-            properties={"Status": {"select": {"name": status}}}
-        )
+        queued = _write_properties(task_id, {"Status": {"select": {"name": status}}})
         return {
             "status": "success",
             "task_id": task_id,
             "new_status": status,
+            "queued": queued,
             "updated_by": current_user,
             "updated_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
         }
@@ -100,13 +465,16 @@ def update_task_status(
         }
 
 @tool
+@instrument_tool
 def get_tasks_by_status(
-    status: str
+    status: str,
+    limit: Optional[int] = None
 ) -> Dict[str, Any]:
     """Retrieves tasks filtered by status
     
     Args:
         status: Status value to filter tasks by (Blocked, Not Started, In Progress, Completed)
+        limit: Maximum number of tasks to return, soonest due first (default: all)
         
     Returns:
         Dict containing matching tasks and count
@@ -115,8 +483,8 @@ def get_tasks_by_status(
         if status not in [getattr(TaskStatus, s) for s in dir(TaskStatus) if not s.startswith("_")]:
             raise ValueError(f"Invalid status: {status}")
 
-        response = notion.databases.query(
-            database_id=database_id,
+        found = _query_shards(
+            lambda mirror: mirror.tasks_by_status(status),
             filter={
                 "property": "Status",
                 "select": {"equals": status}
@@ -124,19 +492,12 @@ def get_tasks_by_status(
             sorts=[{
                 "property": "Due Date",
                 "direction": "ascending"
-            }]
+            }],
+            key=_by_due_date,
+            limit=limit
         )
         
-        tasks = []
-        for page in response["results"]:
-            task = {
-                "id": page["id"],
-                "title": page["properties"]["Title"]["title"][0]["text"]["content"],
-                "status": status,
-                "due_date": page["properties"]["Due Date"]["date"]["start"],
-                "priority": page["properties"]["Priority"]["select"]["name"]
-            }
-            tasks.append(task)
+        tasks = [task.summary() for task in found]
         
         return {
             "status": "success",
@@ -153,6 +514,7 @@ def get_tasks_by_status(
         }
 
 @tool
+@instrument_tool
 def send_reminders() -> Dict[str, Any]:
     """Sends reminders for tasks due tomorrow
     
@@ -161,8 +523,8 @@ def send_reminders() -> Dict[str, Any]:
     """
     try:
         tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
-        response = notion.databases.query(
-            database_id=database_id,
+        found = _query_shards(
+            lambda mirror: mirror.due_index.due_on(datetime.now().date() + timedelta(days=1)),
             filter={
                 "and": [
                     {
@@ -180,15 +542,15 @@ def send_reminders() -> Dict[str, Any]:
         )
         
         reminders = []
-        for page in response["results"]:
-            reminder = {
-                "task_id": page["id"],
-                "title": page["properties"]["Title"]["title"][0]["text"]["content"],
-                "assignee": page["properties"]["Assignee"]["people"][0]["name"],
+        for task in found:
+            reminders.append({
+                "task_id": task.id,
+                "title": task.title,
+                "assignee": task.assignee,
+                "assignees": task.assignee_emails.split(",") if task.assignee_emails else [],
                 "due_date": tomorrow,
-                "status": page["properties"]["Status"]["select"]["name"]
-            }
-            reminders.append(reminder)
+                "status": task.status
+            })
         
         return {
             "status": "success",
@@ -205,13 +567,16 @@ def send_reminders() -> Dict[str, Any]:
         }
 
 @tool
+@instrument_tool
 def get_tasks_by_priority(
-    priority: str
+    priority: str,
+    limit: Optional[int] = None
 ) -> Dict[str, Any]:
     """Retrieves tasks filtered by priority level
     
     Args:
         priority: Priority level to filter tasks by (Urgent, High, Medium, Low)
+        limit: Maximum number of tasks to return, soonest due first (default: all)
         
     Returns:
         Dict containing matching tasks and count
@@ -220,8 +585,8 @@ def get_tasks_by_priority(
         if priority not in [getattr(TaskPriority, p) for p in dir(TaskPriority) if not p.startswith("_")]:
             raise ValueError(f"Invalid priority: {priority}")
 
-        response = notion.databases.query(
-            database_id=database_id,
+        found = _query_shards(
+            lambda mirror: mirror.tasks_by_priority(priority),
             filter={
                 "property": "Priority",
                 "select": {"equals": priority}
@@ -229,19 +594,12 @@ def get_tasks_by_priority(
             sorts=[{
                 "property": "Due Date",
                 "direction": "ascending"
-            }]
+            }],
+            key=_by_due_date,
+            limit=limit
         )
         
-        tasks = []
-        for page in response["results"]:
-            task = {
-                "id": page["id"],
-                "title": page["properties"]["Title"]["title"][0]["text"]["content"],
-                "status": page["properties"]["Status"]["select"]["name"],
-                "due_date": page["properties"]["Due Date"]["date"]["start"],
-                "priority": priority
-            }
-            tasks.append(task)
+        tasks = [task.summary() for task in found]
         
         return {
             "status": "success",
@@ -258,13 +616,16 @@ def get_tasks_by_priority(
         }
 
 @tool
+@instrument_tool
 def get_tasks_by_date(
-    date: str
+    date: str,
+    limit: Optional[int] = None
 ) -> Dict[str, Any]:
     """Retrieves tasks for a specific date
     
     Args:
         date: Date in YYYY-MM-DD format
+        limit: Maximum number of tasks to return (default: all)
         
     Returns:
         Dict containing matching tasks and count
@@ -273,8 +634,8 @@ def get_tasks_by_date(
         # Validate date format
         datetime.strptime(date, "%Y-%m-%d")
         
-        response = notion.databases.query(
-            database_id=database_id,
+        found = _query_shards(
+            lambda mirror: mirror.tasks_by_date(date),
             filter={
                 "property": "Due Date",
                 "date": {"equals": date}
@@ -282,19 +643,12 @@ def get_tasks_by_date(
             sorts=[{
                 "property": "Priority",
                 "direction": "descending"
-            }]
+            }],
+            key=_by_priority_descending,
+            limit=limit
         )
         
-        tasks = []
-        for page in response["results"]:
-            task = {
-                "id": page["id"],
-                "title": page["properties"]["Title"]["title"][0]["text"]["content"],
-                "status": page["properties"]["Status"]["select"]["name"],
-                "due_date": date,
-                "priority": page["properties"]["Priority"]["select"]["name"]
-            }
-            tasks.append(task)
+        tasks = [{**task.summary(), "due_date": date} for task in found]
         
         return {
             "status": "success",
@@ -317,6 +671,7 @@ def get_tasks_by_date(
         }
 
 @tool
+@instrument_tool
 def generate_daily_report() -> Dict[str, Any]:
     """Generates a daily progress report of all tasks
     
@@ -324,29 +679,18 @@ def generate_daily_report() -> Dict[str, Any]:
         Dict containing task summary and breakdown by status/priority
     """
     try:
-        report = {
-            "summary": {},
-            "details": [],
+        # One concurrent scan of every database's mirror or pages feeds every breakdown
+        found = _query_shards(lambda mirror: mirror.all_tasks())
+        breakdown = build_report(found, datetime.now().date())
+        
+        return {
+            "summary": breakdown["summary"],
+            "details": breakdown["details"],
             "generated_by": current_user,
-            "generated_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+            "generated_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S"),
+            "priority_distribution": breakdown["priority_distribution"],
+            "due_distribution": breakdown["due_distribution"]
         }
-        
-        # Get counts for each status
-        for status in [getattr(TaskStatus, s) for s in dir(TaskStatus) if not s.startswith("_")]:
-            tasks = get_tasks_by_status(status)
-            if tasks.get("status") == "success":
-                report["summary"][status] = tasks["count"]
-                report["details"].extend(tasks["tasks"])
-        
-        # Add priority distribution
-        priority_counts = {}
-        for task in report["details"]:
-            priority = task["priority"]
-            priority_counts[priority] = priority_counts.get(priority, 0) + 1
-        
-        report["priority_distribution"] = priority_counts
-        
-        return report
     except Exception as e:
         return {
             "status": "error",
@@ -355,6 +699,7 @@ def generate_daily_report() -> Dict[str, Any]:
         }
 
 @tool
+@instrument_tool
 def update_task_priority(
     task_id: str,
     priority: str
@@ -372,14 +717,12 @@ def update_task_priority(
         if priority not in [getattr(TaskPriority, p) for p in dir(TaskPriority) if not p.startswith("_")]:
             raise ValueError(f"Invalid priority: {priority}")
 
-        result = notion.pages.update(
-            page_id=task_id,
-            properties={"Priority": {"select": {"name": priority}}}
-        )
+        queued = _write_properties(task_id, {"Priority": {"select": {"name": priority}}})
         return {
             "status": "success",
             "task_id": task_id,
             "new_priority": priority,
+            "queued": queued,
             "updated_by": current_user,
             "updated_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
         }
@@ -391,6 +734,7 @@ def update_task_priority(
         }
 
 @tool
+@instrument_tool
 def update_task_due_date(
     task_id: str,
     due_date: str
@@ -408,14 +752,12 @@ def update_task_due_date(
         # Validate date format
         datetime.strptime(due_date, "%Y-%m-%d")
         
-        result = notion.pages.update(
-            page_id=task_id,
-            properties={"Due Date": {"date": {"start": due_date}}}
-        )
+        queued = _write_properties(task_id, {"Due Date": {"date": {"start": due_date}}})
         return {
             "status": "success",
             "task_id": task_id,
             "new_due_date": due_date,
+            "queued": queued,
             "updated_by": current_user,
             "updated_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
         }
@@ -433,6 +775,44 @@ def update_task_due_date(
         }
 
 @tool
+@instrument_tool
+def update_task(
+    task_id: str,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    due_date: Optional[str] = None
+) -> Dict[str, Any]:
+    """Updates several fields of an existing task in a single write
+    
+    Args:
+        task_id: The unique identifier of the task to update
+        status: New status value for the task (Blocked, Not Started, In Progress, Completed)
+        priority: New priority value for the task (Urgent, High, Medium, Low)
+        due_date: New due date in YYYY-MM-DD format
+        
+    Returns:
+        Dict with update status and the fields that were changed
+    """
+    try:
+        properties, updated_fields = _task_update_properties(status, priority, due_date)
+        queued = _write_properties(task_id, properties)
+        return {
+            "status": "success",
+            "task_id": task_id,
+            "updated_fields": updated_fields,
+            "queued": queued,
+            "updated_by": current_user,
+            "updated_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "timestamp": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        }
+
+@tool
+@instrument_tool
 def get_task_details(
     task_id: str
 ) -> Dict[str, Any]:
@@ -445,30 +825,20 @@ def get_task_details(
         Dict containing detailed task information
     """
     try:
-        response = notion.pages.retrieve(page_id=task_id)
-        
-        title = response["properties"]["Title"]["title"][0]["text"]["content"]
-        description = response["properties"]["Description"]["rich_text"][0]["text"]["content"]
-        status = response["properties"]["Status"]["select"]["name"]
-        priority = response["properties"]["Priority"]["select"]["name"]
-        due_date = response["properties"]["Due Date"]["date"]["start"]
-        
-        # Get assignee information
-        assignee = None
-        if response["properties"]["Assignee"]["people"]:
-            assignee = response["properties"]["Assignee"]["people"][0]["name"]
+        mirrored = _mirrored_task(task_id)
+        task = _cached_task(task_id, mirrored)
+        cached = task is not None
+        if not cached:
+            task = mirrored
+            if task is None:
+                page = notion.pages.retrieve(page_id=task_id)
+                task = _shard_for_page(page).parse(page)
+            page_cache.put(task)
         
         return {
             "status": "success",
-            "task": {
-                "id": task_id,
-                "title": title,
-                "description": description,
-                "status": status, 
-                "priority": priority,
-                "due_date": due_date,
-                "assignee": assignee
-            },
+            "task": {**task.details(), "id": task_id},
+            "cached": cached,
             "queried_by": current_user,
             "timestamp": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
         }
@@ -480,22 +850,28 @@ def get_task_details(
         }
 
 @tool
-def get_overdue_tasks() -> Dict[str, Any]:
+@instrument_tool
+def get_overdue_tasks(
+    limit: Optional[int] = None
+) -> Dict[str, Any]:
     """Retrieves all tasks that are past their due date and not completed
     
+    Args:
+        limit: Maximum number of tasks to return, most overdue first (default: all)
+        
     Returns:
         Dict containing list of overdue tasks and count
     """
     try:
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = datetime.now().date()
         
-        response = notion.databases.query(
-            database_id=database_id,
+        found = _query_shards(
+            lambda mirror: [task for task, _ in mirror.due_index.overdue(today)],
             filter={
                 "and": [
                     {
                         "property": "Due Date",
-                        "date": {"before": today}
+                        "date": {"before": today.isoformat()}
                     },
                     {
                         "property": "Status",
@@ -508,20 +884,16 @@ def get_overdue_tasks() -> Dict[str, Any]:
             sorts=[{
                 "property": "Due Date",
                 "direction": "ascending"
-            }]
+            }],
+            key=_by_due_date,
+            limit=limit
         )
         
-        overdue_tasks = []
-        for page in response["results"]:
-            task = {
-                "id": page["id"],
-                "title": page["properties"]["Title"]["title"][0]["text"]["content"],
-                "status": page["properties"]["Status"]["select"]["name"],
-                "due_date": page["properties"]["Due Date"]["date"]["start"],
-                "priority": page["properties"]["Priority"]["select"]["name"],
-                "days_overdue": (datetime.now() - datetime.strptime(page["properties"]["Due Date"]["date"]["start"], "%Y-%m-%d")).days
-            }
-            overdue_tasks.append(task)
+        today_ordinal = today.toordinal()
+        overdue_tasks = [{
+            **task.summary(),
+            "days_overdue": today_ordinal - datetime.fromisoformat(task.due_date[:10]).toordinal()
+        } for task in found]
         
         return {
             "status": "success",
@@ -537,6 +909,142 @@ def get_overdue_tasks() -> Dict[str, Any]:
             "timestamp": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
         }
 
+@tool
+@instrument_tool
+def get_upcoming_tasks(
+    days: int = 7,
+    limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """Retrieves open tasks due between today and the given number of days from now
+    
+    Args:
+        days: How many days ahead to look (default: 7)
+        limit: Maximum number of tasks to return, soonest first (default: all)
+        
+    Returns:
+        Dict containing list of upcoming tasks and count
+    """
+    try:
+        today = datetime.now().date()
+        
+        found = _query_shards(
+            lambda mirror: mirror.due_index.due_within(today, days),
+            filter={
+                "and": [
+                    {
+                        "property": "Due Date",
+                        "date": {"on_or_after": today.isoformat()}
+                    },
+                    {
+                        "property": "Due Date",
+                        "date": {"on_or_before": (today + timedelta(days=days)).isoformat()}
+                    },
+                    {
+                        "property": "Status",
+                        "select": {
+                            "does_not_equal": TaskStatus.COMPLETED
+                        }
+                    }
+                ]
+            },
+            sorts=[{
+                "property": "Due Date",
+                "direction": "ascending"
+            }],
+            key=_by_due_date,
+            limit=limit
+        )
+        
+        tasks = [task.summary() for task in found]
+        
+        return {
+            "status": "success",
+            "tasks": tasks,
+            "count": len(tasks),
+            "days": days,
+            "queried_by": current_user,
+            "timestamp": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e),
+            "timestamp": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        }
+
+def _new_task_page(
+    title: str,
+    description: str,
+    assignee_id: Optional[str],
+    due_date: str,
+    priority: str,
+    shard: Optional[TaskShard] = None
+) -> Dict[str, Any]:
+    """Helper method to build the pages.create payload for a new task
+    
+    Args:
+        title: The title of the task
+        description: Detailed description of the task
+        assignee_id: Notion user ID of the assignee, or None to leave it unassigned
+        due_date: Due date in YYYY-MM-DD format
+        priority: Task priority level
+        shard: Database to create the task in (default: the first configured database)
+        
+    Returns:
+        Keyword arguments for notion.pages.create
+    """
+    shard = shard or task_shards[0]
+    return {
+        "parent": {"database_id": shard.database_id},
+        "properties": shard.translate_properties({
+            "Title": {"title": [{"text": {"content": title}}]},
+            "Description": {"rich_text": [{"text": {"content": description}}]},
+            "Assignee": {"people": [{"id": assignee_id}] if assignee_id else []},
+            "Due Date": {"date": {"start": due_date}},
+            "Priority": {"select": {"name": priority}},
+            "Status": {"select": {"name": TaskStatus.NOT_STARTED}}
+        })
+    }
+
+def _validate_task_spec(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Helper method to check and normalize one create_tasks spec
+    
+    Args:
+        spec: Task spec with title, due_date and optional description, assignee, priority and database
+        
+    Returns:
+        Normalized spec with every field present
+        
+    Raises:
+        ValueError: If the title is missing, the due date is not YYYY-MM-DD or the database is unknown
+    """
+    if not isinstance(spec, dict):
+        raise ValueError("Task spec must be an object")
+    title = (spec.get("title") or "").strip()
+    if not title:
+        raise ValueError("Missing title")
+    due_date = spec.get("due_date") or ""
+    try:
+        datetime.strptime(due_date, "%Y-%m-%d")
+    except ValueError:
+        raise ValueError("Invalid date format. Use YYYY-MM-DD")
+
+    priority = spec.get("priority") or TaskPriority.MEDIUM
+    if priority not in [getattr(TaskPriority, p) for p in dir(TaskPriority) if not p.startswith("_")]:
+        priority = TaskPriority.MEDIUM
+
+    database = spec.get("database") or None
+    _shard_named(database)
+
+    return {
+        "title": title,
+        "description": spec.get("description") or "",
+        "assignee": (spec.get("assignee") or "").strip() or None,
+        "due_date": due_date,
+        "priority": priority,
+        "database": database
+    }
+
 def _get_user_id(email: str) -> Optional[str]:
     """Helper method to get Notion user ID from email
     
@@ -547,11 +1055,7 @@ def _get_user_id(email: str) -> Optional[str]:
         User ID string or None if not found
     """
     try:
-        users = notion.users.list()
-        for user in users["results"]:
-            if user.get("person", {}).get("email") == email:
-                return user["id"]
-        return None  # Return None if no matching email is found
+        return user_directory.get_user_id(email)
     except Exception as e:
         print(f"Error getting user ID: {str(e)}")
         return None
\ No newline at end of file
@@ -0,0 +1,205 @@
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional, List, Callable, Tuple
+from task_manager.config import NOTION_CONFIG, TaskStatus
+from task_manager.notion_pagination import iter_database_query
+from task_manager.task_record import Task, parse_task
+from task_manager.due_index import DueDateIndex
+
+# Bump when the tasks table changes; older mirror files are rebuilt from Notion
+SCHEMA_VERSION = 3
+
+TASK_COLUMNS = list(Task.__slots__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    title TEXT,
+    description TEXT,
+    status TEXT,
+    priority TEXT,
+    due_date TEXT,
+    assignee TEXT,
+    assignee_email TEXT,
+    assignee_emails TEXT,
+    last_edited_time TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, due_date);
+CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (priority, due_date);
+CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks (due_date);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+class TaskMirror:
+    """Local SQLite mirror of the Notion task database
+
+    The mirror pulls pages incrementally using their last_edited_time and
+    serves the read tools locally while it is fresher than
+    max_staleness_seconds. A full resync runs every full_resync_seconds to
+    drop pages that were archived or deleted in Notion.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        database_id: str,
+        path: str,
+        max_staleness_seconds: int = 60,
+        full_resync_seconds: int = 3600,
+        parse: Callable[[Dict[str, Any]], Task] = parse_task
+    ):
+        self.client = client
+        self.database_id = database_id
+        self.path = path
+        self.max_staleness_seconds = max_staleness_seconds
+        self.full_resync_seconds = full_resync_seconds
+        self.parse = parse
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        # Open tasks by due date, kept in step with every write to the tasks table
+        self.due_index = DueDateIndex()
+        # Notion sorts select properties by their option order
+        options = NOTION_CONFIG["database_properties"]["Priority"]["select"]["options"]
+        self._priority_rank = {option["name"]: rank for rank, option in enumerate(options)}
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                self._conn.executescript("DROP TABLE IF EXISTS tasks; DROP TABLE IF EXISTS sync_state;")
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._conn.executescript(SCHEMA)
+            self._conn.create_function("priority_rank", 1, lambda name: self._priority_rank.get(name))
+            self.due_index.load(self._select("status IS NOT ?", (TaskStatus.COMPLETED,), "due_date"))
+        return self._conn
+
+    def _get_state(self, key: str) -> Optional[str]:
+        row = self._connect().execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def _set_state(self, key: str, value: str) -> None:
+        self._connect().execute(
+            "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    def _upsert(self, task: Task) -> None:
+        self._connect().execute(
+            f"INSERT OR REPLACE INTO tasks ({', '.join(TASK_COLUMNS)}) "
+            f"VALUES ({', '.join('?' for _ in TASK_COLUMNS)})",
+            task.to_tuple()
+        )
+        self.due_index.upsert(task)
+
+    def sync(self, full: bool = False) -> int:
+        """Pulls pages edited since the last sync into the mirror
+
+        Args:
+            full: Re-read the whole database and drop rows that no longer exist
+
+        Returns:
+            Number of pages written to the mirror
+        """
+        with self._lock:
+            conn = self._connect()
+            started = time.time()
+            cursor = self._get_state("last_edited_cursor")
+            last_full_sync = float(self._get_state("last_full_sync") or 0)
+            full = full or cursor is None or started - last_full_sync > self.full_resync_seconds
+
+            # last_edited_time has minute precision, so re-read the boundary minute
+            filter = None if full else {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": cursor}
+            }
+            seen = set()
+            newest = cursor
+            try:
+                for page in iter_database_query(
+                    self.client,
+                    self.database_id,
+                    filter=filter,
+                    sorts=[{"timestamp": "last_edited_time", "direction": "ascending"}]
+                ):
+                    task = self.parse(page)
+                    self._upsert(task)
+                    seen.add(task.id)
+                    if task.last_edited_time and (newest is None or task.last_edited_time > newest):
+                        newest = task.last_edited_time
+            except Exception:
+                conn.rollback()
+                raise
+
+            if full:
+                stale = [
+                    row["id"] for row in conn.execute("SELECT id FROM tasks")
+                    if row["id"] not in seen
+                ]
+                conn.executemany("DELETE FROM tasks WHERE id = ?", [(page_id,) for page_id in stale])
+                for page_id in stale:
+                    self.due_index.remove(page_id)
+                self._set_state("last_full_sync", str(started))
+            if newest:
+                self._set_state("last_edited_cursor", newest)
+            self._set_state("last_synced_at", str(started))
+            conn.commit()
+            return len(seen)
+
+    def staleness(self) -> float:
+        """Returns the number of seconds since the last successful sync"""
+        with self._lock:
+            last_synced_at = self._get_state("last_synced_at")
+        return time.time() - float(last_synced_at) if last_synced_at else float("inf")
+
+    def ensure_fresh(self) -> None:
+        """Syncs the mirror if it is older than the configured staleness bound"""
+        with self._lock:
+            if self.staleness() > self.max_staleness_seconds:
+                self.sync()
+
+    def upsert_page(self, page: Dict[str, Any]) -> None:
+        """Writes a page returned by a Notion create/update call through to the mirror"""
+        with self._lock:
+            self._upsert(self.parse(page))
+            self._connect().commit()
+
+    def remove(self, page_id: str) -> None:
+        """Drops a page from the mirror"""
+        with self._lock:
+            self._connect().execute("DELETE FROM tasks WHERE id = ?", (page_id,))
+            self._connect().commit()
+            self.due_index.remove(page_id)
+
+    def _select(self, where: str, params: Tuple[Any, ...], order_by: str) -> List[Task]:
+        with self._lock:
+            rows = self._connect().execute(
+                f"SELECT {', '.join(TASK_COLUMNS)} FROM tasks WHERE {where} ORDER BY {order_by}",
+                params
+            ).fetchall()
+        return [Task(*row) for row in rows]
+
+    def all_tasks(self) -> List[Task]:
+        """Returns every mirrored task ordered by due date"""
+        return self._select("1 = 1", (), "due_date IS NULL, due_date")
+
+    def get_task(self, page_id: str) -> Optional[Task]:
+        """Returns a single mirrored task or None if it is not in the mirror"""
+        rows = self._select("id = ?", (page_id,), "id")
+        return rows[0] if rows else None
+
+    def tasks_by_status(self, status: str) -> List[Task]:
+        """Returns tasks with the given status ordered by due date"""
+        return self._select("status = ?", (status,), "due_date IS NULL, due_date")
+
+    def tasks_by_priority(self, priority: str) -> List[Task]:
+        """Returns tasks with the given priority ordered by due date"""
+        return self._select("priority = ?", (priority,), "due_date IS NULL, due_date")
+
+    def tasks_by_date(self, date: str) -> List[Task]:
+        """Returns tasks due on the given date ordered by priority, descending"""
+        return self._select("substr(due_date, 1, 10) = ?", (date,), "priority_rank(priority) DESC")
@@ -0,0 +1,156 @@
+from typing import Dict, Any, Optional, List, Callable, Tuple
+from task_manager.config import NOTION_CONFIG
+
+# Task field -> Notion property it is read from
+TASK_PROPERTIES = {
+    "title": "Title",
+    "description": "Description",
+    "status": "Status",
+    "priority": "Priority",
+    "due_date": "Due Date",
+    "assignee": "Assignee"
+}
+
+class Task:
+    """Compact record for one row of the task database
+
+    Only the fields the tools use are kept; the Notion page JSON the record
+    was parsed from is not referenced and can be freed right away.
+    """
+
+    __slots__ = (
+        "id", "title", "description", "status", "priority",
+        "due_date", "assignee", "assignee_email", "assignee_emails", "last_edited_time"
+    )
+
+    def __init__(
+        self,
+        id: str,
+        title: str = "",
+        description: str = "",
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        due_date: Optional[str] = None,
+        assignee: Optional[str] = None,
+        assignee_email: Optional[str] = None,
+        assignee_emails: Optional[str] = None,
+        last_edited_time: Optional[str] = None
+    ):
+        self.id = id
+        self.title = title
+        self.description = description
+        self.status = status
+        self.priority = priority
+        self.due_date = due_date
+        self.assignee = assignee
+        self.assignee_email = assignee_email
+        # Comma-separated emails of every person on the task, first one included
+        self.assignee_emails = assignee_emails
+        self.last_edited_time = last_edited_time
+
+    def summary(self) -> Dict[str, Any]:
+        """Returns the fields shown by the task listing tools"""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "status": self.status,
+            "due_date": self.due_date,
+            "priority": self.priority
+        }
+
+    def details(self) -> Dict[str, Any]:
+        """Returns the fields shown by get_task_details"""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "status": self.status,
+            "priority": self.priority,
+            "due_date": self.due_date,
+            "assignee": self.assignee
+        }
+
+    def to_tuple(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, field) for field in self.__slots__)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Task) and self.to_tuple() == other.to_tuple()
+
+    def __repr__(self) -> str:
+        return f"Task(id={self.id!r}, title={self.title!r}, status={self.status!r}, due_date={self.due_date!r})"
+
+def _plain_text(value: Any) -> str:
+    return "".join(
+        part.get("plain_text") or part.get("text", {}).get("content", "")
+        for part in value or []
+    )
+
+def _select_name(value: Any) -> Optional[str]:
+    return value.get("name") if value else None
+
+def _date_start(value: Any) -> Optional[str]:
+    return value.get("start") if value else None
+
+def _people(value: Any) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Returns the first person's name and email plus every person's email"""
+    if not value:
+        return None, None, None
+    emails = [(person.get("person") or {}).get("email") for person in value]
+    return value[0].get("name"), emails[0], ",".join(email for email in emails if email) or None
+
+# Notion property type -> function reading that type's value
+_EXTRACTORS: Dict[str, Callable[[Any], Any]] = {
+    "title": _plain_text,
+    "rich_text": _plain_text,
+    "select": _select_name,
+    "status": _select_name,
+    "date": _date_start,
+    "people": _people
+}
+
+def compile_page_parser(
+    database_properties: Dict[str, Any],
+    task_properties: Dict[str, str] = TASK_PROPERTIES
+) -> Callable[[Dict[str, Any]], Task]:
+    """Builds a page-to-Task parser for a database schema
+
+    The property names and types are resolved once here, so parsing a page
+    is a flat loop over precomputed (field, property, extractor) entries
+    instead of repeated deep dict navigation.
+
+    Args:
+        database_properties: Schema mapping property name -> {type: config},
+            as in NOTION_CONFIG["database_properties"]
+        task_properties: Task field -> property name mapping
+
+    Returns:
+        Function turning a Notion page object into a Task
+    """
+    plan: List[Tuple[str, str, str, Callable[[Any], Any]]] = []
+    for field, property_name in task_properties.items():
+        schema = database_properties.get(property_name)
+        if not schema:
+            continue
+        property_type = next(iter(schema))
+        extractor = _EXTRACTORS.get(property_type)
+        if extractor:
+            plan.append((field, property_name, property_type, extractor))
+
+    def parse(page: Dict[str, Any]) -> Task:
+        task = Task(page["id"], last_edited_time=page.get("last_edited_time"))
+        properties = page.get("properties") or {}
+        for field, property_name, property_type, extractor in plan:
+            prop = properties.get(property_name)
+            if prop is None:
+                continue
+            value = extractor(prop.get(property_type))
+            if property_type == "people":
+                task.assignee, task.assignee_email, task.assignee_emails = value
+            elif value is not None:
+                setattr(task, field, value)
+        return task
+
+    return parse
+
+# Parser for the configured task database
+parse_task = compile_page_parser(NOTION_CONFIG["database_properties"])
@@ -0,0 +1,111 @@
+import os
+from typing import Dict, Any, Optional, List
+from task_manager.config import NOTION_CONFIG, MIRROR_CONFIG
+from task_manager.task_record import TASK_PROPERTIES, compile_page_parser
+
+def _default_types() -> Dict[str, str]:
+    """Task field -> property type in the default schema"""
+    schema = NOTION_CONFIG["database_properties"]
+    return {field: next(iter(schema[name])) for field, name in TASK_PROPERTIES.items()}
+
+def _normalize_id(database_id: Optional[str]) -> str:
+    return (database_id or "").replace("-", "")
+
+class TaskShard:
+    """One task database and how its properties map onto task fields
+
+    Tools build filters, sorts and property payloads against the default
+    schema in NOTION_CONFIG; translate() and translate_properties() rewrite
+    them for this database's property names and types.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        database_id: Optional[str],
+        properties: Optional[Dict[str, str]] = None,
+        types: Optional[Dict[str, str]] = None
+    ):
+        default_types = _default_types()
+        self.name = name
+        self.database_id = database_id
+        self.task_properties = {**TASK_PROPERTIES, **(properties or {})}
+        self.property_types = {**default_types, **(types or {})}
+        # TaskMirror for this database, attached by the task manager when mirroring is enabled
+        self.mirror = None
+
+        # Default property name -> (this database's name, default type, this database's type)
+        self._mapping = {
+            TASK_PROPERTIES[field]: (self.task_properties[field], default_types[field], self.property_types[field])
+            for field in TASK_PROPERTIES
+        }
+        self._identity = all(
+            name == default and property_type == default_type
+            for default, (name, default_type, property_type) in self._mapping.items()
+        )
+        self.parse = compile_page_parser(
+            {self.task_properties[field]: {self.property_types[field]: {}} for field in TASK_PROPERTIES},
+            self.task_properties
+        )
+
+    def owns(self, page: Dict[str, Any]) -> bool:
+        """Tells whether a page object belongs to this database"""
+        parent = page.get("parent") or {}
+        return _normalize_id(parent.get("database_id")) == _normalize_id(self.database_id)
+
+    def translate(self, value: Any) -> Any:
+        """Rewrites a filter or sorts list written against the default schema"""
+        if self._identity or value is None:
+            return value
+        if isinstance(value, list):
+            return [self.translate(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        if "property" in value and value["property"] in self._mapping:
+            name, default_type, property_type = self._mapping[value["property"]]
+            return {
+                ("property" if key == "property" else property_type if key == default_type else key):
+                (name if key == "property" else item)
+                for key, item in value.items()
+            }
+        return {key: self.translate(item) for key, item in value.items()}
+
+    def translate_properties(self, properties: Dict[str, Any]) -> Dict[str, Any]:
+        """Rewrites a pages.create/pages.update properties payload written against the default schema"""
+        if self._identity:
+            return properties
+        translated = {}
+        for default_name, value in properties.items():
+            if default_name not in self._mapping:
+                translated[default_name] = value
+                continue
+            name, default_type, property_type = self._mapping[default_name]
+            translated[name] = {
+                (property_type if key == default_type else key): item for key, item in value.items()
+            }
+        return translated
+
+def load_shards() -> List[TaskShard]:
+    """Builds the configured task databases
+
+    Returns:
+        One TaskShard per entry in NOTION_CONFIG["databases"], or a single
+        shard for NOTION_CONFIG["database_id"] when none are listed
+    """
+    databases = NOTION_CONFIG["databases"]
+    if not databases:
+        return [TaskShard("default", NOTION_CONFIG["database_id"])]
+    names = [database["name"] for database in databases]
+    if len(set(names)) != len(names):
+        raise ValueError("Database names in NOTION_DATABASES must be unique")
+    return [
+        TaskShard(database["name"], database["database_id"], database.get("properties"), database.get("types"))
+        for database in databases
+    ]
+
+def mirror_path(shard: TaskShard, shard_count: int) -> str:
+    """Mirror file for a shard; a single database keeps MIRROR_CONFIG["path"]"""
+    if shard_count == 1:
+        return MIRROR_CONFIG["path"]
+    root, ext = os.path.splitext(MIRROR_CONFIG["path"])
+    return f"{root}.{shard.name}{ext}"
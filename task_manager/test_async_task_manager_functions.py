@@ -0,0 +1,104 @@
+import asyncio
+import os
+from types import SimpleNamespace
+import pytest
+
+# Keep the tests off the on-disk mirror and journal
+os.environ.setdefault("TASK_MIRROR_ENABLED", "false")
+os.environ.setdefault("TASK_WRITE_BEHIND", "false")
+
+from task_manager import task_manager_functions as functions
+from task_manager import async_task_manager_functions as async_functions
+from task_manager.task_record import Task
+
+TOOLS = [
+    "create_task", "create_tasks", "update_task_status", "update_task_priority", "update_task_due_date", "update_task",
+    "get_tasks_by_status", "get_tasks_by_priority", "get_tasks_by_date", "get_overdue_tasks", "get_upcoming_tasks",
+    "send_reminders", "get_task_details", "generate_daily_report"
+]
+
+def _page(page_id, payload):
+    return {"id": page_id, "parent": payload.get("parent", {}), "properties": payload["properties"]}
+
+@pytest.fixture
+def notion(monkeypatch):
+    calls = []
+
+    async def create(**payload):
+        calls.append(("create", payload))
+        return _page(f"page-{len(calls)}", payload)
+
+    async def update(page_id, properties):
+        calls.append(("update", page_id, properties))
+        return _page(page_id, {"properties": properties})
+
+    monkeypatch.setattr(async_functions.async_notion, "pages", SimpleNamespace(create=create, update=update), raising=False)
+    monkeypatch.setattr(functions.user_directory, "get_user_id", {"ann@x.com": "u1"}.get)
+    return calls
+
+def test_tool_sets_match():
+    for name in TOOLS:
+        assert hasattr(functions, name) and hasattr(async_functions, name), name
+
+def test_create_task_writes_through(notion):
+    result = asyncio.run(async_functions.create_task("Write report", "Q3", "ann@x.com", "2026-11-02"))
+    assert result["status"] == "success" and not result["queued"]
+    assert functions.page_cache.get(result["task_id"]).title == "Write report"
+
+def test_create_task_rejects_unknown_assignee(notion):
+    result = asyncio.run(async_functions.create_task("Write report", "Q3", "nobody@x.com", "2026-11-02"))
+    assert result["message"] == "Unknown assignee: nobody@x.com"
+    assert notion == []
+
+def test_update_task_writes_through(notion):
+    result = asyncio.run(async_functions.update_task("page-9", status="Completed", priority="High"))
+    assert result["updated_fields"] == {"status": "Completed", "priority": "High"}
+    assert notion == [("update", "page-9", {"Status": {"select": {"name": "Completed"}}, "Priority": {"select": {"name": "High"}}})]
+    assert functions.page_cache.get("page-9").status == "Completed"
+
+def test_update_task_validates(notion):
+    assert asyncio.run(async_functions.update_task("page-9"))["message"] == "No fields to update"
+    assert asyncio.run(async_functions.update_task("page-9", due_date="tomorrow"))["status"] == "error"
+    assert notion == []
+
+class FakeMirror:
+    max_staleness_seconds = 60
+
+    def __init__(self, *tasks, staleness=0.0):
+        self.tasks = {task.id: task for task in tasks}
+        self._staleness = staleness
+        self.syncs = 0
+
+    def staleness(self):
+        return self._staleness
+
+    def ensure_fresh(self):
+        self.syncs += 1
+        self._staleness = 0.0
+
+    def get_task(self, task_id):
+        return self.tasks.get(task_id)
+
+    def tasks_by_status(self, status):
+        return [task for task in self.tasks.values() if task.status == status]
+
+def test_reads_are_served_from_a_fresh_mirror(notion, monkeypatch):
+    mirror = FakeMirror(Task("page-m1", title="Mirrored", status="Blocked", last_edited_time="2026-10-17T09:00:00.000Z"))
+    monkeypatch.setattr(functions.task_shards[0], "mirror", mirror)
+    result = asyncio.run(async_functions.get_tasks_by_status("Blocked"))
+    assert [task["title"] for task in result["tasks"]] == ["Mirrored"]
+    details = asyncio.run(async_functions.get_task_details("page-m1"))
+    assert details["task"]["title"] == "Mirrored"
+    assert mirror.syncs == 0
+
+def test_a_stale_mirror_is_synced_before_reading(notion, monkeypatch):
+    mirror = FakeMirror(Task("page-m2", status="Blocked"), staleness=600.0)
+    monkeypatch.setattr(functions.task_shards[0], "mirror", mirror)
+    result = asyncio.run(async_functions.get_tasks_by_status("Blocked"))
+    assert result["count"] == 1 and mirror.syncs == 1
+
+def test_cached_assignee_is_resolved_without_a_thread(notion, monkeypatch):
+    monkeypatch.setattr(functions.user_directory, "cached_user_id", {"ann@x.com": "u1"}.get)
+    monkeypatch.setattr(async_functions.asyncio, "to_thread", None)
+    result = asyncio.run(async_functions.create_task("Write report", "Q3", "ann@x.com", "2026-11-02"))
+    assert result["status"] == "success"
@@ -0,0 +1,51 @@
+from datetime import date
+from task_manager.config import TaskStatus
+from task_manager.due_index import DueDateIndex
+from task_manager.task_record import Task
+
+TODAY = date(2026, 10, 17)
+
+def _ids(tasks):
+    return [task.id for task in tasks]
+
+def _index():
+    index = DueDateIndex()
+    index.load([
+        Task("late", due_date="2026-10-10", status=TaskStatus.IN_PROGRESS),
+        Task("yesterday", due_date="2026-10-16T12:00:00.000Z"),
+        Task("today", due_date="2026-10-17"),
+        Task("soon", due_date="2026-10-20"),
+        Task("later", due_date="2026-11-30"),
+        Task("done", due_date="2026-10-01", status=TaskStatus.COMPLETED),
+        Task("undated")
+    ])
+    return index
+
+def test_completed_and_undated_tasks_are_left_out():
+    index = _index()
+    assert len(index) == 5
+    assert index.get("done") is None and index.get("undated") is None
+
+def test_overdue_is_most_overdue_first():
+    overdue = _index().overdue(TODAY)
+    assert [(task.id, days) for task, days in overdue] == [("late", 7), ("yesterday", 1)]
+
+def test_due_on_and_due_within():
+    index = _index()
+    assert _ids(index.due_on(TODAY)) == ["today"]
+    assert _ids(index.due_within(TODAY, 3)) == ["today", "soon"]
+    assert _ids(index.due_within(TODAY, 0)) == ["today"]
+
+def test_upsert_moves_and_drops_tasks():
+    index = _index()
+    index.upsert(Task("soon", due_date="2026-10-12"))
+    assert [task.id for task, _ in index.overdue(TODAY)] == ["late", "soon", "yesterday"]
+    index.upsert(Task("late", due_date="2026-10-10", status=TaskStatus.COMPLETED))
+    index.remove("yesterday")
+    assert [task.id for task, _ in index.overdue(TODAY)] == ["soon"]
+    assert len(index) == 3
+
+def test_load_replaces_contents():
+    index = _index()
+    index.load([Task("only", due_date="2026-10-18")])
+    assert len(index) == 1 and _ids(index.due_within(TODAY, 7)) == ["only"]
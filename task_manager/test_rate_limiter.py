@@ -0,0 +1,76 @@
+import asyncio
+from email.utils import formatdate
+from types import SimpleNamespace
+import time
+import httpx
+import pytest
+from task_manager import rate_limiter
+from task_manager.rate_limiter import NotionRateLimiter, RateLimitedTransport, parse_retry_after
+
+def _response(status_code, retry_after=None):
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    return SimpleNamespace(status_code=status_code, headers=headers)
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr(rate_limiter.time, "sleep", slept.append)
+    return slept
+
+def test_parse_retry_after():
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("-1") == 0.0
+    assert 50 < parse_retry_after(formatdate(time.time() + 60, usegmt=True)) <= 60
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+def test_burst_then_steady_rate(sleeps):
+    limiter = NotionRateLimiter(rate=10, burst=2)
+    for _ in range(4):
+        limiter.acquire()
+    assert len(sleeps) == 2
+    assert sleeps[0] == pytest.approx(0.1, abs=0.02) and sleeps[1] == pytest.approx(0.2, abs=0.02)
+    stats = limiter.metrics()
+    assert (stats["requests"], stats["max_queue_depth"], stats["queue_depth"]) == (4, 1, 0)
+
+def test_429_retries_after_the_header(sleeps):
+    responses = [_response(429, "1"), _response(503), _response(200)]
+    discarded = []
+    limiter = NotionRateLimiter(rate=1000, burst=10)
+    result = limiter.call(lambda: responses.pop(0), discard=discarded.append)
+    assert result.status_code == 200 and len(discarded) == 2
+    assert sleeps[0] == 1.0
+    stats = limiter.metrics()
+    assert (stats["throttled"], stats["retries"]) == (1, 2)
+    assert 0 < stats["paused_for"] <= 1
+
+def test_gives_up_after_max_retries(sleeps):
+    limiter = NotionRateLimiter(rate=1000, burst=10, max_retries=2, base_delay=0.01)
+    sent = []
+    result = limiter.call(lambda: sent.append(1) or _response(500))
+    assert result.status_code == 500 and len(sent) == 3
+
+def test_client_errors_are_not_retried(sleeps):
+    limiter = NotionRateLimiter()
+    assert limiter.call(lambda: _response(400)).status_code == 400
+    assert limiter.metrics()["retries"] == 0
+
+def test_async_call_retries(monkeypatch):
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", no_sleep)
+    responses = [_response(502), _response(200)]
+
+    async def send():
+        return responses.pop(0)
+
+    limiter = NotionRateLimiter(rate=1000, burst=10, base_delay=0.01)
+    assert asyncio.run(limiter.acall(send)).status_code == 200
+
+def test_transport_retries_through_httpx(sleeps):
+    statuses = [429, 200]
+    transport = httpx.MockTransport(lambda request: httpx.Response(statuses.pop(0), headers={"Retry-After": "0"}))
+    with httpx.Client(transport=RateLimitedTransport(NotionRateLimiter(rate=1000, burst=10), transport)) as client:
+        assert client.get("https://api.notion.com/v1/pages").status_code == 200
+    assert statuses == []
@@ -0,0 +1,107 @@
+import os
+from types import SimpleNamespace
+import pytest
+
+# Keep the tests off the on-disk mirror and journal
+os.environ.setdefault("TASK_MIRROR_ENABLED", "false")
+os.environ.setdefault("TASK_WRITE_BEHIND", "false")
+
+from task_manager import task_manager_functions as functions
+from task_manager.task_record import Task
+from task_manager.task_shards import TaskShard
+
+USERS = {"ann@x.com": "u1"}
+
+@pytest.fixture
+def notion(monkeypatch):
+    calls = []
+
+    def create(**payload):
+        calls.append(("create", payload))
+        return {"id": f"page-{len(calls)}", "parent": payload["parent"], "properties": payload["properties"]}
+
+    def update(page_id, properties):
+        calls.append(("update", page_id, properties))
+        return {"id": page_id, "parent": {}, "properties": properties}
+
+    monkeypatch.setattr(functions.notion, "pages", SimpleNamespace(create=create, update=update), raising=False)
+    monkeypatch.setattr(functions.user_directory, "get_user_id", USERS.get)
+    return calls
+
+def test_create_task_assigns_known_user(notion):
+    result = functions.create_task("Write report", "Q3 numbers", "ann@x.com", "2026-11-02", "High")
+    assert result["status"] == "success"
+    assert notion[0][1]["properties"]["Assignee"] == {"people": [{"id": "u1"}]}
+
+def test_create_task_rejects_unknown_assignee(notion):
+    result = functions.create_task("Write report", "Q3 numbers", "nobody@x.com", "2026-11-02")
+    assert result["status"] == "error"
+    assert result["message"] == "Unknown assignee: nobody@x.com"
+    assert notion == []
+
+def test_create_tasks_rejects_unknown_assignee(notion):
+    result = functions.create_tasks([
+        {"title": "a", "due_date": "2026-11-02", "assignee": "ann@x.com"},
+        {"title": "b", "due_date": "2026-11-02", "assignee": "nobody@x.com"}
+    ])
+    assert [item["status"] for item in result["results"]] == ["success", "error"]
+    assert result["results"][1]["message"] == "Unknown assignee: nobody@x.com"
+
+def test_get_task_details_serves_cache_without_internal_stats(notion):
+    created = functions.create_task("Write report", "Q3 numbers", "ann@x.com", "2026-11-02")
+    result = functions.get_task_details(created["task_id"])
+    assert result["cached"] and result["task"]["title"] == "Write report"
+    assert "cache_stats" not in result
+
+def test_update_task_sends_one_write(notion):
+    result = functions.update_task("page-7", status="Completed", due_date="2026-11-03")
+    assert result["status"] == "success" and not result["queued"]
+    assert notion == [("update", "page-7", {"Status": {"select": {"name": "Completed"}}, "Due Date": {"date": {"start": "2026-11-03"}}})]
+    assert functions.page_cache.get("page-7").status == "Completed"
+
+class FakeMirror:
+    def __init__(self, *tasks):
+        self.tasks = {task.id: task for task in tasks}
+        self.syncs = 0
+
+    def ensure_fresh(self):
+        self.syncs += 1
+
+    def get_task(self, task_id):
+        return self.tasks.get(task_id)
+
+def test_get_task_details_prefers_a_newer_mirror_row(notion, monkeypatch):
+    functions.page_cache.put(Task("page-5", title="Old title", last_edited_time="2026-10-17T09:00:00.000Z"))
+    mirror = FakeMirror(Task("page-5", title="Edited in Notion", last_edited_time="2026-10-17T09:03:00.000Z"))
+    monkeypatch.setattr(functions.task_shards[0], "mirror", mirror)
+    result = functions.get_task_details("page-5")
+    assert result["task"]["title"] == "Edited in Notion" and not result["cached"]
+    assert functions.page_cache.get("page-5").title == "Edited in Notion"
+
+def test_get_task_details_keeps_a_newer_cached_copy(notion, monkeypatch):
+    functions.page_cache.put(Task("page-6", title="Just written", last_edited_time="2026-10-17T09:05:00.000Z"))
+    monkeypatch.setattr(functions.task_shards[0], "mirror", FakeMirror(Task("page-6", title="Synced earlier", last_edited_time="2026-10-17T09:00:00.000Z")))
+    result = functions.get_task_details("page-6")
+    assert result["task"]["title"] == "Just written" and result["cached"]
+
+@pytest.fixture
+def two_shards(monkeypatch):
+    shards = [TaskShard("eng", "db-eng"), TaskShard("ops", "db-ops")]
+    shards[0].mirror = FakeMirror()
+    shards[1].mirror = FakeMirror(Task("page-8", title="Ops task", last_edited_time="2026-10-17T09:00:00.000Z"))
+    monkeypatch.setattr(functions, "task_shards", shards)
+    return shards
+
+def test_get_task_details_syncs_only_the_owning_shard(notion, two_shards):
+    result = functions.get_task_details("page-8")
+    assert result["task"]["title"] == "Ops task"
+    assert [shard.mirror.syncs for shard in two_shards] == [0, 1]
+
+def test_get_task_details_retrieves_a_page_from_an_unknown_shard(notion, two_shards, monkeypatch):
+    def retrieve(page_id):
+        return {"id": page_id, "parent": {"database_id": "db-eng"}, "properties": {"Title": {"title": [{"plain_text": "Eng task"}]}}}
+
+    monkeypatch.setattr(functions.notion, "pages", SimpleNamespace(retrieve=retrieve), raising=False)
+    result = functions.get_task_details("page-eng-1")
+    assert result["task"]["title"] == "Eng task"
+    assert [shard.mirror.syncs for shard in two_shards] == [0, 0]
@@ -0,0 +1,58 @@
+import threading
+import time
+from types import SimpleNamespace
+from task_manager.user_directory import UserDirectory
+
+USERS = [{"id": f"u{n}", "person": {"email": f"user{n}@x.com"}} for n in range(10)]
+
+class FakeUsers:
+    def __init__(self, users):
+        self.users = users
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def list(self, **kwargs):
+        with self._lock:
+            self.calls += 1
+        time.sleep(0.05)
+        return {"results": list(self.users), "has_more": False, "next_cursor": None}
+
+def _directory(users=USERS, **kwargs):
+    fake = FakeUsers(users)
+    return UserDirectory(SimpleNamespace(users=fake), **kwargs), fake
+
+def test_concurrent_cold_lookups_list_users_once():
+    directory, fake = _directory()
+    found = {}
+
+    def lookup(email):
+        found[email] = directory.get_user_id(email)
+
+    threads = [threading.Thread(target=lookup, args=(user["person"]["email"],)) for user in USERS]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert fake.calls == 1
+    assert found == {user["person"]["email"]: user["id"] for user in USERS}
+
+def test_cold_miss_lists_users_once():
+    directory, fake = _directory()
+    assert directory.get_user_id("nobody@x.com") is None
+    assert fake.calls == 1
+
+def test_miss_reloads_a_warm_index_then_caches_the_miss():
+    directory, fake = _directory()
+    directory.get_user_id("user1@x.com")
+    fake.users = USERS + [{"id": "new", "person": {"email": "new@x.com"}}]
+    assert directory.get_user_id("NEW@x.com ") == "new"
+    assert directory.get_user_id("nobody@x.com") is None
+    assert directory.get_user_id("nobody@x.com") is None
+    assert fake.calls == 3
+
+def test_stale_index_is_reloaded():
+    directory, fake = _directory(ttl_seconds=0)
+    directory.get_user_id("user1@x.com")
+    time.sleep(0.01)
+    assert directory.get_user("u2")["id"] == "u2"
+    assert fake.calls == 2
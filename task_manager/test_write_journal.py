@@ -0,0 +1,111 @@
+import json
+import time
+from types import SimpleNamespace
+from task_manager.write_journal import WriteJournal, PENDING_PREFIX
+
+def _page(title):
+    return {"parent": {"database_id": "db"}, "properties": {"Name": {"title": [{"text": {"content": title}}]}}}
+
+class FakeNotion:
+    def __init__(self):
+        self.created = []
+        self.updated = []
+        self.queries = []
+        self.pages = SimpleNamespace(create=self._create, update=self._update)
+        self.databases = SimpleNamespace(query=self._query)
+
+    def _create(self, **payload):
+        self.created.append(payload)
+        return {"id": f"page-{len(self.created)}"}
+
+    def _update(self, page_id, properties):
+        self.updated.append((page_id, properties))
+        return {"id": page_id}
+
+    def _query(self, **kwargs):
+        self.queries.append(kwargs)
+        return {"results": []}
+
+def _lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+def test_replays_in_order_and_resolves_pending_ids(tmp_path):
+    notion = FakeNotion()
+    journal = WriteJournal(notion, str(tmp_path / "journal.jsonl"), "db", retry_seconds=0)
+    key = journal.append("create", _page("Write report"))
+    journal.append("update", {"page_id": PENDING_PREFIX + key, "properties": {"Status": {"status": {"name": "Done"}}}})
+    assert journal.wait_until_flushed(5)
+    assert journal.resolve(PENDING_PREFIX + key) == "page-1"
+    assert notion.updated == [("page-1", {"Status": {"status": {"name": "Done"}}})]
+
+def test_restart_replays_unacknowledged_mutations(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"type": "mutation", "key": "a", "op": "create", "payload": _page("Done already")}) + "\n")
+        f.write(json.dumps({"type": "ack", "key": "a", "result_id": "page-a"}) + "\n")
+        f.write(json.dumps({"type": "mutation", "key": "b", "op": "create", "payload": _page("Interrupted")}) + "\n")
+        f.write(json.dumps({"type": "attempt", "key": "b", "at": "2026-01-01T00:00:00+00:00"}) + "\n")
+        f.write('{"type": "mutation", "key": "c"')
+    notion = FakeNotion()
+    journal = WriteJournal(notion, str(path), "db", retry_seconds=0)
+    assert journal.pending_count() == 1
+    assert journal.resolve(PENDING_PREFIX + "a") == "page-a"
+
+    journal.start()
+    assert journal.wait_until_flushed(5)
+    # The attempted create was looked up before being sent again
+    assert notion.queries[0]["filter"]["and"][0]["title"] == {"equals": "Interrupted"}
+    assert [page["properties"]["Name"]["title"][0]["text"]["content"] for page in notion.created] == ["Interrupted"]
+
+def test_empty_title_does_not_block_the_queue(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"type": "mutation", "key": "a", "op": "create", "payload": _page("")}) + "\n")
+        f.write(json.dumps({"type": "attempt", "key": "a", "at": "2026-01-01T00:00:00+00:00"}) + "\n")
+    notion = FakeNotion()
+    journal = WriteJournal(notion, str(path), "db", retry_seconds=0)
+    journal.start()
+    assert journal.wait_until_flushed(5)
+    assert len(notion.created) == 1 and not notion.queries
+
+def test_malformed_entry_fails_permanently(tmp_path):
+    notion = FakeNotion()
+    journal = WriteJournal(notion, str(tmp_path / "journal.jsonl"), "db", retry_seconds=0)
+    bad = journal.append("update", {"properties": {}})
+    journal.append("create", _page("After the bad entry"))
+    assert journal.wait_until_flushed(5)
+    assert bad in journal.failures()
+    assert len(notion.created) == 1
+
+def test_compaction_prunes_old_mappings(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    notion = FakeNotion()
+    journal = WriteJournal(notion, str(path), "db", retry_seconds=0, compact_bytes=0, resolved_ttl_seconds=3600)
+    key = journal.append("create", _page("Recent"))
+    assert journal.wait_until_flushed(5)
+    assert [record["type"] for record in _lines(path)] == ["ack"]
+    assert journal.resolve(PENDING_PREFIX + key) == "page-1"
+
+    journal.resolved_ttl_seconds = 0
+    journal.append("create", _page("Next"))
+    assert journal.wait_until_flushed(5)
+    assert _lines(path) == []
+    assert journal.resolve(PENDING_PREFIX + key) == PENDING_PREFIX + key
+
+def test_failing_callback_does_not_stop_the_flusher(tmp_path):
+    notion = FakeNotion()
+    seen = []
+
+    def on_applied(result):
+        seen.append(result["id"])
+        raise RuntimeError("mirror is locked")
+
+    journal = WriteJournal(notion, str(tmp_path / "journal.jsonl"), "db", retry_seconds=0, on_applied=on_applied)
+    journal.append("create", _page("First"))
+    assert journal.wait_until_flushed(5)
+    while not seen:
+        time.sleep(0.01)
+    journal.append("create", _page("Second"))
+    assert journal.wait_until_flushed(5)
+    assert len(notion.created) == 2
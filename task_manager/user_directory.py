@@ -0,0 +1,107 @@
+import threading
+import time
+from typing import Dict, Any, Optional
+from task_manager.notion_pagination import iter_paginated
+
+class UserDirectory:
+    """In-memory index of the Notion workspace users
+
+    All pages of users.list are loaded at once and indexed by email and id.
+    The index is reloaded when it is older than ttl_seconds, or on a lookup
+    miss. Emails that are still missing after a reload are remembered for
+    negative_ttl_seconds so repeated misses don't trigger more reloads.
+    Only one reload runs at a time; lookups that queue behind it use its
+    result instead of listing the users again.
+    """
+
+    def __init__(self, client: Any, ttl_seconds: int = 3600, negative_ttl_seconds: int = 300):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._by_email: Dict[str, Dict[str, Any]] = {}
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._misses: Dict[str, float] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+
+    def _is_stale(self) -> bool:
+        return self._loaded_at is None or time.time() - self._loaded_at > self.ttl_seconds
+
+    def refresh(self) -> None:
+        """Reloads every page of workspace users into the index"""
+        with self._load_lock:
+            self._load()
+
+    def _refresh_unless_loaded_since(self, since: float) -> None:
+        """Helper method to reload the index unless a load finished at or after since"""
+        with self._load_lock:
+            if self._loaded_at is not None and self._loaded_at >= since:
+                return
+            self._load()
+
+    def _load(self) -> None:
+        """Helper method to list every workspace user and swap in the new index; callers hold the load lock"""
+        by_email = {}
+        by_id = {}
+        for user in iter_paginated(self.client.users.list):
+            by_id[user["id"]] = user
+            email = (user.get("person") or {}).get("email")
+            if email:
+                by_email[email.lower()] = user
+        with self._lock:
+            self._by_email = by_email
+            self._by_id = by_id
+            self._misses = {}
+            self._loaded_at = time.time()
+
+    def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        """Looks up a workspace user by email address
+
+        Args:
+            email: Email address of the Notion user
+
+        Returns:
+            Notion user object or None if no user has that email
+        """
+        key = email.strip().lower()
+        started = time.time()
+        if self._is_stale():
+            self._refresh_unless_loaded_since(started - self.ttl_seconds)
+        user = self._by_email.get(key)
+        if user is not None:
+            return user
+
+        missed_at = self._misses.get(key)
+        if missed_at is not None and time.time() - missed_at < self.negative_ttl_seconds:
+            return None
+        # The user may have joined since the last load, unless that load
+        # finished after this lookup started
+        self._refresh_unless_loaded_since(started)
+        user = self._by_email.get(key)
+        if user is None:
+            with self._lock:
+                self._misses[key] = time.time()
+        return user
+
+    def cached_user_id(self, email: str) -> Optional[str]:
+        """Returns the user ID for an email from the loaded index without calling Notion
+
+        Returns None when the index is stale or lacks the email; get_user_id
+        then decides whether a reload is needed.
+        """
+        if self._is_stale():
+            return None
+        user = self._by_email.get(email.strip().lower())
+        return user["id"] if user else None
+
+    def get_user_id(self, email: str) -> Optional[str]:
+        """Returns the Notion user ID for an email address, or None"""
+        user = self.get_user_by_email(email)
+        return user["id"] if user else None
+
+    def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Looks up a workspace user by Notion user ID"""
+        if self._is_stale():
+            self._refresh_unless_loaded_since(time.time() - self.ttl_seconds)
+        return self._by_id.get(user_id)
@@ -0,0 +1,261 @@
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, Callable
+
+# Provisional task IDs handed out for creates that have not reached Notion yet
+PENDING_PREFIX = "pending:"
+
+def _is_permanent_error(error: Exception) -> bool:
+    """Tells rejected requests and malformed journal entries (replaying won't help) from transient failures"""
+    if isinstance(error, (IndexError, KeyError, ValueError, TypeError)):
+        # Raised locally while building the request; the entry would fail the same way forever
+        return True
+    status = getattr(error, "status", None) or getattr(error, "status_code", None)
+    return isinstance(status, int) and 400 <= status < 500 and status != 429
+
+class WriteJournal:
+    """Append-only journal that acknowledges task mutations before Notion does
+
+    Every mutation is appended to a JSON-lines file and fsynced, then
+    replayed to Notion in order by a background flusher. Each mutation
+    carries an idempotency key; the flusher appends an "attempt" record
+    before sending and an "ack" record after Notion accepts it, so a
+    restart replays exactly the mutations that were never acknowledged.
+    Creates that were attempted but not acknowledged are looked up by
+    title and creation time before being sent again. Compaction keeps
+    pending-ID mappings and failures for resolved_ttl_seconds.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        path: str,
+        database_id: str,
+        retry_seconds: float = 5.0,
+        compact_bytes: int = 1 << 20,
+        resolved_ttl_seconds: float = 86400.0,
+        on_applied: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        self.client = client
+        self.path = path
+        self.database_id = database_id
+        self.retry_seconds = retry_seconds
+        self.compact_bytes = compact_bytes
+        self.resolved_ttl_seconds = resolved_ttl_seconds
+        self.on_applied = on_applied
+        self._pending: List[Dict[str, Any]] = []
+        self._attempted: Dict[str, str] = {}
+        self._resolved: Dict[str, str] = {}
+        self._failed: Dict[str, str] = {}
+        # When each resolved mapping or failure was recorded, for pruning at compaction
+        self._finished_at: Dict[str, float] = {}
+        self._cond = threading.Condition()
+        self._file = None
+        self._thread: Optional[threading.Thread] = None
+        self._load()
+
+    def _load(self) -> None:
+        """Rebuilds the pending queue from the journal on disk"""
+        if not os.path.exists(self.path):
+            return
+        mutations = []
+        done = set()
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A torn final line from a crash mid-append; it was never acknowledged
+                    continue
+                if record["type"] == "mutation":
+                    mutations.append(record)
+                elif record["type"] == "attempt":
+                    self._attempted[record["key"]] = record["at"]
+                elif record["type"] == "ack":
+                    done.add(record["key"])
+                    if record.get("result_id"):
+                        self._resolved[PENDING_PREFIX + record["key"]] = record["result_id"]
+                        self._finished_at[record["key"]] = record.get("finished_at", time.time())
+                elif record["type"] == "failed":
+                    done.add(record["key"])
+                    self._failed[record["key"]] = record["message"]
+                    self._finished_at[record["key"]] = record.get("finished_at", time.time())
+        seen = set()
+        for mutation in mutations:
+            if mutation["key"] not in done and mutation["key"] not in seen:
+                seen.add(mutation["key"])
+                self._pending.append(mutation)
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def start(self) -> None:
+        """Starts the background flusher if it is not already running"""
+        with self._cond:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="task-write-journal", daemon=True)
+                self._thread.start()
+
+    def append(self, op: str, payload: Dict[str, Any]) -> str:
+        """Durably records a mutation and returns its idempotency key
+
+        Args:
+            op: "create" (payload is pages.create kwargs) or "update"
+                (payload has page_id and properties)
+            payload: Arguments for the Notion call
+
+        Returns:
+            Idempotency key of the journaled mutation
+        """
+        record = {"type": "mutation", "key": uuid.uuid4().hex, "op": op, "payload": payload}
+        with self._cond:
+            self._write(record)
+            self._pending.append(record)
+            self._cond.notify()
+        self.start()
+        return record["key"]
+
+    def resolve(self, task_id: str) -> str:
+        """Maps a provisional pending:<key> task ID to the real Notion page ID once known"""
+        with self._cond:
+            return self._resolved.get(task_id, task_id)
+
+    def pending_count(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def failures(self) -> Dict[str, str]:
+        """Returns mutations Notion rejected, keyed by idempotency key"""
+        with self._cond:
+            return dict(self._failed)
+
+    def wait_until_flushed(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until the queue is drained; returns False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _find_existing_create(self, record: Dict[str, Any], attempted_at: str) -> Optional[Dict[str, Any]]:
+        """Looks for a page an interrupted create may already have made"""
+        payload = record["payload"]
+        # The title property may be named differently in a team's database
+        title_property, value = next(
+            ((name, value) for name, value in payload["properties"].items() if "title" in value), (None, None)
+        )
+        title = "".join(part.get("text", {}).get("content", "") for part in value["title"]) if value else ""
+        if not title:
+            # Nothing to match on; the create is sent again
+            return None
+        response = self.client.databases.query(
+            database_id=payload.get("parent", {}).get("database_id") or self.database_id,
+            filter={
+                "and": [
+                    {"property": title_property, "title": {"equals": title}},
+                    {"timestamp": "created_time", "created_time": {"on_or_after": attempted_at}}
+                ]
+            },
+            page_size=1
+        )
+        return response["results"][0] if response["results"] else None
+
+    def _apply(self, record: Dict[str, Any], attempted_at: Optional[str]) -> Dict[str, Any]:
+        payload = record["payload"]
+        if record["op"] == "create":
+            # An earlier attempt may have reached Notion before failing or crashing
+            if attempted_at:
+                existing = self._find_existing_create(record, attempted_at)
+                if existing:
+                    return existing
+            return self.client.pages.create(**payload)
+        return self.client.pages.update(
+            page_id=self.resolve(payload["page_id"]),
+            properties=payload["properties"]
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                record = self._pending[0]
+                attempted_at = self._attempted.get(record["key"])
+                if attempted_at is None:
+                    at = datetime.now(timezone.utc).replace(second=0, microsecond=0).isoformat()
+                    self._attempted[record["key"]] = at
+                    self._write({"type": "attempt", "key": record["key"], "at": at})
+
+            try:
+                result = self._apply(record, attempted_at)
+            except Exception as e:
+                if not _is_permanent_error(e):
+                    # Keep order: retry the head of the queue after a pause
+                    time.sleep(self.retry_seconds)
+                    continue
+                with self._cond:
+                    finished_at = time.time()
+                    self._write({"type": "failed", "key": record["key"], "message": str(e), "finished_at": finished_at})
+                    self._failed[record["key"]] = str(e)
+                    self._finished_at[record["key"]] = finished_at
+                    self._pending.pop(0)
+                    self._cond.notify_all()
+                print(f"Error replaying task mutation {record['key']}: {str(e)}")
+                continue
+
+            with self._cond:
+                ack = {"type": "ack", "key": record["key"]}
+                if record["op"] == "create":
+                    ack["result_id"] = result["id"]
+                    ack["finished_at"] = time.time()
+                    self._resolved[PENDING_PREFIX + record["key"]] = result["id"]
+                    self._finished_at[record["key"]] = ack["finished_at"]
+                self._write(ack)
+                self._attempted.pop(record["key"], None)
+                self._pending.pop(0)
+                if not self._pending and self._file.tell() > self.compact_bytes:
+                    self._compact()
+                self._cond.notify_all()
+            if self.on_applied:
+                # The write already landed; a failing callback must not stop the flusher
+                try:
+                    self.on_applied(result)
+                except Exception as e:
+                    print(f"Error handling applied task mutation {record['key']}: {str(e)}")
+
+    def _compact(self) -> None:
+        """Rewrites a drained journal down to the pending-ID mappings and failures it still needs
+
+        Mappings and failures older than resolved_ttl_seconds are dropped
+        from memory as well, so a long-running process does not grow them
+        without bound.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        cutoff = time.time() - self.resolved_ttl_seconds
+        for key in [key for key, finished_at in self._finished_at.items() if finished_at < cutoff]:
+            del self._finished_at[key]
+            self._resolved.pop(PENDING_PREFIX + key, None)
+            self._failed.pop(key, None)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for pending_id, result_id in self._resolved.items():
+                key = pending_id[len(PENDING_PREFIX):]
+                f.write(json.dumps({"type": "ack", "key": key, "result_id": result_id, "finished_at": self._finished_at[key]}) + "\n")
+            for key, message in self._failed.items():
+                f.write(json.dumps({"type": "failed", "key": key, "message": message, "finished_at": self._finished_at[key]}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)